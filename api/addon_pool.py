@@ -0,0 +1,101 @@
+"""Pool of add-ons created in the background, so that the tests needing a fresh add-on
+don't wait for the upload, validation and add-on create requests"""
+
+import queue
+import threading
+
+from api.addon_seeder import KINDS, AddonSeeder
+
+
+class AddonPool:
+    """Creates add-ons for one user from a background thread and keeps them ready to be
+    leased. The pool only creates the add-ons it was told will be needed (see reserve),
+    with at most <size> of each kind waiting at any time; the ones left unused are
+    deleted when the pool is closed."""
+
+    def __init__(self, client, size):
+        self.seeder = AddonSeeder(client)
+        self.size = size
+        self._ready = {kind: queue.Queue() for kind in KINDS}
+        # kind -> number of add-ons that are still going to be leased
+        self._wanted = {kind: 0 for kind in KINDS}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def reserve(self, kind, count):
+        """Lets the pool know that <count> more add-ons of this kind will be leased"""
+        with self._lock:
+            self._wanted[kind] += count
+        self._wakeup.set()
+
+    def lease(self, kind):
+        """Returns a ready add-on of the requested kind, or None if none is ready yet;
+        the add-on is no longer tracked by the pool, so the caller has to delete it"""
+        with self._lock:
+            self._wanted[kind] = max(self._wanted[kind] - 1, 0)
+        self._wakeup.set()
+        try:
+            return self._ready[kind].get_nowait()
+        except queue.Empty:
+            return None
+
+    def close(self):
+        """Stops creating add-ons and deletes the ones that were not leased"""
+        self._stopped = True
+        self._wakeup.set()
+        self._thread.join()
+        for ready in self._ready.values():
+            while not ready.empty():
+                slug = ready.get_nowait()['slug']
+                try:
+                    self.seeder.delete(slug)
+                except Exception as error:
+                    print(f'Could not delete the pooled add-on {slug}: {error}')
+
+    def _missing(self, kind):
+        with self._lock:
+            return min(self._wanted[kind], self.size) - self._ready[kind].qsize()
+
+    def _run(self):
+        while not self._stopped:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            for kind in KINDS:
+                while not self._stopped and self._missing(kind) > 0:
+                    try:
+                        addon = self.seeder.create(kind)
+                    except Exception as error:
+                        # tests will create their add-ons themselves
+                        print(f'Could not create a {kind} add-on for the pool: {error}')
+                        break
+                    self.seeder.created.remove(addon['slug'])
+                    self._ready[kind].put(addon)
+
+
+class AddonPoolManager:
+    """One AddonPool per user of the test run, created on the first lease of that user.
+    <demand> holds the number of add-ons each test user will lease, by kind, e.g.
+    {'submissions_user': {'listed': 3}}; pools are never larger than <size>."""
+
+    def __init__(self, client_factory, size, demand):
+        self.client_factory = client_factory
+        self.size = size
+        self.demand = demand
+        self._pools = {}
+        self._lock = threading.Lock()
+
+    def pool(self, user, sessionid):
+        with self._lock:
+            if user not in self._pools:
+                pool = AddonPool(self.client_factory(sessionid), self.size)
+                for kind, count in self.demand.get(user, {}).items():
+                    pool.reserve(kind, count)
+                self._pools[user] = pool
+            return self._pools[user]
+
+    def close(self):
+        for pool in self._pools.values():
+            pool.close()
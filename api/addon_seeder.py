@@ -0,0 +1,125 @@
+"""Creates and deletes add-ons through the v5 API, to be used as test data by the tests
+that only need an add-on to exist and don't cover the submission flow itself"""
+
+import json
+
+from api import api_helpers
+from scripts import reusables
+
+_upload = '/api/v5/addons/upload/'
+_addon_create = '/api/v5/addons/addon/'
+
+# the details needed to create each kind of add-on
+KINDS = {
+    'listed': {
+        'channel': 'listed',
+        'manifest': {},
+        'details': {
+            'categories': ['other'],
+            'version': {'license': 'all-rights-reserved'},
+        },
+    },
+    'unlisted': {
+        'channel': 'unlisted',
+        'manifest': {},
+        'details': {},
+    },
+    'theme': {
+        'channel': 'listed',
+        'manifest': {
+            'theme': {'colors': {'frame': '#083af0', 'tab_background_text': '#ffffff'}}
+        },
+        'details': {
+            'categories': ['other'],
+            'version': {'license': 'cc-all-rights-reserved'},
+        },
+    },
+}
+
+
+class AddonSeeder:
+    """Creates add-ons for the user authenticated by the <client> (an api_client.ApiClient)
+    and deletes them afterwards; the slugs are random, so parallel tests never clash.
+    With a <pool> (an addon_pool.AddonPool of the same user), lease takes the add-ons
+    that were already created in the background."""
+
+    def __init__(self, client, pool=None):
+        self.client = client
+        self.pool = pool
+        self.created = []
+
+    def upload(self, manifest, channel):
+        """Uploads an add-on built from the manifest and returns the processed upload uuid"""
+        upload = self.client.post(
+            _upload,
+            files={'upload': ('seeded-addon.zip', api_helpers.make_addon(manifest))},
+            data={'channel': channel},
+        )
+        assert (
+            upload.status_code == 201
+        ), f'Upload failed: {upload.status_code}, {upload.text}'
+        uuid = upload.json()['uuid']
+        processed = api_helpers.wait_for_upload_processing(self.client, uuid)
+        validation = processed['validation']
+        assert processed['valid'], f'Upload {uuid} was not valid: {validation}'
+        return uuid
+
+    def create(self, kind='listed', name=None, **details):
+        """Creates a 'listed' or 'unlisted' extension or a 'theme' and returns the add-on
+        details from the API response; <details> are added to the create request"""
+        name = name or f'Seeded {kind} {reusables.get_random_string(10)}'
+        manifest = {
+            **KINDS[kind]['manifest'],
+            'manifest_version': 2,
+            'version': '1.0',
+            'name': name,
+            'description': f'Summary of {name}',
+        }
+        uuid = self.upload(manifest, KINDS[kind]['channel'])
+        payload = {
+            'slug': f'seeded-{kind}-{reusables.get_random_string(10)}',
+            **KINDS[kind]['details'],
+            **details,
+        }
+        payload['version'] = {**payload.get('version', {}), 'upload': uuid}
+        response = self.client.post(
+            _addon_create,
+            headers={'Content-Type': 'application/json'},
+            data=json.dumps(payload),
+        )
+        assert (
+            response.status_code == 201
+        ), f'Add-on create failed: {response.status_code}, {response.text}'
+        addon = response.json()
+        self.created.append(addon['slug'])
+        return addon
+
+    def lease(self, kind='listed'):
+        """Returns an add-on of the requested kind, taken from the pool if one is ready
+        and created on the spot otherwise; it is deleted by cleanup either way"""
+        addon = self.pool.lease(kind) if self.pool else None
+        if addon is None:
+            return self.create(kind)
+        self.created.append(addon['slug'])
+        return addon
+
+    def delete(self, addon):
+        """Deletes an add-on by its id, slug or guid"""
+        token = self.client.get(f'{_addon_create}{addon}/delete_confirm/')
+        assert (
+            token.status_code == 200
+        ), f'Delete token request failed: {token.status_code}, {token.text}'
+        response = self.client.delete(
+            f'{_addon_create}{addon}/',
+            params={'delete_confirm': token.json()['delete_confirm']},
+        )
+        assert (
+            response.status_code == 204
+        ), f'Add-on delete failed: {response.status_code}, {response.text}'
+
+    def cleanup(self):
+        """Deletes all the add-ons created by the seeder that still exist"""
+        while self.created:
+            addon = self.created.pop()
+            if self.client.get(f'{_addon_create}{addon}/').status_code != 404:
+                self.delete(addon)
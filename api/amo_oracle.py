@@ -0,0 +1,60 @@
+"""Expected values for the frontend tests, read from the public AMO API instead of from
+other pages of the site or from the variables files. Every API response is cached for the
+rest of the run (per xdist worker), so the tests checking the same add-on share a single
+request."""
+
+import threading
+
+# language of the translated fields (name, summary...) read from the API responses
+DEFAULT_LANG = 'en-US'
+
+
+class AmoOracle:
+    """Reads add-on, version and rating data through an ApiClient; the add-on can be
+    passed by slug, guid or id, like in the API endpoints"""
+
+    def __init__(self, client, lang=DEFAULT_LANG):
+        self.client = client
+        self.lang = lang
+        self._responses = {}
+        self._lock = threading.Lock()
+
+    def _get(self, endpoint, **params):
+        key = (endpoint, tuple(sorted(params.items())))
+        with self._lock:
+            if key not in self._responses:
+                response = self.client.get(
+                    endpoint, params={'lang': self.lang, **params}
+                )
+                assert (
+                    response.status_code == 200
+                ), f'Could not read {endpoint}: {response.status_code} {response.text[:200]}'
+                self._responses[key] = response.json()
+            return self._responses[key]
+
+    def addon(self, addon):
+        return self._get(f'/api/v5/addons/addon/{addon}/')
+
+    def addon_name(self, addon):
+        # translated fields are returned as {locale: value} objects, even with 'lang'
+        return self.addon(addon)['name'][self.lang]
+
+    def current_version(self, addon):
+        return self.addon(addon)['current_version']
+
+    def versions(self, addon):
+        """The first page of the listed versions, newest first, with the total 'count'"""
+        return self._get(f'/api/v5/addons/addon/{addon}/versions/', page_size=50)
+
+    def version_count(self, addon):
+        return self.versions(addon)['count']
+
+    def grouped_ratings(self, addon):
+        """The number of ratings of the add-on for each score, as {score: count}, from 5 to 1"""
+        grouped = self._get(
+            '/api/v5/ratings/rating/',
+            addon=addon,
+            show_grouped_ratings='true',
+            page_size=1,
+        )['grouped_ratings']
+        return {score: grouped[str(score)] for score in range(5, 0, -1)}
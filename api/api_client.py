@@ -0,0 +1,99 @@
+"""HTTP client shared by the API tests; it keeps a pool of open connections to AMO,
+sets the session authentication header and retries throttled or failed requests"""
+
+import requests
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# status codes that are worth retrying: AMO throttling and temporary server errors
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+# AMO rejects throttled requests before processing them, so any request can be sent again
+THROTTLED_STATUS_CODE = 429
+# upper limit for how long we honour a 'Retry-After' header sent with a throttled response
+MAX_RETRY_AFTER = 60
+# default timeout (in seconds) for requests that don't specify their own
+DEFAULT_TIMEOUT = 30
+
+
+class _CappedRetry(Retry):
+    """Retry policy that respects the 'Retry-After' header sent by AMO when a request is
+    throttled, but never waits longer than MAX_RETRY_AFTER before trying again. Throttled
+    requests are retried whatever their method; server errors and connection failures are
+    only retried for idempotent methods, since a POST or PATCH that failed with a 502 may
+    still have created the add-on or version on the server."""
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if (
+            status_code == THROTTLED_STATUS_CODE
+            and status_code in self.status_forcelist
+        ):
+            return True
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        if retry_after is None:
+            return None
+        return min(retry_after, MAX_RETRY_AFTER)
+
+
+def create_session(retries=3, backoff_factor=1, pool_size=10):
+    """Build a requests.Session with connection pooling and keep-alive enabled, which
+    retries requests that return one of the RETRY_STATUS_CODES with an exponential backoff
+    """
+    retry = _CappedRetry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        # the default idempotent methods; throttled POST/PATCH requests are allowed by is_retry
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+        respect_retry_after_header=True,
+        # return the last response instead of raising, so tests can still assert on it
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class ApiClient:
+    """Thin wrapper over a pooled requests.Session; endpoints are resolved against
+    <base_url> and the 'Authorization: Session' header is added from <auth>, if set.
+    Both can be overridden per request by passing a full url or an 'auth' argument;
+    auth=False sends the request without authentication."""
+
+    def __init__(self, session, base_url, auth=None):
+        self.session = session
+        self.base_url = base_url
+        self.auth = auth
+
+    def headers(self, auth=None):
+        if auth is None:
+            auth = self.auth
+        return {'Authorization': f'Session {auth}'} if auth else {}
+
+    def request(self, method, endpoint, auth=None, **kwargs):
+        url = endpoint if endpoint.startswith('http') else f'{self.base_url}{endpoint}'
+        headers = {**self.headers(auth), **kwargs.pop('headers', {})}
+        kwargs.setdefault('timeout', DEFAULT_TIMEOUT)
+        return self.session.request(method, url, headers=headers, **kwargs)
+
+    def get(self, endpoint, **kwargs):
+        return self.request('GET', endpoint, **kwargs)
+
+    def post(self, endpoint, **kwargs):
+        return self.request('POST', endpoint, **kwargs)
+
+    def put(self, endpoint, **kwargs):
+        return self.request('PUT', endpoint, **kwargs)
+
+    def patch(self, endpoint, **kwargs):
+        return self.request('PATCH', endpoint, **kwargs)
+
+    def delete(self, endpoint, **kwargs):
+        return self.request('DELETE', endpoint, **kwargs)
@@ -1,24 +1,60 @@
 """File holding some reusable methods used in the API addon submission tests"""
 
 import hashlib
+import io
 import json
+import os
+import tempfile
+import time
 import zipfile
 
-import requests
+from pathlib import Path
 
+# size of the chunks read when hashing source files, so large archives are never fully in memory
+HASH_CHUNK_SIZE = 64 * 1024
+# digests of the local files hashed in this process, keyed by (path, mtime, size)
+_file_digests = {}
+# archives built by make_addon in this process, keyed by the hash of their contents
+_addon_archives = {}
 
-def make_addon(manifest_data):
-    """Dynamically create a simple extension with minimal manifest properties"""
-    with open('sample-addons/manifest.json', 'w') as f:
-        # the contents of the manifest will be defined in tests based on the scenario we want to verify
-        json.dump(manifest_data, f)
+
+def make_addon(manifest_data, files=None):
+    """Dynamically create a simple extension with minimal manifest properties and return
+    the zip archive as bytes, which can be passed directly to an upload request;
+    <files> can add other files to the archive, e.g. {'_locales/en/messages.json': '{...}'}.
+    The archives are built in memory and cached, so workers running in parallel don't
+    compete over a shared file and tests re-using a manifest don't zip it again."""
+    # the contents of the manifest will be defined in tests based on the scenario we want to verify
+    manifest = json.dumps(manifest_data, sort_keys=True)
+    contents = {'manifest.json': manifest, **(files or {})}
+    key = hashlib.sha256(json.dumps(contents, sort_keys=True).encode()).hexdigest()
+    if key not in _addon_archives:
         print(f'Manifest content: {manifest_data}')
-    # add the manifest to the addon zip we want to upload - this will always be the 'make-addon.zip' file
-    # if the zip files contains a manifest already, it will be overwritten by the new manifest
-    with zipfile.ZipFile('sample-addons/make-addon.zip', 'w') as zipf:
-        manifest = 'sample-addons/manifest.json'
-        destination = 'manifest.json'
-        zipf.write(manifest, destination)
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, 'w') as zipf:
+            for name, data in contents.items():
+                zipf.writestr(name, data)
+        _addon_archives[key] = archive.getvalue()
+    return _addon_archives[key]
+
+
+def make_addon_file(manifest_data, files=None):
+    """Same as make_addon, but saves the archive in a temporary folder and returns its path,
+    for uploads done through the browser; the file is named after its contents, so it is
+    only written once and never changed while another worker uploads it"""
+    addon = make_addon(manifest_data, files)
+    path = Path(
+        tempfile.gettempdir(),
+        'amo-sample-addons',
+        f'{hashlib.sha256(addon).hexdigest()}.zip',
+    )
+    if not path.exists():
+        path.parent.mkdir(exist_ok=True)
+        # write to a unique name first, so a partially written file is never picked up
+        partial = path.with_suffix(f'.{os.getpid()}.tmp')
+        partial.write_bytes(addon)
+        os.replace(partial, path)
+    return path
 
 
 def verify_addon_response_details(payload, response, request):
@@ -67,37 +103,89 @@ def verify_addon_response_details(payload, response, request):
     return addon_details == response_values
 
 
+def file_digest(path):
+    """Returns the sha256 digest of a local file, read in chunks; digests are cached
+    by path and modification time, so sample files shared by several tests are hashed
+    once"""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _file_digests:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        _file_digests[key] = digest.digest()
+    return _file_digests[key]
+
+
+def response_digest(response):
+    """Returns the sha256 digest of a response body, consuming it in chunks; use it with
+    requests made with 'stream=True' to avoid loading large downloads in memory"""
+    digest = hashlib.sha256()
+    with response:
+        for chunk in response.iter_content(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.digest()
+
+
 def compare_source_files(file_a, file_b, request):
     """Method to compare the hashes of the uploaded and downloaded
     addon source files to make sure they are matching; the comparison differs
     between POST and PATCH requests, so the method is split in two checks"""
     # this is the source file downloaded from AMO used in both request types
-    source_from_api = hashlib.sha256(file_b.content).digest()
-    if request == 'POST':
+    source_from_api = response_digest(file_b)
+    if request.upper() == 'POST':
         # in POST request we compare the local source uploaded with the source from the API
-        local_file = hashlib.sha256(open(file_a, 'rb').read()).digest()
+        local_file = file_digest(file_a)
         assert (
             local_file == source_from_api
         ), f'File contents did not match: local_file_hash = {local_file}, source_from_api_hash = {source_from_api}'
-    if request == 'PATCH':
+    if request.upper() == 'PATCH':
         # in PATCH requests, we are fetching the previous source file attached to the version
         # and compare it to the new attached files to make sure they are different
-        previous_source_from_api = hashlib.sha256(file_a.content).digest()
+        previous_source_from_api = response_digest(file_a)
         assert previous_source_from_api != source_from_api, (
             f'Source files were not updated successfully: previous_source_from_api_hash = {previous_source_from_api}, '
             f'source_from_api_hash = {source_from_api}'
         )
 
 
-def get_addon_version_string(base_url, addon, auth):
+def get_addon_version_string(client, addon, auth=None):
     """Get the version string of an addon's latest version by using
-    the /addons/versions/ API endpoint"""
-    request = requests.get(
-        url=f'{base_url}/api/v5/addons/addon/{addon}/versions/?filter=all_with_unlisted',
-        headers={'Authorization': f'Session {auth}'},
+    the /addons/versions/ API endpoint; <client> is an api_client.ApiClient"""
+    request = client.get(
+        f'/api/v5/addons/addon/{addon}/versions/',
+        auth=auth,
+        params={'filter': 'all_with_unlisted'},
     )
     assert (
         request.status_code == 200
     ), f'Actual response was: status code: {request.status_code}, {request.text}'
     version_string = request.json()['results'][0]['version']
     return version_string
+
+
+def wait_for_upload_processing(
+    client, uuid, auth=None, timeout=120, interval=1, max_interval=10
+):
+    """Poll the upload-detail endpoint until the addons-linter has finished processing
+    an upload and return the upload details, which include the 'valid' flag and the
+    'validation' results; the polling interval grows after each attempt, up to
+    <max_interval>, and the test fails if the upload is not processed within <timeout>.
+    The requests are made with <client> (an api_client.ApiClient), as the user <auth>
+    if set, otherwise as the user of the client"""
+    deadline = time.monotonic() + timeout
+    while True:
+        request = client.get(f'/api/v5/addons/upload/{uuid}/', auth=auth)
+        assert (
+            request.status_code == 200
+        ), f'Actual response was: status code: {request.status_code}, {request.text}'
+        upload = request.json()
+        if upload['processed']:
+            return upload
+        remaining = deadline - time.monotonic()
+        assert (
+            remaining > 0
+        ), f'Upload {uuid} was not processed in {timeout}s; last response was {upload}'
+        time.sleep(min(interval, remaining))
+        interval = min(interval * 1.5, max_interval)
@@ -0,0 +1,158 @@
+"""Tracks submitted versions until they are auto-approved, using the versions API
+instead of reloading the devhub pages"""
+
+import threading
+import time
+
+from concurrent import futures
+
+import requests
+
+# file statuses that won't change anymore without a reviewer action
+FINAL_STATUSES = ('public', 'disabled')
+
+
+class _Watch(futures.Future):
+    """The Future returned by watch(), holding what is watched and until when"""
+
+    def __init__(self, addon, version, auth, status, timeout):
+        super().__init__()
+        self.addon = addon
+        self.version = version
+        self.auth = auth
+        self.status = status
+        self.deadline = time.monotonic() + timeout
+        self.last_seen = None
+
+    def timeout_error(self):
+        return AssertionError(
+            f'Autoapproval took longer than normal; version {self.version or "latest"} of '
+            f'{self.addon} final status was "{self.last_seen}" instead of "{self.status}"'
+        )
+
+
+class ApprovalTracker:
+    """Watches the versions of several add-ons from a background thread. watch() returns
+    right away, so tests can go on with other steps and only wait for the approval at the
+    end; the time limit of a version starts when it is watched. Each add-on is polled with one request to its versions endpoint, whatever the
+    number of watched versions; the interval grows from <interval> to <max_interval>
+    seconds while nothing changes, since auto-approvals usually take a few minutes."""
+
+    def __init__(self, client, interval=5, max_interval=30):
+        self.client = client
+        self.interval = interval
+        self.max_interval = max_interval
+        self._watches = []
+        # (addon, auth) -> (time of the next poll, current interval)
+        self._schedule = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def watch(self, addon, auth, version=None, status='public', timeout=420):
+        """Starts watching a version (its id or version string; the latest one if not set)
+        of an add-on until its file reaches <status>, for at most <timeout> seconds;
+        returns a Future with the version details"""
+        watch = _Watch(addon, version, auth, status, timeout)
+        with self._lock:
+            self._watches.append(watch)
+            self._schedule.setdefault((addon, auth), (time.monotonic(), self.interval))
+        self._wakeup.set()
+        return watch
+
+    def wait(self, watch):
+        """Waits for a watched version and returns its details; fails the test with the
+        last status seen if the version doesn't reach the expected status in time"""
+        try:
+            return watch.result(max(watch.deadline - time.monotonic(), 0))
+        except futures.TimeoutError:
+            raise watch.timeout_error() from None
+
+    def stop(self):
+        self._stopped = True
+        self._wakeup.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stopped:
+            now = time.monotonic()
+            with self._lock:
+                due = [
+                    key
+                    for key, (next_poll, _) in self._schedule.items()
+                    if next_poll <= now
+                ]
+            for key in due:
+                try:
+                    self._poll(*key)
+                except Exception as error:
+                    # e.g. an unexpected response; the tests waiting for the add-on get the error
+                    self._fail(*key, error)
+            with self._lock:
+                next_poll = min(
+                    (poll for poll, _ in self._schedule.values()), default=None
+                )
+            self._wakeup.wait(
+                None if next_poll is None else max(next_poll - time.monotonic(), 0)
+            )
+            self._wakeup.clear()
+
+    def _poll(self, addon, auth):
+        try:
+            response = self.client.get(
+                f'/api/v5/addons/addon/{addon}/versions/',
+                params={'filter': 'all_with_unlisted'},
+                auth=auth,
+            )
+            versions = response.json()['results'] if response.status_code == 200 else []
+        except (requests.RequestException, ValueError):
+            # a failed poll is simply retried later
+            versions = []
+        changed = False
+        with self._lock:
+            for watch in [
+                w for w in self._watches if (w.addon, w.auth) == (addon, auth)
+            ]:
+                details = _find_version(versions, watch.version)
+                if details is not None:
+                    status = details['file']['status']
+                    changed |= status != watch.last_seen
+                    watch.last_seen = status
+                    if status == watch.status:
+                        watch.set_result(details)
+                    elif status in FINAL_STATUSES:
+                        watch.set_exception(
+                            AssertionError(
+                                f'Version {details["version"]} of {addon} ended up "{status}"'
+                            )
+                        )
+                if not watch.done() and time.monotonic() >= watch.deadline:
+                    # nobody may be waiting for it yet; the test gets the error when it does
+                    watch.set_exception(watch.timeout_error())
+            # the finished watches are only kept by the tests holding them
+            self._watches = [w for w in self._watches if not w.done()]
+            if not any((w.addon, w.auth) == (addon, auth) for w in self._watches):
+                del self._schedule[addon, auth]
+                return
+            _, interval = self._schedule[addon, auth]
+            # poll again sooner after a status change, since the next one usually follows quickly
+            interval = (
+                self.interval if changed else min(interval * 1.5, self.max_interval)
+            )
+            self._schedule[addon, auth] = (time.monotonic() + interval, interval)
+
+    def _fail(self, addon, auth, error):
+        with self._lock:
+            for watch in self._watches:
+                if (watch.addon, watch.auth) == (addon, auth):
+                    watch.set_exception(error)
+            self._watches = [w for w in self._watches if not w.done()]
+            self._schedule.pop((addon, auth), None)
+
+
+def _find_version(versions, version):
+    if version is None:
+        return versions[0] if versions else None
+    return next((v for v in versions if version in (v['id'], v['version'])), None)
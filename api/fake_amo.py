@@ -0,0 +1,1666 @@
+"""Local stand-in for the AMO v5 API endpoints exercised by the tests in tests/api.
+It keeps all the data in memory and mimics the status codes and error messages that
+AMO returns for the scenarios covered by the suite, which allows running the API tests
+offline and in seconds (e.g. to check changes to the tests or to the test harness).
+It is a behavioural double, not a full AMO implementation: validation rules, users and
+add-ons only go as far as the API tests need them."""
+
+import io
+import json
+import re
+import threading
+import uuid as uuid_lib
+import zipfile
+
+from email.parser import BytesParser
+from email.policy import HTTP
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from api import responses
+
+SUPPORTED_FILE_TYPES = ('.crx', '.xpi', '.zip')
+SOURCE_FILE_TYPES = ('.zip', '.tar.gz', '.tgz', '.tar.bz2', '.tar', '.7z', '.xz')
+RESERVED_GUID_SUFFIXES = (
+    '@mozilla.com',
+    '@mozilla.org',
+    '@pioneer.mozilla.org',
+    '@search.mozilla.org',
+    '@shield.mozilla.com',
+    '@shield.mozilla.org',
+    '@mozillaonline.com',
+    '@mozillafoundation.org',
+    '@rally.mozilla.org',
+    '@temporary-addon',
+    '@mozac.org',
+)
+LICENSES = {
+    'extension': (
+        'all-rights-reserved',
+        'MPL-2.0',
+        'GPL-2.0-or-later',
+        'GPL-3.0-or-later',
+        'LGPL-2.1-or-later',
+        'LGPL-3.0-or-later',
+        'MIT',
+        'BSD-2-Clause',
+        'ISC',
+        'Apache-2.0',
+    ),
+    'statictheme': (
+        'cc-all-rights-reserved',
+        'CC-BY-3.0',
+        'CC-BY-NC-3.0',
+        'CC-BY-NC-ND-3.0',
+        'CC-BY-NC-SA-3.0',
+        'CC-BY-ND-3.0',
+        'CC-BY-SA-3.0',
+    ),
+}
+# language packs use the same licenses as extensions
+LICENSES['language'] = LICENSES['extension']
+CATEGORIES = {
+    'extension': {
+        'firefox': (
+            'alerts-updates',
+            'appearance',
+            'bookmarks',
+            'download-management',
+            'feeds-news-blogging',
+            'games-entertainment',
+            'language-support',
+            'photos-music-videos',
+            'privacy-security',
+            'search-tools',
+            'shopping',
+            'social-communication',
+            'tabs',
+            'web-development',
+            'other',
+        ),
+        'android': (
+            'device-features-location',
+            'experimental',
+            'feeds-news-blogging',
+            'performance',
+            'photos-media',
+            'security-privacy',
+            'shopping',
+            'social-networking',
+            'user-interface',
+            'other',
+        ),
+    },
+    'statictheme': {
+        'firefox': (
+            'abstract',
+            'causes',
+            'fashion',
+            'film-and-tv',
+            'firefox',
+            'foxkeh',
+            'holiday',
+            'music',
+            'nature',
+            'other',
+            'scenery',
+            'seasonal',
+            'solid',
+            'sports',
+            'websites',
+        ),
+    },
+    'language': {'firefox': ('general',)},
+}
+TYPE_NAMES = {
+    'extension': 'Extension',
+    'statictheme': 'Theme',
+    'language': 'Language Pack',
+}
+TAGS = (
+    'anti malware',
+    'anti tracker',
+    'antivirus',
+    'chat',
+    'container',
+    'content blocker',
+    'coupon',
+    'dailymotion',
+    'dark mode',
+    'dndbeyond',
+    'download',
+    'duckduckgo',
+    'facebook',
+    'google',
+    'image search',
+    'instagram',
+    'mp3',
+    'music',
+    'netflix',
+    'password manager',
+    'pinterest',
+    'privacy',
+    'proxy',
+    'reddit',
+    'screenshot',
+    'search',
+    'security',
+    'shopping',
+    'social media',
+    'speed dial',
+    'spotify',
+    'tab manager',
+    'twitch',
+    'twitter',
+    'vpn',
+    'wikipedia',
+    'youtube',
+)
+# the locales of the translated fields accepted by AMO
+LOCALES = tuple('''
+    af ar ast az bg bn bs ca cak cs cy da de dsb el en-CA en-GB en-US es-AR es-CL
+    es-ES es-MX et eu fa fi fr fur fy-NL ga-IE gd gl gu-IN he hi-IN hr hsb hu hy-AM
+    ia id is it ja ka kab kk km kn ko lt lv mk ml mr ms my nb-NO ne-NP nl nn-NO oc
+    pa-IN pl pt-BR pt-PT rm ro ru si sk skr sl sq sr sv-SE te th tl tr trs uk ur uz
+    vi zh-CN zh-TW
+    '''.split())
+CONTRIBUTION_DOMAINS = (
+    'www.buymeacoffee.com',
+    'donate.mozilla.org',
+    'flattr.com',
+    'github.com',
+    'ko-fi.com',
+    'liberapay.com',
+    'www.micropayment.de',
+    'opencollective.com',
+    'www.patreon.com',
+    'www.paypal.com',
+    'paypal.me',
+)
+CONTRIBUTE_UTM = 'utm_content=product-page-contribute&utm_medium=referral&utm_source=addons.mozilla.org'
+# min versions set by AMO when the compatibility is sent as a list of applications
+DEFAULT_MIN_VERSIONS = {'firefox': '58.0', 'android': '120.0'}
+# the newest Firefox major version considered as released
+MAX_APP_VERSION = 200
+ABUSE_REPORT_CHOICES = {
+    'addon_install_method': (
+        'link',
+        'installtrigger',
+        'drag_and_drop',
+        'amwebapi',
+        'url',
+        'sideload',
+    ),
+    'addon_install_source': (
+        'amo',
+        'about_preferences',
+        'app_profile',
+        'about_addons',
+        'unknown',
+    ),
+    'addon_signature': (
+        'signed',
+        'curated_and_partner',
+        'preliminary',
+        'unsigned',
+        'broken',
+    ),
+}
+ABUSE_REPORT_STRICT_CHOICES = {
+    'reason': (
+        'damage',
+        'spam',
+        'settings',
+        'broken',
+        'policy',
+        'deceptive',
+        'unwanted',
+        'other',
+    ),
+    'report_entry_point': (
+        'amo',
+        'uninstall',
+        'menu',
+        'toolbar_context_menu',
+        'unified_context_menu',
+    ),
+    'location': ('amo', 'addon', 'both'),
+}
+# the permissions the test users have on dev/stage
+USER_PERMISSIONS = {
+    'api_user': {'langpack'},
+    'staff_user': {'langpack', 'trademark', 'reserved_guid', 'mozilla_signed'},
+}
+
+_guid_regex = re.compile(
+    r'^(\{[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\}|[a-z0-9-._]*@[a-z0-9-._]+)$',
+    re.I,
+)
+_uuid_regex = re.compile(r'^[0-9a-f]{8}-?([0-9a-f]{4}-?){3}[0-9a-f]{12}$', re.I)
+_version_regex = re.compile(r'^(0|[1-9]\d{0,8})(\.(0|[1-9]\d{0,8})){0,3}$')
+# language packs are allowed to append their build id to the version number
+_langpack_version_regex = re.compile(r'^\d+(\.\d+){0,3}(buildid\d{8}\.\d{6})?$')
+_url_regex = re.compile(
+    r'^https?://[^\s/?#.]+(\.[^\s/?#.]+)*\.[a-z]{2,}(:\d+)?([/?#]\S*)?$', re.I
+)
+_email_regex = re.compile(r'^[^@\s]+@[^@\s]+\.[a-z]{2,}$', re.I)
+_permission_error = 'You do not have permission to perform this action.'
+_translated_fields = (
+    'name',
+    'summary',
+    'description',
+    'developer_comments',
+    'homepage',
+    'support_email',
+    'support_url',
+)
+
+
+class ApiError(Exception):
+    def __init__(self, status, body):
+        super().__init__(status, body)
+        self.status = status
+        self.body = body
+
+
+def _detail(message, **extra):
+    return {'detail': message, **extra}
+
+
+def _raise_for_errors(errors):
+    if errors:
+        raise ApiError(400, errors)
+
+
+class FakeAmo:
+    """In-memory AMO served from a background thread. Users are created on demand by
+    session_for(<user>), using the names passed to the 'login'/'create_session' markers;
+    seed() adds the accounts and add-ons that the tests expect to find on dev/stage."""
+
+    def __init__(self, host='127.0.0.1', port=0):
+        self.lock = threading.RLock()
+        self.server = ThreadingHTTPServer((host, port), _Handler)
+        self.server.amo = self
+        self.url = f'http://{host}:{self.server.server_address[1]}'
+        self._ids = iter(range(1000, 10**9))
+        self.users = {}
+        self.sessions = {}
+        self.uploads = {}
+        self.addons = {}
+        self.sources = {}
+        self.abuse_reports = []
+
+    def start(self):
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def next_id(self):
+        return next(self._ids)
+
+    def add_user(
+        self, name, user_id=None, display_name=True, restricted=False, agreement=True
+    ):
+        with self.lock:
+            self.users[name] = {
+                'id': user_id or self.next_id(),
+                'name': name if display_name else None,
+                'username': f'anonymous-{uuid_lib.uuid4().hex}',
+                'restricted': restricted,
+                'agreement': agreement,
+                'permissions': USER_PERMISSIONS.get(name, set()),
+            }
+            return self.users[name]
+
+    def session_for(self, name):
+        """Returns a valid sessionid for the user, creating the account if needed"""
+        with self.lock:
+            if name not in self.users:
+                self.add_user(
+                    name,
+                    restricted=name == 'restricted_user',
+                    agreement=name != 'regular_user',
+                )
+            user_id = self.users[name]['id']
+            for sessionid, session_user in self.sessions.items():
+                if session_user == user_id:
+                    return sessionid
+            sessionid = uuid_lib.uuid4().hex
+            self.sessions[sessionid] = user_id
+            return sessionid
+
+    def seed(self, variables):
+        """Creates the accounts and add-ons the tests look up through the ids and slugs
+        from the variables file (e.g. dev.json), as they are set up on dev/stage"""
+        with self.lock:
+            owner = self.add_user('api_user', variables.get('api_addon_author_owner'))
+            staff = self.add_user('staff_user', variables.get('api_post_valid_author'))
+            other = self.add_user(
+                'developer', variables.get('api_post_additional_author')
+            )
+            self.add_user(
+                'no_display_name',
+                variables.get('api_post_author_no_display_name'),
+                display_name=False,
+            )
+            self.add_user(
+                'no_dev_agreement',
+                variables.get('api_post_author_no_dev_agreement'),
+                restricted=True,
+            )
+            if variables.get('approved_addon_with_sources'):
+                version = self.seed_addon(
+                    owner, slug=variables['approved_addon_with_sources']
+                )['versions'][0]
+                version['approved'] = True
+                self.sources[version['id']] = b'source code reviewed by Mozilla'
+            if variables.get('duplicate_guid'):
+                self.seed_addon(other, guid=variables['duplicate_guid'])
+            if variables.get('detail_extension_slug'):
+                self.seed_addon(other, slug=variables['detail_extension_slug'])
+            self.seed_addon(staff, slug='staff_user_adoon')
+
+    def seed_addon(self, user, slug=None, guid=None):
+        addon = _new_addon(
+            self.next_id(), guid or f'{{{uuid_lib.uuid4()}}}', 'extension', user
+        )
+        addon['slug'] = slug or f'seeded-addon-{addon["id"]}'
+        addon['name'] = {'en-US': addon['slug']}
+        addon['summary'] = {'en-US': 'Add-on created when seeding the local AMO'}
+        addon['versions'].append(_new_version(self.next_id(), '1.0', 'listed'))
+        self.addons[addon['id']] = addon
+        return addon
+
+    # --- helpers shared by the endpoints ---
+
+    def authenticate(self, request, required=True):
+        header = request.headers.get('Authorization', '')
+        sessionid = header[len('Session ') :] if header.startswith('Session ') else None
+        if sessionid is None:
+            sessionid = request.cookies.get('sessionid')
+        if sessionid is None:
+            if required:
+                raise ApiError(
+                    401, _detail('Authentication credentials were not provided.')
+                )
+            return None
+        if sessionid not in self.sessions:
+            raise ApiError(
+                401,
+                _detail(
+                    'Valid user session not found matching the provided session key.',
+                    code='ERROR_AUTHENTICATION_EXPIRED',
+                ),
+            )
+        return self.user_by_id(self.sessions[sessionid])
+
+    def user_by_id(self, user_id):
+        return next(
+            (user for user in self.users.values() if user['id'] == user_id), None
+        )
+
+    def user_json(self, user):
+        return {
+            'id': user['id'],
+            'name': user['name'],
+            'url': f'{self.url}/en-US/firefox/user/{user["id"]}/',
+            'username': user['username'],
+        }
+
+    def find_addon(self, key, user=None, role=None):
+        """Returns the add-on matching the id, slug or guid; if a <role> is set, the user
+        needs to be an author of the add-on ('developer') or one of its owners ('owner')
+        """
+        key = key.strip()
+        addon = next(
+            (
+                addon
+                for addon in self.addons.values()
+                if key in (str(addon['id']), addon['slug'], addon['guid'])
+                and not addon['deleted']
+            ),
+            None,
+        )
+        if addon is None:
+            raise ApiError(404, _detail('Not found.'))
+        if role is not None:
+            author = _author(addon, user)
+            if author is None or (role == 'owner' and author['role'] != 'owner'):
+                raise ApiError(403, _detail(_permission_error))
+        return addon
+
+    def check_submission_rights(self, user):
+        if user['restricted']:
+            raise ApiError(
+                403,
+                _detail(
+                    'The email address used for your account is not allowed for submissions.'
+                ),
+            )
+        if not user['agreement']:
+            raise ApiError(
+                403,
+                _detail(
+                    'Please read and accept our Firefox Add-on Distribution Agreement as well as our '
+                    'Review Policies and Rules. The Firefox Add-on Distribution Agreement also links '
+                    'to our Privacy Notice which explains how we handle your information.'
+                ),
+            )
+
+    # --- uploads ---
+
+    def create_upload(self, user, filename, content, channel):
+        self.check_submission_rights(user)
+        manifest, messages, translations, signed = {}, [], {}, False
+        if not filename.lower().endswith(SUPPORTED_FILE_TYPES):
+            messages.append(
+                {
+                    'message': 'Unsupported file type, please upload a supported file (.crx, .xpi, .zip).'
+                }
+            )
+        else:
+            try:
+                with zipfile.ZipFile(io.BytesIO(content)) as archive:
+                    names = archive.namelist()
+                    signed = 'META-INF/mozilla.rsa' in names
+                    if 'manifest.json' in names:
+                        manifest = json.loads(archive.read('manifest.json'))
+                    else:
+                        messages.append(
+                            {
+                                'message': 'manifest.json was not found',
+                                'instancePath': '',
+                            }
+                        )
+                    for name in names:
+                        match = re.match(r'^_locales/([^/]+)/messages\.json$', name)
+                        if match:
+                            translations[_locale(match.group(1))] = json.loads(
+                                archive.read(name)
+                            )
+            except (zipfile.BadZipFile, ValueError):
+                messages.append({'message': 'Invalid or corrupt add-on file.'})
+        if manifest:
+            messages.extend(_lint_manifest(manifest))
+        upload = {
+            'uuid': uuid_lib.uuid4().hex,
+            'channel': channel,
+            'processed': True,
+            'submitted': False,
+            'url': '',
+            'valid': not messages,
+            'validation': {'errors': len(messages), 'messages': messages},
+            'version': manifest.get('version'),
+            'manifest': manifest,
+            'translations': translations,
+            'signed': signed,
+            'user': user['id'],
+        }
+        upload['url'] = f'{self.url}/api/v5/addons/upload/{upload["uuid"]}/'
+        self.uploads[upload['uuid']] = upload
+        return upload
+
+    def get_upload(self, value, nested=True):
+        def error(message):
+            return ApiError(
+                400,
+                {'version': {'upload': [message]}} if nested else {'upload': [message]},
+            )
+
+        if value in (None, ''):
+            raise error('This field may not be null.')
+        if isinstance(value, int):
+            key = uuid_lib.UUID(int=value).hex
+        elif isinstance(value, str) and _uuid_regex.match(value):
+            key = value.replace('-', '')
+        else:
+            raise error(f'“{value}” is not a valid UUID.')
+        if key not in self.uploads or self.uploads[key]['submitted']:
+            raise error(f'Object with uuid={value} does not exist.')
+        if not self.uploads[key]['valid']:
+            raise error('Upload is not valid.')
+        return self.uploads[key]
+
+    # --- add-ons ---
+
+    def create_addon(self, user, data, guid=None):
+        self.check_submission_rights(user)
+        version_data = data.get('version') or {}
+        upload = self.get_upload(version_data.get('upload'))
+        manifest = upload['manifest']
+        addon_type = _addon_type(manifest)
+        manifest_guid = _manifest_guid(manifest)
+        if guid is not None:
+            if not manifest_guid:
+                raise ApiError(
+                    400, {'version': ['A GUID must be specified in the manifest.']}
+                )
+            if manifest_guid != guid:
+                raise ApiError(
+                    400, {'version': ['GUID mismatch between the URL and manifest.']}
+                )
+        if (
+            manifest_guid
+            and manifest_guid.endswith(RESERVED_GUID_SUFFIXES)
+            and 'reserved_guid' not in user['permissions']
+        ):
+            raise ApiError(
+                400,
+                {
+                    'version': [
+                        'You cannot submit an add-on using an ID ending with this suffix'
+                    ]
+                },
+            )
+        if addon_type == 'language' and 'langpack' not in user['permissions']:
+            raise ApiError(400, {'version': ['You cannot submit a language pack']})
+        if upload['signed'] and 'mozilla_signed' not in user['permissions']:
+            raise ApiError(
+                400, {'version': ['You cannot submit a Mozilla Signed Extension']}
+            )
+        # the guids of deleted add-ons can't be re-used either
+        if manifest_guid and any(
+            addon['guid'] == manifest_guid for addon in self.addons.values()
+        ):
+            raise ApiError(409, _detail('Duplicate add-on ID found.'))
+        addon = _new_addon(
+            self.next_id(), manifest_guid or f'{{{uuid_lib.uuid4()}}}', addon_type, user
+        )
+        addon['default_locale'] = _locale(manifest.get('default_locale', 'en-US'))
+        addon['name'] = _manifest_translations(manifest, 'name', upload['translations'])
+        addon['summary'] = _manifest_translations(
+            manifest, 'description', upload['translations']
+        )
+        errors = {}
+        changes = self.validate_addon(addon, data, user, errors, create=True)
+        if upload['channel'] == 'listed' and not changes.get(
+            'summary', addon['summary']
+        ):
+            errors['summary'] = [
+                'This field is required for add-ons with listed versions.'
+            ]
+        version_changes = self.validate_version(
+            addon, version_data, errors, nested=True
+        )
+        _raise_for_errors(errors)
+        addon.update(changes)
+        if addon['slug'] is None:
+            name = addon['name'][addon['default_locale']]
+            addon['slug'] = (
+                f'{re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")}-{addon["id"]}'
+            )
+        self.addons[addon['id']] = addon
+        self.add_version(addon, upload, version_changes)
+        return addon
+
+    def validate_addon(self, addon, data, user, errors, create=False):
+        """Validates the add-on fields of a create or edit request and returns the changes
+        to apply; validation errors are added to <errors>, in the AMO response format"""
+        changes = {}
+        if 'default_locale' in data:
+            locale = data['default_locale']
+            if locale is None:
+                errors['default_locale'] = ['This field may not be null.']
+            elif not isinstance(locale, str) or locale not in LOCALES:
+                errors['default_locale'] = [f'"{locale}" is not a valid choice.']
+            else:
+                changes['default_locale'] = locale
+        default_locale = changes.get('default_locale', addon['default_locale'])
+        for field in _translated_fields:
+            if field in data:
+                # new add-ons take the payload translations instead of the ones from the manifest
+                value = _translations(
+                    errors, field, data[field], {} if create else addon[field] or {}
+                )
+                if value is not None:
+                    changes[field] = value
+            values = changes.get(field, addon[field]) or {}
+            if field not in errors:
+                message = next(
+                    filter(
+                        None,
+                        (
+                            self.check_translation(field, text, user)
+                            for text in values.values()
+                        ),
+                    ),
+                    None,
+                )
+                if message:
+                    errors[field] = [message]
+            if field in errors or default_locale in values:
+                continue
+            if field == 'name' or (field == 'summary' and values):
+                errors[field] = [
+                    f'A value in the default locale of "{default_locale}" is required.'
+                ]
+            elif values:
+                errors[field] = [
+                    f'A value in the default locale of "{default_locale}" is required if other translations are set.'
+                ]
+        if 'slug' in data:
+            slug = data['slug']
+            if isinstance(slug, int) or (isinstance(slug, str) and slug.isdigit()):
+                errors['slug'] = ['This slug cannot be used. Please choose another.']
+            elif (
+                not isinstance(slug, str)
+                or not re.match(r'^[-\w]+$', slug)
+                or not re.search(r'[^\W_]', slug)
+            ):
+                errors['slug'] = [
+                    'Enter a valid “slug” consisting of letters, numbers, underscores or hyphens.'
+                ]
+            elif any(
+                other['slug'] == slug and other is not addon
+                for other in self.addons.values()
+            ):
+                errors['slug'] = ['addon with this slug already exists.']
+            else:
+                changes['slug'] = slug
+        if 'categories' in data:
+            categories = _categories(data['categories'], addon['type'])
+            if isinstance(categories, str):
+                errors['categories'] = [categories]
+            else:
+                changes['categories'] = categories
+        for field in ('is_experimental', 'requires_payment'):
+            if field in data:
+                if data[field] is None:
+                    errors[field] = ['This field may not be null.']
+                elif not isinstance(data[field], bool):
+                    errors[field] = ['Must be a valid boolean.']
+                else:
+                    changes[field] = data[field]
+        if 'contributions_url' in data:
+            messages = _contributions_url_errors(data['contributions_url'])
+            if messages:
+                errors['contributions_url'] = messages
+            else:
+                changes['contributions_url'] = data['contributions_url']
+        if 'tags' in data:
+            tags = data['tags']
+            if tags is None:
+                errors['tags'] = ['This field may not be null.']
+            elif not isinstance(tags, list):
+                errors['tags'] = [
+                    f'Expected a list of items but got type "{type(tags).__name__}".'
+                ]
+            elif any(tag not in TAGS for tag in tags):
+                errors['tags'] = [
+                    f'"{next(tag for tag in tags if tag not in TAGS)}" is not a valid choice.'
+                ]
+            else:
+                changes['tags'] = tags
+        return changes
+
+    def check_translation(self, field, text, user):
+        """Returns the error message for an invalid translation of <field>, if any"""
+        if field == 'name':
+            if not re.search(r'[^\W_]', text):
+                return 'Ensure this field contains at least one letter or number character.'
+            if (
+                re.search('mozilla|firefox', text, re.I)
+                and 'trademark' not in user['permissions']
+            ):
+                return 'Add-on names cannot contain the Mozilla or Firefox trademarks.'
+        if field == 'summary' and len(text) > 250:
+            return 'Ensure this field has no more than 250 characters.'
+        if field in ('homepage', 'support_url'):
+            if text.startswith(self.url):
+                return f'This field can only be used to link to external websites. URLs on {self.url} are not allowed.'
+            if not _url_regex.match(text):
+                return 'Enter a valid URL.'
+        if field == 'support_email' and not _email_regex.match(text):
+            return 'Enter a valid email address.'
+        return None
+
+    def edit_addon(self, addon, data, user):
+        errors = {}
+        changes = self.validate_addon(addon, data, user, errors)
+        _raise_for_errors(errors)
+        addon.update(changes)
+
+    def validate_version(self, addon, data, errors, nested=False):
+        """Validates the version fields of a create or edit request and returns the changes;
+        when the version is sent along with a new add-on, its errors are <nested> under 'version'
+        """
+        changes, version_errors = {}, {}
+        if 'license' in data and 'custom_license' in data:
+            version_errors['non_field_errors'] = [
+                'Both `license` and `custom_license` cannot be provided together.'
+            ]
+        elif 'license' in data:
+            license = data['license']
+            if license is None:
+                version_errors['license'] = ['This field may not be null.']
+            elif not any(
+                isinstance(license, str) and license in licenses
+                for licenses in LICENSES.values()
+            ):
+                version_errors['license'] = [
+                    f'License with slug={license} does not exist.'
+                ]
+            elif license not in LICENSES[addon['type']]:
+                version_errors['license'] = ['Wrong add-on type for this license.']
+            else:
+                changes.update({'license': license, 'custom_license': None})
+        elif 'custom_license' in data:
+            custom = data['custom_license']
+            if custom is None:
+                version_errors['custom_license'] = ['This field may not be null.']
+            elif not isinstance(custom, dict):
+                version_errors['custom_license'] = [
+                    f'Invalid data. Expected a dictionary, but got {type(custom).__name__}.'
+                ]
+            else:
+                license_errors = {}
+                license = {}
+                for field in ('name', 'text'):
+                    if field in custom:
+                        license[field] = _translations(
+                            license_errors, field, custom[field], {}
+                        )
+                    else:
+                        license_errors[field] = ['This field is required.']
+                if license_errors:
+                    version_errors['custom_license'] = license_errors
+                else:
+                    changes.update({'license': None, 'custom_license': license})
+        if 'release_notes' in data:
+            notes = _translations(
+                version_errors, 'release_notes', data['release_notes'], {}
+            )
+            if notes is not None:
+                changes['release_notes'] = notes
+        if 'compatibility' in data:
+            compatibility = _compatibility(data['compatibility'])
+            if isinstance(compatibility, str):
+                version_errors['compatibility'] = [compatibility]
+            else:
+                changes['compatibility'] = compatibility
+        if 'is_disabled' in data:
+            if isinstance(data['is_disabled'], bool):
+                changes['is_disabled'] = data['is_disabled']
+            else:
+                version_errors['is_disabled'] = ['Must be a valid boolean.']
+        if version_errors and nested:
+            errors['version'] = version_errors
+        else:
+            errors.update(version_errors)
+        return changes
+
+    def add_version(self, addon, upload, changes):
+        if any(
+            version['version'] == upload['version'] for version in addon['versions']
+        ):
+            raise ApiError(409, _detail(f'Version {upload["version"]} already exists.'))
+        upload['submitted'] = True
+        version = _new_version(self.next_id(), upload['version'], upload['channel'])
+        version.update(changes)
+        addon['versions'].insert(0, version)
+        return version
+
+    def create_version(self, addon, data, source=None):
+        upload = self.get_upload(data.get('upload'), nested=False)
+        upload_type = _addon_type(upload['manifest'])
+        if upload_type != addon['type']:
+            raise ApiError(
+                400,
+                {
+                    'upload': [
+                        f'The type ({TYPE_NAMES[upload_type]}) does not match the type of '
+                        f'your add-on on AMO ({TYPE_NAMES[addon["type"]]})'
+                    ]
+                },
+            )
+        guid = _manifest_guid(upload['manifest'])
+        if guid and guid != addon['guid']:
+            raise ApiError(
+                400,
+                {
+                    'upload': [
+                        f'The add-on ID in your manifest.json ({guid}) does not match the ID of '
+                        f'your add-on on AMO ({addon["guid"]})'
+                    ]
+                },
+            )
+        errors = {}
+        changes = self.validate_version(addon, data, errors)
+        if source is not None:
+            errors.update(_source_errors(source[0]))
+        _raise_for_errors(errors)
+        version = self.add_version(addon, upload, changes)
+        if source is not None:
+            self.sources[version['id']] = source[1]
+        return version
+
+    def edit_version(self, addon, version, data, source=None):
+        errors = {}
+        changes = self.validate_version(addon, data, errors)
+        if source is not None:
+            if version['approved']:
+                errors['source'] = [
+                    'Source cannot be changed because this version has been reviewed by Mozilla.'
+                ]
+            else:
+                errors.update(_source_errors(source[0]))
+        _raise_for_errors(errors)
+        version.update(changes)
+        if source is not None:
+            self.sources[version['id']] = source[1]
+
+    def addon_json(self, addon):
+        listed = [
+            version for version in addon['versions'] if version['channel'] == 'listed'
+        ]
+        unlisted = [
+            version for version in addon['versions'] if version['channel'] == 'unlisted'
+        ]
+        contributions_url = f'{addon["contributions_url"]}?{CONTRIBUTE_UTM}'
+        return {
+            'id': addon['id'],
+            'guid': addon['guid'],
+            'slug': addon['slug'],
+            'type': addon['type'],
+            'status': 'nominated' if listed else 'incomplete',
+            'name': addon['name'],
+            'summary': addon['summary'],
+            'description': addon['description'],
+            'developer_comments': addon['developer_comments'],
+            'homepage': _outgoing(addon['homepage']),
+            'support_email': addon['support_email'],
+            'support_url': _outgoing(addon['support_url']),
+            'default_locale': addon['default_locale'],
+            'categories': addon['categories'],
+            'tags': addon['tags'],
+            'is_experimental': addon['is_experimental'],
+            'requires_payment': addon['requires_payment'],
+            'is_disabled': addon['is_disabled'],
+            'contributions_url': (
+                _outgoing(contributions_url) if addon['contributions_url'] else ''
+            ),
+            'icons': addon['icons'],
+            'previews': sorted(
+                addon['previews'], key=lambda preview: preview['position']
+            ),
+            'authors': [
+                self.user_json(self.user_by_id(author['user_id']))
+                for author in _sorted_authors(addon)
+                if author['listed']
+            ],
+            'current_version': self.version_json(listed[0]) if listed else None,
+            'latest_unlisted_version': (
+                self.version_json(unlisted[0]) if unlisted else None
+            ),
+            'edit_url': f'{self.url}/en-US/developers/addon/{addon["id"]}/edit',
+            'url': f'{self.url}/en-US/firefox/addon/{addon["slug"]}/',
+        }
+
+    def version_json(self, version):
+        custom = version['custom_license']
+        return {
+            'id': version['id'],
+            'version': version['version'],
+            'channel': version['channel'],
+            'license': {
+                'slug': version['license'],
+                'name': custom['name'] if custom else version['license'],
+                'text': custom['text'] if custom else None,
+                'is_custom': bool(custom),
+            },
+            'release_notes': version['release_notes'],
+            'compatibility': version['compatibility'],
+            'is_disabled': version['is_disabled'],
+            'file': {
+                'id': version['id'],
+                'status': 'public' if version['approved'] else 'nominated',
+                'url': f'{self.url}/firefox/downloads/file/{version["id"]}/',
+            },
+            'source': (
+                f'{self.url}/firefox/downloads/source/{version["id"]}'
+                if version['id'] in self.sources
+                else None
+            ),
+        }
+
+    # --- authors ---
+
+    def author_json(self, author):
+        user = self.user_by_id(author['user_id'])
+        return {
+            **author,
+            'name': user['name'],
+            'email': f'{user["username"]}@example.com',
+        }
+
+    def invite_author(self, addon, data):
+        user = self.user_by_id(data.get('user_id'))
+        if user is None:
+            raise ApiError(400, {'user_id': ['Account not found.']})
+        if not user['name']:
+            raise ApiError(
+                400,
+                {
+                    'user_id': [
+                        'The account needs a display name before it can be added as an author.'
+                    ]
+                },
+            )
+        if user['restricted']:
+            raise ApiError(
+                400,
+                {
+                    'user_id': [
+                        'The email address used for your account is not allowed for submissions.'
+                    ]
+                },
+            )
+        if _author(addon, user) or any(
+            author['user_id'] == user['id'] for author in addon['pending_authors']
+        ):
+            raise ApiError(400, {'user_id': ['An author can only be present once.']})
+        pending = {
+            'user_id': user['id'],
+            'role': data.get('role', 'developer'),
+            'listed': data.get('listed', True),
+            'position': data.get('position', 0),
+        }
+        addon['pending_authors'].append(pending)
+        return pending
+
+    def edit_author(self, addon, author, data):
+        edited = {
+            **author,
+            **{key: data[key] for key in ('role', 'listed', 'position') if key in data},
+        }
+        _check_authors(
+            [edited if other is author else other for other in addon['authors']]
+        )
+        author.update(edited)
+
+    def delete_author(self, addon, author):
+        _check_authors([other for other in addon['authors'] if other is not author])
+        addon['authors'].remove(author)
+
+    # --- abuse reports ---
+
+    def create_abuse_report(self, user, data):
+        if 'addon' not in data:
+            raise ApiError(400, {'addon': ['This field is required.']})
+        _raise_for_errors(
+            {
+                key: [f'"{data[key]}" is not a valid choice.']
+                for key, choices in ABUSE_REPORT_STRICT_CHOICES.items()
+                if data.get(key) is not None and data[key] not in choices
+            }
+        )
+        report = {key: None for key in responses.abuse_report_minimal_details}
+        report.update({key: data[key] for key in report if key in data})
+        # unknown values for these fields are accepted, but saved as 'other'
+        for key, choices in ABUSE_REPORT_CHOICES.items():
+            if report[key] is not None and report[key] not in choices:
+                report[key] = 'other'
+        report.update(
+            {
+                'addon': responses.abuse_report_unauthenticated_response['addon'],
+                'app': data.get('app', 'firefox'),
+                'reporter': self.user_json(user) if user else None,
+            }
+        )
+        self.abuse_reports.append(report)
+        return report
+
+
+def _new_addon(addon_id, guid, addon_type, user):
+    return {
+        'id': addon_id,
+        'guid': guid,
+        'slug': None,
+        'type': addon_type,
+        'name': {},
+        'summary': {},
+        'description': None,
+        'developer_comments': None,
+        'homepage': None,
+        'support_email': None,
+        'support_url': None,
+        'default_locale': 'en-US',
+        'categories': [],
+        'tags': [],
+        'is_experimental': False,
+        'requires_payment': False,
+        'contributions_url': '',
+        'is_disabled': False,
+        'deleted': False,
+        'icons': {},
+        'previews': [],
+        'authors': [
+            {'user_id': user['id'], 'role': 'owner', 'listed': True, 'position': 0}
+        ],
+        'pending_authors': [],
+        'versions': [],
+    }
+
+
+def _new_version(version_id, number, channel):
+    return {
+        'id': version_id,
+        'version': number,
+        'channel': channel,
+        'license': None,
+        'custom_license': None,
+        'release_notes': None,
+        'compatibility': {
+            'firefox': {'min': DEFAULT_MIN_VERSIONS['firefox'], 'max': '*'}
+        },
+        'is_disabled': False,
+        'approved': False,
+    }
+
+
+def _outgoing(value):
+    return {'url': value, 'outgoing': value} if value else None
+
+
+def _author(addon, user):
+    if user is None:
+        return None
+    return next(
+        (author for author in addon['authors'] if author['user_id'] == user['id']), None
+    )
+
+
+def _sorted_authors(addon):
+    return sorted(addon['authors'], key=lambda author: author['position'])
+
+
+def _check_authors(authors):
+    if not any(author['role'] == 'owner' for author in authors):
+        raise ApiError(400, ['Add-ons need at least one owner.'])
+    if not any(author['listed'] for author in authors):
+        raise ApiError(400, ['Add-ons need at least one listed author.'])
+
+
+def _addon_type(manifest):
+    if 'theme' in manifest:
+        return 'statictheme'
+    if 'langpack_id' in manifest:
+        return 'language'
+    return 'extension'
+
+
+def _manifest_guid(manifest):
+    settings = (
+        manifest.get('browser_specific_settings') or manifest.get('applications') or {}
+    )
+    return settings.get('gecko', {}).get('id')
+
+
+def _locale(name):
+    # the _locales folders use underscores, e.g. 'pt_BR'
+    return name.replace('_', '-')
+
+
+def _manifest_translations(manifest, key, translations):
+    """Returns the {locale: text} translations of a manifest string, resolving
+    the "__MSG_<message>__" placeholders with the files from _locales/"""
+    value = manifest.get(key)
+    if not value:
+        return {}
+    match = re.match(r'^__MSG_(.+)__$', value)
+    if not match:
+        return {_locale(manifest.get('default_locale', 'en-US')): value}
+    return {
+        locale: messages[match.group(1)]['message']
+        for locale, messages in sorted(translations.items())
+        if match.group(1) in messages
+    }
+
+
+def _lint_manifest(manifest):
+    messages = []
+    if 'name' not in manifest:
+        messages.append(
+            {'message': "must have required property 'name'", 'instancePath': ''}
+        )
+    regex = (
+        _langpack_version_regex
+        if _addon_type(manifest) == 'language'
+        else _version_regex
+    )
+    if not regex.match(str(manifest.get('version', ''))):
+        messages.append(
+            {
+                'message': 'The version string should be simplified.',
+                'instancePath': '/version',
+            }
+        )
+    guid = _manifest_guid(manifest)
+    if guid is not None and not _guid_regex.match(guid):
+        messages.append(
+            {
+                'message': 'must match format "addonId"',
+                'instancePath': '/browser_specific_settings/gecko/id',
+            }
+        )
+    return messages
+
+
+def _translations(errors, field, value, current):
+    """Merges a {locale: text} value into the <current> translations; None removes a
+    locale. Returns None and adds the error to <errors> if the value is not valid."""
+    if not isinstance(value, dict):
+        errors[field] = ['You must provide an object of {lang-code:value}.']
+        return None
+    result = dict(current)
+    for locale, text in value.items():
+        if locale not in LOCALES:
+            errors[field] = [f'The language code "{locale}" is invalid.']
+            return None
+        if text is None:
+            result.pop(locale, None)
+        elif not str(text).strip():
+            errors[field] = ['This field may not be blank.']
+            return None
+        else:
+            result[locale] = str(text)
+    return result
+
+
+def _categories(value, addon_type):
+    """Returns the categories to save or the error message if they are not valid"""
+    allowed = CATEGORIES[addon_type]
+    if isinstance(value, list):
+        value = {'firefox': value}
+    if not isinstance(value, dict):
+        return 'Invalid category name.'
+    for app, categories in value.items():
+        if app not in allowed or not isinstance(categories, list):
+            return 'Invalid category name.'
+        if any(
+            not isinstance(category, str) or category not in allowed[app]
+            for category in categories
+        ):
+            return 'Invalid category name.'
+        if 'other' in categories and len(categories) > 1:
+            return 'The "other" category cannot be combined with another category'
+    return value.get('firefox', [])
+
+
+def _contributions_url_errors(value):
+    if value == '':
+        return ['This field may not be blank.']
+    url = urlsplit(str(value))
+    messages = []
+    if url.scheme != 'https':
+        messages.append('URLs must start with https://.')
+    # buymeacoffee.com is accepted with and without 'www'
+    if url.netloc not in CONTRIBUTION_DOMAINS + ('buymeacoffee.com',):
+        messages.append(
+            f'URL domain must be one of [{", ".join(CONTRIBUTION_DOMAINS)}].'
+        )
+    return messages
+
+
+def _known_app_version(value, wildcard):
+    if wildcard and value == '*':
+        return True
+    pattern = r'^(\d+)\.(\d+(a1)?|\*)$' if wildcard else r'^(\d+)\.\d+(a1)?$'
+    match = re.match(pattern, str(value))
+    return bool(match) and 1 <= int(match.group(1)) <= MAX_APP_VERSION
+
+
+def _compatibility(value):
+    """Returns the compatibility to save or the error message if it's not valid"""
+    if value is None:
+        return 'This field may not be null.'
+    if isinstance(value, list):
+        if not value or any(app not in DEFAULT_MIN_VERSIONS for app in value):
+            return 'Invalid app specified'
+        return {app: {'min': DEFAULT_MIN_VERSIONS[app], 'max': '*'} for app in value}
+    if not isinstance(value, dict) or not value:
+        return 'Invalid value'
+    compatibility = {}
+    for app, versions in value.items():
+        if app not in DEFAULT_MIN_VERSIONS:
+            return 'Invalid app specified'
+        if not isinstance(versions, dict):
+            return 'Invalid value'
+        low = versions.get('min', DEFAULT_MIN_VERSIONS[app])
+        high = versions.get('max', '*')
+        if not _known_app_version(low, wildcard=False):
+            return 'Unknown min app version specified'
+        if not _known_app_version(high, wildcard=True):
+            return 'Unknown max app version specified'
+        compatibility[app] = {'min': low, 'max': high}
+    return compatibility
+
+
+def _source_errors(filename):
+    if filename.lower().endswith(SOURCE_FILE_TYPES):
+        return {}
+    return {
+        'source': [
+            'Unsupported file type, please upload an archive file (.zip, .tar.gz, .tgz, .tar.bz2).'
+        ]
+    }
+
+
+def _image_errors(content, square):
+    """Mimics the checks AMO runs on uploaded icons (<square> images) and screenshots"""
+    if content.startswith(b'\x89PNG\r\n\x1a\n'):
+        # animated PNGs have an animation control chunk before the image data
+        if b'acTL' in content[: content.find(b'IDAT')]:
+            return ['Images cannot be animated.']
+        width, height = int.from_bytes(content[16:20], 'big'), int.from_bytes(
+            content[20:24], 'big'
+        )
+    elif content.startswith(b'\xff\xd8\xff'):
+        width, height = _jpeg_size(content)
+    elif content[:6] in (b'GIF87a', b'GIF89a') or content.startswith(b'BM'):
+        return ['Images must be either PNG or JPG.']
+    else:
+        return [
+            'Upload a valid image. The file you uploaded was either not an image or a corrupted image.'
+        ]
+    if square and width != height:
+        return ['Images must be square (same width and height).']
+    return []
+
+
+def _jpeg_size(content):
+    position = 2
+    while position < len(content) - 9:
+        marker = content[position + 1]
+        # the image size is stored in the 'start of frame' segments
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            return (
+                int.from_bytes(content[position + 7 : position + 9], 'big'),
+                int.from_bytes(content[position + 5 : position + 7], 'big'),
+            )
+        position += 2 + int.from_bytes(content[position + 2 : position + 4], 'big')
+    return 0, 0
+
+
+def _delete_token(addon):
+    return f'{addon["id"]}:{addon["guid"]}'.encode().hex()
+
+
+class _Request:
+    """The parts of an HTTP request used by the endpoints: headers, cookies, query and body"""
+
+    def __init__(self, handler):
+        self.method = handler.command
+        split = urlsplit(handler.path)
+        self.path = unquote(split.path)
+        self.query = {
+            key: values[-1]
+            for key, values in parse_qs(split.query, keep_blank_values=True).items()
+        }
+        self.headers = handler.headers
+        self.cookies = dict(
+            cookie.strip().split('=', 1)
+            for cookie in handler.headers.get('Cookie', '').split(';')
+            if '=' in cookie
+        )
+        length = int(handler.headers.get('Content-Length') or 0)
+        self.body = handler.rfile.read(length) if length else b''
+        self.data, self.files = {}, {}
+        content_type = handler.headers.get('Content-Type', '')
+        if content_type.startswith('application/json') and self.body:
+            try:
+                self.data = json.loads(self.body)
+            except ValueError:
+                raise ApiError(400, _detail('JSON parse error'))
+        elif content_type.startswith('multipart/form-data'):
+            message = BytesParser(policy=HTTP).parsebytes(
+                f'Content-Type: {content_type}\r\n\r\n'.encode() + self.body
+            )
+            for part in message.iter_parts():
+                name = part.get_param('name', header='content-disposition')
+                if part.get_filename():
+                    self.files[name] = (
+                        part.get_filename(),
+                        part.get_payload(decode=True),
+                    )
+                else:
+                    self.data[name] = part.get_payload(decode=True).decode()
+        elif content_type.startswith('application/x-www-form-urlencoded'):
+            self.data = {
+                key: values[-1] for key, values in parse_qs(self.body.decode()).items()
+            }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # responses are written in several parts; without this, each request of a kept-alive
+    # connection waits for the delayed ACK of the client
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        # keep the test output clean
+        pass
+
+    def do_GET(self):
+        amo = self.server.amo
+        try:
+            request = _Request(self)
+            with amo.lock:
+                status, body = _route(amo, request)
+        except ApiError as error:
+            status, body = error.status, error.body
+        if isinstance(body, bytes):
+            payload, content_type = body, 'application/octet-stream'
+        else:
+            payload = (
+                b''
+                if body is None
+                else json.dumps(
+                    body, separators=(',', ':'), ensure_ascii=False
+                ).encode()
+            )
+            content_type = 'application/json'
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_POST = do_PUT = do_PATCH = do_DELETE = do_GET
+
+
+_routes = []
+
+
+def _endpoint(pattern, *methods):
+    def register(view):
+        _routes.append((re.compile(f'^{pattern}$'), methods, view))
+        return view
+
+    return register
+
+
+def _route(amo, request):
+    for pattern, methods, view in _routes:
+        match = pattern.match(request.path)
+        if match:
+            if request.method not in methods:
+                raise ApiError(405, _detail(f'Method "{request.method}" not allowed.'))
+            return view(amo, request, **match.groupdict())
+    raise ApiError(404, _detail('Not found.'))
+
+
+def _upload_json(upload):
+    return {
+        key: value
+        for key, value in upload.items()
+        if key not in ('manifest', 'translations', 'signed', 'user')
+    }
+
+
+@_endpoint(r'/api/v5/addons/upload/', 'POST')
+def _uploads(amo, request):
+    user = amo.authenticate(request)
+    if 'upload' not in request.files:
+        raise ApiError(400, {'upload': ['No file was submitted.']})
+    filename, content = request.files['upload']
+    return 201, _upload_json(
+        amo.create_upload(
+            user, filename, content, request.data.get('channel', 'listed')
+        )
+    )
+
+
+@_endpoint(r'/api/v5/addons/upload/(?P<uuid>[^/]+)/?', 'GET')
+def _upload(amo, request, uuid):
+    user = amo.authenticate(request)
+    upload = amo.uploads.get(uuid.replace('-', ''))
+    if upload is None or upload['user'] != user['id']:
+        raise ApiError(404, _detail('Not found.'))
+    return 200, _upload_json(upload)
+
+
+@_endpoint(r'/api/v5/addons/addon/', 'POST')
+def _addons(amo, request):
+    return 201, amo.addon_json(
+        amo.create_addon(amo.authenticate(request), request.data)
+    )
+
+
+@_endpoint(r'/api/v5/addons/addon/(?P<key>[^/]+)/?', 'GET', 'PATCH', 'PUT', 'DELETE')
+def _addon(amo, request, key):
+    if request.method == 'GET':
+        return 200, amo.addon_json(amo.find_addon(key))
+    user = amo.authenticate(request)
+    if request.method == 'PUT':
+        if not _guid_regex.match(key):
+            raise ApiError(404, _detail('Not found.'))
+        if not any(
+            addon['guid'] == key and not addon['deleted']
+            for addon in amo.addons.values()
+        ):
+            return 201, amo.addon_json(amo.create_addon(user, request.data, guid=key))
+        addon = amo.find_addon(key, user, role='developer')
+        amo.create_version(addon, request.data.get('version') or {})
+        amo.edit_addon(
+            addon,
+            {key: value for key, value in request.data.items() if key != 'version'},
+            user,
+        )
+        return 200, amo.addon_json(addon)
+    if request.method == 'DELETE':
+        addon = amo.find_addon(key, user, role='owner')
+        token = request.query.get('delete_confirm')
+        if not token:
+            raise ApiError(
+                400,
+                _detail('"delete_confirm" token must be supplied for add-on delete.'),
+            )
+        if token != _delete_token(addon):
+            raise ApiError(400, _detail('"delete_confirm" token is invalid.'))
+        addon['deleted'] = True
+        return 204, None
+    addon = amo.find_addon(key, user, role='developer')
+    if 'icon' in request.files:
+        messages = _image_errors(request.files['icon'][1], square=True)
+        _raise_for_errors({'icon': messages} if messages else {})
+    amo.edit_addon(addon, request.data, user)
+    if 'icon' in request.files:
+        addon['icons'] = {
+            size: f'{amo.url}/user-media/addon_icons/{addon["id"]}-{size}.png'
+            for size in ('32', '64', '128')
+        }
+    return 200, amo.addon_json(addon)
+
+
+@_endpoint(r'/api/v5/addons/addon/(?P<key>[^/]+)/delete_confirm/', 'GET')
+def _delete_confirm(amo, request, key):
+    addon = amo.find_addon(key, amo.authenticate(request), role='owner')
+    return 200, {'delete_confirm': _delete_token(addon)}
+
+
+@_endpoint(r'/api/v5/addons/addon/(?P<key>[^/]+)/versions/', 'POST')
+def _versions(amo, request, key):
+    addon = amo.find_addon(key, amo.authenticate(request), role='developer')
+    return 201, amo.version_json(
+        amo.create_version(addon, request.data, request.files.get('source'))
+    )
+
+
+@_endpoint(
+    r'/api/v5/addons/addon/(?P<key>[^/]+)/versions/(?P<version_id>[^/]+)/',
+    'GET',
+    'PATCH',
+)
+def _version(amo, request, key, version_id):
+    user = amo.authenticate(request, required=request.method != 'GET')
+    addon = amo.find_addon(
+        key, user, role=None if request.method == 'GET' else 'developer'
+    )
+    version = next((v for v in addon['versions'] if str(v['id']) == version_id), None)
+    if version is None:
+        raise ApiError(404, _detail('Not found.'))
+    if request.method == 'PATCH':
+        amo.edit_version(addon, version, request.data, request.files.get('source'))
+    return 200, amo.version_json(version)
+
+
+@_endpoint(r'/api/v5/addons/addon/(?P<key>[^/]+)/previews/', 'POST')
+def _previews(amo, request, key):
+    addon = amo.find_addon(key, amo.authenticate(request), role='developer')
+    if 'image' not in request.files:
+        raise ApiError(400, {'image': ['No file was submitted.']})
+    messages = _image_errors(request.files['image'][1], square=False)
+    _raise_for_errors({'image': messages} if messages else {})
+    preview = {
+        'id': amo.next_id(),
+        'caption': None,
+        'position': int(request.data.get('position', len(addon['previews']))),
+    }
+    preview['image_url'] = f'{amo.url}/user-media/previews/full/{preview["id"]}.png'
+    addon['previews'].append(preview)
+    return 201, preview
+
+
+@_endpoint(
+    r'/api/v5/addons/addon/(?P<key>[^/]+)/previews/(?P<preview_id>[^/]+)/?',
+    'PATCH',
+    'DELETE',
+)
+def _preview(amo, request, key, preview_id):
+    addon = amo.find_addon(key, amo.authenticate(request), role='developer')
+    preview = next((p for p in addon['previews'] if str(p['id']) == preview_id), None)
+    if preview is None:
+        raise ApiError(404, _detail('Not found.'))
+    if request.method == 'DELETE':
+        addon['previews'].remove(preview)
+        return 204, None
+    errors = {}
+    if 'caption' in request.data:
+        caption = _translations(
+            errors, 'caption', request.data['caption'], preview['caption'] or {}
+        )
+    _raise_for_errors(errors)
+    if 'caption' in request.data:
+        preview['caption'] = caption
+    if 'position' in request.data:
+        preview['position'] = int(request.data['position'])
+    return 200, preview
+
+
+@_endpoint(r'/api/v5/addons/addon/(?P<key>[^/]+)/authors/', 'GET')
+def _authors(amo, request, key):
+    addon = amo.find_addon(key, amo.authenticate(request), role='developer')
+    return 200, [amo.author_json(author) for author in _sorted_authors(addon)]
+
+
+@_endpoint(
+    r'/api/v5/addons/addon/(?P<key>[^/]+)/authors/(?P<user_id>[^/]+)/',
+    'GET',
+    'PATCH',
+    'DELETE',
+)
+def _author_detail(amo, request, key, user_id):
+    user = amo.authenticate(request)
+    addon = amo.find_addon(
+        key, user, role='developer' if request.method == 'GET' else 'owner'
+    )
+    author = next(
+        (author for author in addon['authors'] if str(author['user_id']) == user_id),
+        None,
+    )
+    if author is None:
+        raise ApiError(404, _detail('Not found.'))
+    if request.method == 'DELETE':
+        amo.delete_author(addon, author)
+        return 204, None
+    if request.method == 'PATCH':
+        amo.edit_author(addon, author, request.data)
+    return 200, amo.author_json(author)
+
+
+@_endpoint(r'/api/v5/addons/addon/(?P<key>[^/]+)/pending-authors/', 'GET', 'POST')
+def _pending_authors(amo, request, key):
+    addon = amo.find_addon(key, amo.authenticate(request), role='owner')
+    if request.method == 'GET':
+        return 200, [amo.author_json(author) for author in addon['pending_authors']]
+    return 201, amo.author_json(amo.invite_author(addon, request.data))
+
+
+@_endpoint(
+    r'/api/v5/addons/addon/(?P<key>[^/]+)/pending-authors/(?P<action>confirm|decline)/',
+    'POST',
+)
+def _pending_author_answer(amo, request, key, action):
+    user = amo.authenticate(request)
+    addon = amo.find_addon(key)
+    pending = next(
+        (
+            author
+            for author in addon['pending_authors']
+            if author['user_id'] == user['id']
+        ),
+        None,
+    )
+    if pending is None:
+        raise ApiError(403, _detail(_permission_error))
+    addon['pending_authors'].remove(pending)
+    if action == 'confirm':
+        addon['authors'].append(pending)
+    return 200, None
+
+
+@_endpoint(
+    r'/api/v5/addons/addon/(?P<key>[^/]+)/pending-authors/(?P<user_id>[^/]+)/',
+    'GET',
+    'PATCH',
+    'DELETE',
+)
+def _pending_author(amo, request, key, user_id):
+    addon = amo.find_addon(key, amo.authenticate(request), role='owner')
+    pending = next(
+        (
+            author
+            for author in addon['pending_authors']
+            if str(author['user_id']) == user_id
+        ),
+        None,
+    )
+    if pending is None:
+        raise ApiError(404, _detail('Not found.'))
+    if request.method == 'DELETE':
+        addon['pending_authors'].remove(pending)
+        return 204, None
+    if request.method == 'PATCH':
+        pending.update(
+            {
+                key: request.data[key]
+                for key in ('role', 'listed', 'position')
+                if key in request.data
+            }
+        )
+    return 200, amo.author_json(pending)
+
+
+@_endpoint(r'/api/v5/abuse/report/addon/', 'POST')
+def _abuse_report(amo, request):
+    return 201, amo.create_abuse_report(
+        amo.authenticate(request, required=False), request.data
+    )
+
+
+@_endpoint(r'/firefox/downloads/source/(?P<version_id>\d+)', 'GET')
+def _download_source(amo, request, version_id):
+    amo.authenticate(request)
+    if int(version_id) not in amo.sources:
+        raise ApiError(404, _detail('Not found.'))
+    return 200, amo.sources[int(version_id)]
+
+
+@_endpoint(r'/en-US/developers/addon/(?P<key>[^/]+)/edit', 'GET')
+def _devhub_edit(amo, request, key):
+    amo.find_addon(key, amo.authenticate(request), role='developer')
+    return 200, b'<html><body>Edit Product Page</body></html>'
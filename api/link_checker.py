@@ -0,0 +1,116 @@
+"""Checks the links of a page over HTTP, instead of clicking them one by one in the browser.
+The links are requested in parallel over a pooled session and every URL is checked only
+once per run (per xdist worker): links shared by several pages, like the ones in the
+header and footer, are answered from the cache after the first check.
+Links set by add-on developers are sent by AMO through its outgoing redirector; their
+destination can be read from the link itself with outgoing_target."""
+
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
+from urllib.parse import unquote, urlparse
+
+import requests
+
+# some sites don't answer HEAD requests; they are requested again with GET
+HEAD_NOT_ALLOWED = (403, 405, 501)
+CHECKED_SCHEMES = ('http', 'https')
+
+# AMO outgoing redirector links look like https://<outgoing host>/v1/<signature>/<quoted url>
+OUTGOING_PATH_PREFIX = 'v1'
+
+
+def outgoing_target(url):
+    """Returns the destination of a link wrapped by the AMO outgoing redirector
+    (e.g. outgoing.prod.mozaws.net), decoded from the link, or None if the link
+    is not wrapped"""
+    parsed = urlparse(url)
+    parts = parsed.path.split('/', 3)
+    if (
+        'outgoing' not in parsed.netloc.split('.')
+        or len(parts) < 4
+        or parts[1] != OUTGOING_PATH_PREFIX
+    ):
+        return None
+    return unquote(parts[3])
+
+
+@dataclass
+class LinkResult:
+    """The outcome of a link check; <redirects> holds the URLs the link went through
+    before landing on <final_url>, and <error> is set when no response was received"""
+
+    url: str
+    status: Optional[int] = None
+    final_url: Optional[str] = None
+    redirects: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    @property
+    def ok(self):
+        return self.error is None and self.status < 400
+
+    @property
+    def domain(self):
+        return urlparse(self.final_url or self.url).netloc
+
+    def __str__(self):
+        outcome = self.error or f'{self.status} at {self.final_url}'
+        return f'{self.url}: {outcome}'
+
+
+class LinkChecker:
+    """Requests links with up to <max_workers> parallel requests, following redirects;
+    the results are cached by URL for the lifetime of the checker"""
+
+    def __init__(self, session, max_workers=8, timeout=15):
+        self.session = session
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self._results = {}
+        self._lock = threading.Lock()
+
+    def check(self, urls):
+        """Checks the http(s) links of <urls> and returns a {url: LinkResult} dict, in the
+        order of <urls>; other links (mailto:, javascript:) are left out"""
+        urls = list(
+            dict.fromkeys(
+                url for url in urls if urlparse(url).scheme in CHECKED_SCHEMES
+            )
+        )
+        with self._lock:
+            unchecked = [url for url in urls if url not in self._results]
+        if unchecked:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(unchecked))
+            ) as executor:
+                for result in executor.map(self._request, unchecked):
+                    with self._lock:
+                        self._results[result.url] = result
+        return {url: self._results[url] for url in urls}
+
+    def broken(self, urls):
+        """Returns the results of the links of <urls> that didn't get a successful response"""
+        return [result for result in self.check(urls).values() if not result.ok]
+
+    def _request(self, url):
+        try:
+            response = self.session.head(
+                url, allow_redirects=True, timeout=self.timeout
+            )
+            if response.status_code in HEAD_NOT_ALLOWED:
+                # the body is not needed, so it is not downloaded
+                with self.session.get(
+                    url, allow_redirects=True, timeout=self.timeout, stream=True
+                ) as response:
+                    pass
+        except requests.RequestException as error:
+            return LinkResult(url, error=f'{type(error).__name__}: {error}')
+        return LinkResult(
+            url,
+            status=response.status_code,
+            final_url=response.url,
+            redirects=[redirect.url for redirect in response.history],
+        )
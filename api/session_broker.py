@@ -0,0 +1,60 @@
+"""Cache of the user sessions created during a test run, used to log in every user
+through FxA only once and re-use the sessionid afterwards"""
+
+import time
+
+# the profile endpoint is the cheapest authenticated call we can make to check a session
+_profile = '/api/v5/accounts/profile/'
+
+
+class SessionBroker:
+    """Holds the sessionid of every user that logged in during the run. Sessions are
+    kept in memory and, if a <store> is given, saved there as well so that they can be
+    picked up by the other xdist workers. A cached session is checked against the
+    profile endpoint before being handed out again, but not more often than every
+    <revalidate_after> seconds."""
+
+    def __init__(self, client, store=None, revalidate_after=300):
+        self.client = client
+        self.store = store
+        self.revalidate_after = revalidate_after
+        # user -> (sessionid, time of the last successful validation)
+        self._sessions = {}
+
+    @property
+    def env(self):
+        return self.client.base_url
+
+    def is_valid(self, sessionid):
+        """Returns True if AMO still accepts the sessionid"""
+        response = self.client.get(_profile, auth=sessionid)
+        return response.status_code == 200
+
+    def get(self, user):
+        """Returns a valid sessionid for <user> or None if the user needs to log in"""
+        if user in self._sessions:
+            sessionid, validated_at = self._sessions[user]
+            if time.monotonic() - validated_at < self.revalidate_after:
+                return sessionid
+        elif self.store is not None:
+            # the user might have logged in on another worker
+            sessionid = self.store.get(user, self.env)
+            if sessionid is None:
+                return None
+        else:
+            return None
+        if self.is_valid(sessionid):
+            self._sessions[user] = (sessionid, time.monotonic())
+            return sessionid
+        self.invalidate(user)
+        return None
+
+    def store_session(self, user, sessionid, expires_at=None):
+        self._sessions[user] = (sessionid, time.monotonic())
+        if self.store is not None:
+            self.store.set(user, self.env, sessionid, expires_at)
+
+    def invalidate(self, user):
+        self._sessions.pop(user, None)
+        if self.store is not None:
+            self.store.delete(user, self.env)
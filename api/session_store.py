@@ -0,0 +1,64 @@
+"""Persistent store for the user sessions created during test runs; it replaces the
+<user>.txt files and can be shared safely by all the xdist workers of a run"""
+
+import sqlite3
+import time
+
+# used when the session cookie doesn't tell us when it expires
+DEFAULT_MAX_AGE = 24 * 60 * 60
+
+
+class SessionStore:
+    """Keeps the sessionid of each user per AMO environment (base_url) in a local SQLite
+    database, together with its expiry time. SQLite takes care of locking the file, so
+    several workers can read and write sessions at the same time; every operation runs
+    in its own short transaction."""
+
+    def __init__(self, path):
+        self.path = str(path)
+        with self._connect() as connection:
+            # WAL lets workers keep reading while another one is writing
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute(
+                'CREATE TABLE IF NOT EXISTS sessions ('
+                'user TEXT NOT NULL, env TEXT NOT NULL, sessionid TEXT NOT NULL, '
+                'created_at REAL NOT NULL, expires_at REAL NOT NULL, '
+                'PRIMARY KEY (user, env))'
+            )
+        connection.close()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def get(self, user, env):
+        """Returns the stored sessionid or None if there is none or if it expired"""
+        with self._connect() as connection:
+            row = connection.execute(
+                'SELECT sessionid, expires_at FROM sessions WHERE user = ? AND env = ?',
+                (user, env),
+            ).fetchone()
+            if row and row[1] <= time.time():
+                connection.execute(
+                    'DELETE FROM sessions WHERE user = ? AND env = ?', (user, env)
+                )
+                row = None
+        connection.close()
+        return row[0] if row else None
+
+    def set(self, user, env, sessionid, expires_at=None):
+        """Saves the sessionid of a user; <expires_at> is a unix timestamp, like the
+        'expiry' value of the cookies returned by selenium"""
+        now = time.time()
+        with self._connect() as connection:
+            connection.execute(
+                'INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?, ?)',
+                (user, env, sessionid, now, expires_at or now + DEFAULT_MAX_AGE),
+            )
+        connection.close()
+
+    def delete(self, user, env):
+        with self._connect() as connection:
+            connection.execute(
+                'DELETE FROM sessions WHERE user = ? AND env = ?', (user, env)
+            )
+        connection.close()
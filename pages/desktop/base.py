@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 import requests
 
 from pypom import Page, Region
@@ -11,6 +13,109 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
 
+class Element:
+    """Page or Region attribute returning the element matching <locator>, searched from
+    the region root for regions. The first access waits for the element to be displayed
+    (only to be present with visible=False) and takes the element returned by the wait;
+    the element is then kept by the page object and reused for as long as it is still
+    displayed, so that it is looked up again only after it became stale or hidden.
+        _title_locator = (By.CLASS_NAME, "AddonTitle")
+        title = Element(_title_locator)"""
+
+    def __init__(self, locator, visible=True, message=None):
+        self.locator = locator
+        self.visible = visible
+        self.message = message
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        elements = view.__dict__.setdefault("_elements", {})
+        element = elements.get(self.name)
+        if element is None or not self.is_usable(element):
+            element = view.wait.until(
+                self.locate(view),
+                message=self.message or f"{self.locator} was not displayed",
+            )
+            elements[self.name] = element
+        return element
+
+    def locate(self, view):
+        def displayed_element(_):
+            try:
+                element = view.find_element(*self.locator)
+                return element if not self.visible or element.is_displayed() else False
+            except StaleElementReferenceException:
+                return False
+
+        return displayed_element
+
+    def is_usable(self, element):
+        try:
+            return element.is_displayed() if self.visible else bool(element.tag_name)
+        except StaleElementReferenceException:
+            return False
+
+
+class Text(Element):
+    """Same as Element, but returns the text of the element; a kept element is only
+    looked up again if reading its text fails because it became stale"""
+
+    def __get__(self, view, owner=None):
+        if view is None:
+            return self
+        element = view.__dict__.get("_elements", {}).get(self.name)
+        if element is not None:
+            try:
+                return element.text
+            except StaleElementReferenceException:
+                del view.__dict__["_elements"][self.name]
+        return super().__get__(view, owner).text
+
+
+class RegionList(Sequence):
+    """The regions of all the elements matching <locator>, found with a single lookup and
+    kept for as long as they are in the page. A region is only created when it is first
+    accessed; if its element became stale (e.g. after navigating back to the page), all the
+    elements are looked up again.
+        versions = RegionList(page, _versions_list_locator, VersionCard)"""
+
+    def __init__(self, view, locator, region_class):
+        self.view = view
+        self.locator = locator
+        self.region_class = region_class
+        self._elements = None
+        self._regions = {}
+
+    def _find(self):
+        self._elements = self.view.find_elements(*self.locator)
+        self._regions = {}
+
+    def __len__(self):
+        if self._elements is None:
+            self._find()
+        return len(self._elements)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if self._elements is None:
+            self._find()
+        element = self._elements[index]
+        try:
+            element.tag_name
+        except StaleElementReferenceException:
+            self._find()
+            element = self._elements[index]
+        index = index % len(self._elements)
+        if index not in self._regions:
+            self._regions[index] = self.region_class(self.view, element)
+        return self._regions[index]
+
+
 class Base(Page):
     _url = "{base_url}"
     _amo_header = (By.CLASS_NAME, "Header")
@@ -112,6 +217,80 @@ class Base(Page):
         self.header.click_logout()
 
 
+# for every item matching a CSS selector, reads each field from the item (or from one of
+# its children) in the browser and returns the values as a list of dictionaries
+_extract_items_script = """
+const [root, itemSelector, fields] = arguments;
+return Array.from((root || document).querySelectorAll(itemSelector), (item) => {
+  const values = {};
+  for (const [name, [selector, property]] of Object.entries(fields)) {
+    const element = selector ? item.querySelector(selector) : item;
+    if (property === "displayed") {
+      values[name] = element !== null && element.getClientRects().length > 0;
+    } else if (element === null) {
+      values[name] = null;
+    } else if (property === "text") {
+      values[name] = element.innerText.trim();
+    } else {
+      values[name] = element[property] === undefined ? null : element[property];
+    }
+  }
+  return values;
+});
+"""
+
+
+def css_selector(locator):
+    """Converts a (By.<strategy>, value) locator to a CSS selector"""
+    strategy, value = locator
+    if strategy == By.CLASS_NAME:
+        return f".{value}"
+    if strategy == By.ID:
+        return f"#{value}"
+    assert strategy == By.CSS_SELECTOR, f"Cannot use a {strategy} locator in a CSS selector"
+    return value
+
+
+def extract_items(driver, item_locator, fields, root=None):
+    """Reads the fields of all the items matching <item_locator> with a single WebDriver
+    call, instead of one call per item and field. <fields> maps a name to a (locator,
+    property) tuple, where the locator is relative to the item (None for the item itself)
+    and the property is 'text', 'displayed' or a DOM property such as 'href' or 'title'.
+    Items are searched under the <root> element, if set, or in the whole page."""
+    fields = {
+        name: [css_selector(locator) if locator else None, prop]
+        for name, (locator, prop) in fields.items()
+    }
+    return driver.execute_script(
+        _extract_items_script, root, css_selector(item_locator), fields
+    )
+
+
+# reads the href of all the links matching each of several CSS selectors
+_extract_link_sections_script = """
+const [root, sections] = arguments;
+const links = {};
+for (const [name, selector] of Object.entries(sections)) {
+  links[name] = Array.from((root || document).querySelectorAll(selector), (link) => link.href);
+}
+return links;
+"""
+
+
+def extract_link_sections(driver, sections, root=None):
+    """Returns the target of the links of several sections of a page, by section, read
+    with a single WebDriver call; <sections> maps a name to the locator of its links"""
+    sections = {name: css_selector(locator) for name, locator in sections.items()}
+    return driver.execute_script(_extract_link_sections_script, root, sections)
+
+
+def extract_links(driver, link_locator, root=None):
+    """Returns the target of all the links matching <link_locator>, read with a single
+    WebDriver call; links are searched under the <root> element, if set"""
+    items = extract_items(driver, link_locator, {"url": (None, "href")}, root)
+    return [item["url"] for item in items]
+
+
 class Header(Region):
     _root_locator = (By.CLASS_NAME, "Header")
     _header_title_locator = (By.CLASS_NAME, "Header-title")
@@ -165,6 +344,13 @@ class Header(Region):
     _extension_workshop_locator = (By.CLASS_NAME, "Header-extension-workshop-link")
     _blog_link_locator = (By.CLASS_NAME, "Header-blog-link")
     _active_link_locator = (By.CLASS_NAME, "SectionLinks-link--active")
+    _links_locator = (By.CSS_SELECTOR, "a[href]")
+
+    @property
+    def link_urls(self):
+        """The target of every header link, including the ones of the dropdown menus"""
+        self.wait.until(EC.visibility_of_element_located(self._header_title_locator))
+        return extract_links(self.driver, self._links_locator, self.root)
 
     def click_extensions(self):
         self.wait.until(EC.element_to_be_clickable(self._extensions_locator))
@@ -482,6 +668,15 @@ class Footer(Region):
     _footer_copyright_links_locator = (By.CSS_SELECTOR, ".Footer-copyright a")
     _copyright_message_locator = (By.CSS_SELECTOR, ".Footer-copyright")
     _language_picker_locator = (By.ID, "lang-picker")
+    # the links of each footer section, read in one go by link_urls
+    _link_sections = {
+        "addons": (By.CSS_SELECTOR, ".Footer-amo-links .Footer-links li a"),
+        "browsers": (By.CSS_SELECTOR, ".Footer-browsers-links .Footer-links li a"),
+        "products": (By.CSS_SELECTOR, ".Footer-product-links .Footer-links li a"),
+        "social": (By.CSS_SELECTOR, ".Footer-links-social li a"),
+        "legal": (By.CSS_SELECTOR, ".Footer-legal-links li a"),
+        "copyright": _footer_copyright_links_locator,
+    }
 
     @property
     def addon_links(self):
@@ -533,6 +728,14 @@ class Footer(Region):
         )
         return self.find_elements(*self._footer_copyright_links_locator)
 
+    @property
+    def link_urls(self):
+        """The target of every footer link, by section, without clicking any of them"""
+        self.wait.until(
+            EC.visibility_of_element_located(self._footer_amo_links_locator)
+        )
+        return extract_link_sections(self.driver, self._link_sections, self.root)
+
     @property
     def copyright_message(self):
         self.wait.until(
@@ -1,7 +1,3 @@
-import time
-import pytest
-import requests
-
 from pypom import Region
 
 from selenium.common.exceptions import NoSuchElementException
@@ -13,6 +9,7 @@ from pages.desktop.base import Base
 from pages.desktop.developers.addons_manage import ManageAddons
 from pages.desktop.developers.edit_addon import EditAddon
 from pages.desktop.developers.submit_addon import SubmitAddon
+from scripts.restmail import mailbox
 
 
 class DevHubHome(Base):
@@ -579,23 +576,10 @@ class ConnectFooter(Region):
         ).text
 
     def check_newsletter_signup_email(self, email):
-        retry = 0
-        while retry < 10:
-            # verify that a response is available and get the email subject
-            request = requests.get(f"https://restmail.net/mail/{email}", timeout=10)
-            response = request.json()
-            if response:
-                confirmation = [key["subject"] for key in response]
-                return confirmation
-            elif not response:
-                print("Confirmation email not received yet")
-                # fail if we retired 10 times and there was no email received
-                if retry == 9:
-                    pytest.fail("Newsletter confirmation email was not sent")
-                # pause between subsequent requests to give more time to the email to be sent
-                time.sleep(2)
-                retry += 1
-        return self
+        """Waits for the newsletter confirmation email and returns the subjects of
+        all the emails received by the inbox at that point"""
+        mailbox.wait_for(email)
+        return [message["subject"] for message in mailbox.messages(email)]
 
 
 class ResourcesFooter(Region):
@@ -1,11 +1,10 @@
-import time
-
-import pytest
 from pypom import Region, Page
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
+from pages.desktop.base import Element, Text
+
 # from pages.desktop.developers.submit_addon import SubmitAddon
 
 
@@ -71,33 +70,10 @@ class ManageVersions(Page):
         self.wait.until(EC.visibility_of_element_located(self._version_list_locator))
         return self
 
-    @property
-    def version_page_title(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._addon_name_title_locator)
-        )
-        return self.find_element(*self._addon_name_title_locator).text
-
-    @property
-    def listing_visibility_section(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._listing_visibility_section_locator)
-        )
-        return self.find_element(*self._listing_visibility_section_locator).text
-
-    @property
-    def cancel_request_review_button(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._cancel_request_review_button_locator)
-        )
-        return self.find_element(*self._cancel_request_review_button_locator)
-
-    @property
-    def request_review_button(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._request_review_button_locator)
-        )
-        return self.find_element(*self._request_review_button_locator)
+    version_page_title = Text(_addon_name_title_locator)
+    listing_visibility_section = Text(_listing_visibility_section_locator)
+    cancel_request_review_button = Element(_cancel_request_review_button_locator)
+    request_review_button = Element(_request_review_button_locator)
 
     def click_request_review_button(self):
         self.wait.until(
@@ -124,33 +100,10 @@ class ManageVersions(Page):
         el.click()
         assert el.is_selected()
 
-    @property
-    def incomplete_status_text(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._incomplete_status_locator)
-        )
-        return self.find_element(*self._incomplete_status_locator)
-
-    @property
-    def disabled_by_mozilla_text(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._disabled_by_mozilla_locator)
-        )
-        return self.find_element(*self._disabled_by_mozilla_locator)
-
-    @property
-    def visible_status_explainer(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._visible_explainer_text_locator)
-        )
-        return self.find_element(*self._visible_explainer_text_locator).text
-
-    @property
-    def invisible_status_explainer(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._invisible_explainer_text_locator)
-        )
-        return self.find_element(*self._invisible_explainer_text_locator).text
+    incomplete_status_text = Element(_incomplete_status_locator)
+    disabled_by_mozilla_text = Element(_disabled_by_mozilla_locator)
+    visible_status_explainer = Text(_visible_explainer_text_locator)
+    invisible_status_explainer = Text(_invisible_explainer_text_locator)
 
     def set_addon_invisible(self):
         """Selects the Invisible option and checks that the radio button is selected"""
@@ -165,38 +118,16 @@ class ManageVersions(Page):
     def click_hide_addon(self):
         self.find_element(*self._hide_addon_button_locator).click()
 
-    @property
-    def hide_addon_confirmation_text(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._hide_addon_confirmation_text_locator)
-        )
-        return self.find_element(*self._hide_addon_confirmation_text_locator).text
+    hide_addon_confirmation_text = Text(_hide_addon_confirmation_text_locator)
 
     def cancel_hide_addon_process(self):
         """Cancel the hide addon process and check that the Visible radio button is still selected"""
         self.find_element(*self._hide_addon_cancel_link_locator).click()
         assert self.find_element(*self._visible_listing_radio_locator).is_selected()
 
-    @property
-    def addon_listed_status(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._addon_listed_status_locator)
-        )
-        return self.find_element(*self._addon_listed_status_locator).text
-
-    @property
-    def incomplete_status(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._incomplete_status_locator)
-        )
-        return self.find_element(*self._incomplete_status_locator)
-
-    @property
-    def current_version_status(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._current_version_status_locator)
-        )
-        return self.find_element(*self._current_version_status_locator).text
+    addon_listed_status = Text(_addon_listed_status_locator)
+    incomplete_status = Element(_incomplete_status_locator)
+    current_version_status = Text(_current_version_status_locator)
 
     @property
     def version_approval_status(self):
@@ -214,19 +145,8 @@ class ManageVersions(Page):
             message="The Delete/Disable modal was not opened",
         )
 
-    @property
-    def delete_disable_version_helptext(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._delete_version_help_text_locator)
-        )
-        return self.find_element(*self._delete_version_help_text_locator).text
-
-    @property
-    def delete_disable_version_warning(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._delete_version_warning_locator)
-        )
-        return self.find_element(*self._delete_version_warning_locator).text
+    delete_disable_version_helptext = Text(_delete_version_help_text_locator)
+    delete_disable_version_warning = Text(_delete_version_warning_locator)
 
     def click_delete_version_button(self):
         self.wait.until(EC.element_to_be_clickable(self._delete_version_button_locator))
@@ -249,27 +169,6 @@ class ManageVersions(Page):
         self.wait.until(EC.element_to_be_clickable(self._enable_version_button_locator))
         self.find_element(*self._enable_version_button_locator).click()
 
-    def wait_for_version_autoapproval(self, value):
-        """Method that verifies if auto-approval occurs within a set time"""
-        timeout_start = time.time()
-        # auto-approvals should normally take ~5 minutes;
-        # set a loop to verify if approval occurs within this interval
-        while time.time() < timeout_start + 420:
-            # refresh the page to check if the status has changed
-            self.driver.refresh()
-            if value not in self.version_approval_status[0].text:
-                # wait 30 seconds before we refresh again
-                time.sleep(30)
-            # break the loop if the status changed to the expected value within set time
-            else:
-                break
-        # if auto-approval took longer than normal, we want to fail the test and capture the final status
-        else:
-            pytest.fail(
-                f"Autoapproval took longer than normal; "
-                f'Addon final status was "{self.version_approval_status[0].text}" instead of "{value}"'
-            )
-
     def delete_addon(self):
         self.find_element(*self._delete_addon_button_locator).click()
         return self.DeleteAddonModal(self).wait_for_region_to_load()
@@ -289,9 +289,11 @@ class SubmitAddon(Page):
         return self.find_elements(*self._file_upload_process_helptext_locator)
 
     def upload_addon(self, addon):
-        """Selects an addon from the 'sample-addons' folder and uploads it"""
+        """Selects an addon from the 'sample-addons' folder and uploads it; <addon> can
+        also be the full path of an archive, e.g. one built by api_helpers.make_addon_file"""
         button = self.find_element(*self._upload_file_button_locator)
-        archive = Path(f"{os.getcwd()}/sample-addons/{addon}")
+        # joining an absolute path keeps it as it is
+        archive = Path(os.getcwd(), "sample-addons", addon)
         button.send_keys(str(archive))
 
     @property
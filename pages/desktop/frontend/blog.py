@@ -1,3 +1,5 @@
+from dataclasses import dataclass
+
 from pypom import Region
 
 from selenium.common.exceptions import NoSuchElementException
@@ -5,7 +7,22 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
 
-from pages.desktop.base import Base
+from pages.desktop.base import Base, Element, Text, extract_items
+
+
+@dataclass
+class ArticleData:
+    """The details of a blog article card, read in bulk by BlogHomepage.articles_data"""
+
+    title: str
+    date: str
+    intro_text: str
+    url: str
+    image_displayed: bool
+    title_displayed: bool
+    date_displayed: bool
+    intro_text_displayed: bool
+    read_more_link_displayed: bool
 
 
 class BlogHomepage(Base):
@@ -18,6 +35,28 @@ class BlogHomepage(Base):
         items = self.find_elements(*self._articles_locator)
         return [self.ArticlesList(self, el) for el in items]
 
+    @property
+    def articles_data(self):
+        """Returns the details of all the articles, read with one WebDriver call"""
+        item = self.ArticlesList
+        self.wait.until(EC.visibility_of_element_located(self._articles_locator))
+        items = extract_items(
+            self.driver,
+            self._articles_locator,
+            {
+                "title": (item._title_locator, "text"),
+                "date": (item._date_locator, "text"),
+                "intro_text": (item._intro_text_locator, "text"),
+                "url": (item._read_more_link_locator, "href"),
+                "image_displayed": (item._image_locator, "displayed"),
+                "title_displayed": (item._title_locator, "displayed"),
+                "date_displayed": (item._date_locator, "displayed"),
+                "intro_text_displayed": (item._intro_text_locator, "displayed"),
+                "read_more_link_displayed": (item._read_more_link_locator, "displayed"),
+            },
+        )
+        return [ArticleData(**values) for values in items]
+
     class ArticlesList(Region):
         _image_locator = (By.CSS_SELECTOR, ".blog-entry-featured-image > img")
         _image_link_locator = (By.CSS_SELECTOR, ".blog-entry-featured-image")
@@ -26,30 +65,11 @@ class BlogHomepage(Base):
         _intro_text_locator = (By.CSS_SELECTOR, ".blog-entry-excerpt > p:nth-child(1)")
         _read_more_link_locator = (By.CSS_SELECTOR, ".blog-entry-read-more > a")
 
-        @property
-        def image(self):
-            self.wait.until(EC.visibility_of_element_located(self._image_locator))
-            return self.find_element(*self._image_locator)
-
-        @property
-        def title(self):
-            self.wait.until(EC.visibility_of_element_located(self._image_locator))
-            return self.find_element(*self._title_locator)
-
-        @property
-        def date(self):
-            self.wait.until(EC.visibility_of_element_located(self._image_locator))
-            return self.find_element(*self._date_locator)
-
-        @property
-        def intro_text(self):
-            self.wait.until(EC.visibility_of_element_located(self._image_locator))
-            return self.find_element(*self._intro_text_locator)
-
-        @property
-        def read_more_link(self):
-            self.wait.until(EC.visibility_of_element_located(self._image_locator))
-            return self.find_element(*self._read_more_link_locator)
+        image = Element(_image_locator)
+        title = Element(_title_locator)
+        date = Element(_date_locator)
+        intro_text = Element(_intro_text_locator)
+        read_more_link = Element(_read_more_link_locator)
 
         def click_read_more_link(self):
             self.wait.until(EC.element_to_be_clickable(self._image_locator))
@@ -119,27 +139,10 @@ class ArticlePage(Base):
         _twitter_link_locator = (By.CLASS_NAME, "share-twitter-link")
         _pocket_link_locator = (By.CLASS_NAME, "share-pocket-link")
 
-        @property
-        def name(self):
-            self.wait.until(EC.visibility_of_element_located(self._name_locator))
-            return self.find_element(*self._name_locator)
-
-        @property
-        def picture(self):
-            self.wait.until(EC.visibility_of_element_located(self._picture_locator))
-            return self.find_element(*self._picture_locator)
-
-        @property
-        def twitter_link(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._twitter_link_locator)
-            )
-            return self.find_element(*self._twitter_link_locator)
-
-        @property
-        def pocket_link(self):
-            self.wait.until(EC.visibility_of_element_located(self._pocket_link_locator))
-            return self.find_element(*self._pocket_link_locator)
+        name = Element(_name_locator)
+        picture = Element(_picture_locator)
+        twitter_link = Element(_twitter_link_locator)
+        pocket_link = Element(_pocket_link_locator)
 
     @property
     def addon_cards(self):
@@ -160,20 +163,9 @@ class ArticlePage(Base):
             "PromotedBadge-link--recommended",
         )
 
-        @property
-        def title(self):
-            self.wait.until(EC.visibility_of_element_located(self._title_locator))
-            return self.find_element(*self._title_locator)
-
-        @property
-        def author(self):
-            self.wait.until(EC.visibility_of_element_located(self._author_locator))
-            return self.find_element(*self._author_locator)
-
-        @property
-        def summary(self):
-            self.wait.until(EC.visibility_of_element_located(self._summary_locator))
-            return self.find_element(*self._summary_locator).text
+        title = Element(_title_locator)
+        author = Element(_author_locator)
+        summary = Text(_summary_locator)
 
         @property
         def rating(self):
@@ -194,12 +186,7 @@ class ArticlePage(Base):
                 .replace(",", "")
             )
 
-        @property
-        def add_to_firefox_button(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._add_to_firefox_button_locator)
-            )
-            return self.find_element(*self._add_to_firefox_button_locator)
+        add_to_firefox_button = Element(_add_to_firefox_button_locator)
 
         @property
         def is_recommended(self):
@@ -211,9 +198,4 @@ class ArticlePage(Base):
             except NoSuchElementException:
                 return False
 
-        @property
-        def recommended_link(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._recommended_badge_link_locator)
-            )
-            return self.find_element(*self._recommended_badge_link_locator)
+        recommended_link = Element(_recommended_badge_link_locator)
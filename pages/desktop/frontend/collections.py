@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+from typing import Optional
+
 import pytest
 from pypom import Region
 
@@ -6,7 +9,18 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.wait import WebDriverWait
 
-from pages.desktop.base import Base
+from pages.desktop.base import Base, Element, Text, extract_items
+
+
+@dataclass
+class CollectionData:
+    """The details of a collection from My collections, read in bulk by Collections.list_data"""
+
+    name: str
+    url: str
+    addons_count: Optional[str]
+    name_displayed: bool
+    addons_count_displayed: bool
 
 
 class Collections(Base):
@@ -37,25 +51,31 @@ class Collections(Base):
         return [self.Collection(self, el) for el in items]
 
     @property
-    def collections_list_header(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._my_collections_list_header_locator)
-        )
-        return self.find_element(*self._my_collections_list_header_locator).text
-
-    @property
-    def collections_summary_card_header(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._collections_card_header_locator)
+    def list_data(self):
+        """Returns the details of all the collections from My Collections page,
+        read with one WebDriver call"""
+        self.wait.until(EC.visibility_of_element_located(self._collection_item_locator))
+        item = self.Collection
+        items = extract_items(
+            self.driver,
+            self._collection_item_locator,
+            {
+                "name": (item._name_locator, "text"),
+                "url": (item._link_locator, "href"),
+                "addons_count": (item._addon_number_locator, "text"),
+                "name_displayed": (item._name_locator, "displayed"),
+                "addons_count_displayed": (item._addon_number_locator, "displayed"),
+            },
         )
-        return self.find_element(*self._collections_card_header_locator).text
+        for values in items:
+            # same format as Collection.list_addons_count
+            count = (values["addons_count"] or "").split()[:1]
+            values["addons_count"] = count[0] if count else None
+        return [CollectionData(**values) for values in items]
 
-    @property
-    def collections_card_summary(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._collections_card_summary_locator)
-        )
-        return self.find_element(*self._collections_card_summary_locator).text
+    collections_list_header = Text(_my_collections_list_header_locator)
+    collections_summary_card_header = Text(_collections_card_header_locator)
+    collections_card_summary = Text(_collections_card_summary_locator)
 
     def select_collection(self, count):
         # wait needed to avoid a weird bug on the site where you land on the
@@ -68,12 +88,7 @@ class Collections(Base):
     def collection_detail(self):
         return self.CollectionDetail(self)
 
-    @property
-    def create_collection_button(self):
-        self.wait.until(
-            EC.visibility_of_element_located(self._collections_create_button_locator)
-        )
-        return self.find_element(*self._collections_create_button_locator)
+    create_collection_button = Element(_collections_create_button_locator)
 
     def click_create_collection(self):
         self.find_element(*self._collections_create_button_locator).click()
@@ -95,22 +110,9 @@ class Collections(Base):
         _link_locator = (By.CLASS_NAME, "UserCollection-link")
         _addon_number_locator = (By.CLASS_NAME, "UserCollection-number")
 
-        @property
-        def name(self):
-            self.wait.until(EC.visibility_of_element_located(self._name_locator))
-            return self.find_element(*self._name_locator)
-
-        @property
-        def link(self):
-            self.wait.until(EC.visibility_of_element_located(self._link_locator))
-            return self.find_element(*self._link_locator)
-
-        @property
-        def number_of_addons(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._addon_number_locator)
-            )
-            return self.find_element(*self._addon_number_locator)
+        name = Element(_name_locator)
+        link = Element(_link_locator)
+        number_of_addons = Element(_addon_number_locator)
 
         @property
         def list_addons_count(self):
@@ -143,10 +145,7 @@ class Collections(Base):
         def set_name(self, value):
             self.find_element(*self._name_input_locator).send_keys(value)
 
-        @property
-        def name_value(self):
-            self.wait.until(EC.visibility_of_element_located(self._name_input_locator))
-            return self.find_element(*self._name_input_locator)
+        name_value = Element(_name_input_locator)
 
         def set_description(self, value):
             self.wait.until(
@@ -160,41 +159,15 @@ class Collections(Base):
             )
             self.find_element(*self._description_input_locator).clear()
 
-        @property
-        def description_value(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._description_input_locator)
-            )
-            return self.find_element(*self._description_input_locator).text
+        description_value = Text(_description_input_locator)
 
         def set_slug(self, value):
             self.find_element(*self._slug_input_locator).send_keys(value)
 
-        @property
-        def slug_value(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._description_input_locator)
-            )
-            return self.find_element(*self._description_input_locator).text
-
-        @property
-        def slug_label_element(self):
-            self.wait.until(EC.visibility_of_element_located(self._slug_input_locator))
-            return self.find_element(*self._slug_input_locator)
-
-        @property
-        def cancel_creation(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._cancel_button_locator)
-            )
-            return self.find_element(*self._cancel_button_locator)
-
-        @property
-        def create_button_disabled(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._create_button_disabled_locator)
-            )
-            return self.find_element(*self._create_button_disabled_locator)
+        slug_value = Text(_description_input_locator)
+        slug_label_element = Element(_slug_input_locator)
+        cancel_creation = Element(_cancel_button_locator)
+        create_button_disabled = Element(_create_button_disabled_locator)
 
         def save_collection(self):
             self.find_element(*self._create_button_locator).click()
@@ -204,12 +177,7 @@ class Collections(Base):
                 .wait_for_details_to_load()
             )
 
-        @property
-        def warning_text(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._warning_text_locator)
-            )
-            return self.find_element(*self._warning_text_locator).text
+        warning_text = Text(_warning_text_locator)
 
         @property
         def addon_search(self):
@@ -228,10 +196,7 @@ class Collections(Base):
                 ".AutoSearchInput-suggestions-item",
             )
 
-            @property
-            def header(self):
-                self.wait.until(EC.visibility_of_element_located(self._header_locator))
-                return self.find_element(*self._header_locator)
+            header = Element(_header_locator)
 
             def search(self, term):
                 textbox = self.find_element(*self._search_field_locator)
@@ -255,12 +220,7 @@ class Collections(Base):
             class SearchItems(Region):
                 _item_name_locator = (By.CSS_SELECTOR, ".SearchSuggestion-name")
 
-                @property
-                def name(self):
-                    self.wait.until(
-                        EC.visibility_of_element_located(self._item_name_locator)
-                    )
-                    return self.find_element(*self._item_name_locator)
+                name = Element(_item_name_locator)
 
         @property
         def addon_add_confirmation(self):
@@ -324,12 +284,7 @@ class Collections(Base):
                 "EditableCollectionAddon-remove-button",
             )
 
-            @property
-            def edit_list_addon_name(self):
-                self.wait.until(
-                    EC.visibility_of_element_located(self._edit_list_addon_name_locator)
-                )
-                return self.find_element(*self._edit_list_addon_name_locator).text
+            edit_list_addon_name = Text(_edit_list_addon_name_locator)
 
             def click_add_note(self):
                 self.find_element(*self._add_note_button_locator).click()
@@ -344,12 +299,7 @@ class Collections(Base):
             def clear_collection_note_text_field(self):
                 self.find_element(*self._add_note_textarea_locator).clear()
 
-            @property
-            def note_input_value(self):
-                self.wait.until(
-                    EC.visibility_of_element_located(self._add_note_textarea_locator)
-                )
-                return self.find_element(*self._add_note_textarea_locator).text
+            note_input_value = Text(_add_note_textarea_locator)
 
             def click_save_note(self):
                 self.find_element(*self._save_note_button_locator).click()
@@ -358,12 +308,7 @@ class Collections(Base):
                     message="The collection addon note was not visible after saving",
                 )
 
-            @property
-            def note_text(self):
-                self.wait.until(
-                    EC.visibility_of_element_located(self._note_text_locator)
-                )
-                return self.find_element(*self._note_text_locator).text
+            note_text = Text(_note_text_locator)
 
             def click_edit_note(self):
                 self.find_element(*self._edit_addon_note_button_locator).click()
@@ -448,34 +393,11 @@ class Collections(Base):
             )
             return self
 
-        @property
-        def collection_name(self):
-            self.wait.until(EC.visibility_of_element_located(self._name_locator))
-            return self.find_element(*self._name_locator).text
-
-        @property
-        def collection_description(self):
-            self.wait.until(EC.visibility_of_element_located(self._summary_locator))
-            return self.find_element(*self._summary_locator)
-
-        @property
-        def collection_addons_number(self):
-            self.wait.until(EC.visibility_of_element_located(self._addon_count_locator))
-            return self.find_element(*self._addon_count_locator)
-
-        @property
-        def collection_creator(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._collection_creator_locator)
-            )
-            return self.find_element(*self._collection_creator_locator)
-
-        @property
-        def collection_last_update_date(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._last_modified_date_locator)
-            )
-            return self.find_element(*self._last_modified_date_locator)
+        collection_name = Text(_name_locator)
+        collection_description = Element(_summary_locator)
+        collection_addons_number = Element(_addon_count_locator)
+        collection_creator = Element(_collection_creator_locator)
+        collection_last_update_date = Element(_last_modified_date_locator)
 
         @property
         def collection_stats(self):
@@ -527,19 +449,8 @@ class Collections(Base):
                 message="The delete collection confirmation section was not displayed",
             )
 
-        @property
-        def confirm_delete_dialog_message(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._confirm_delete_dialog_locator)
-            )
-            return self.find_element(*self._confirm_delete_dialog_locator)
-
-        @property
-        def cancel_delete_collection_button(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._cancel_delete_button_locator)
-            )
-            return self.find_element(*self._cancel_delete_button_locator)
+        confirm_delete_dialog_message = Element(_confirm_delete_dialog_locator)
+        cancel_delete_collection_button = Element(_cancel_delete_button_locator)
 
         def cancel_delete_collection(self):
             self.wait.until(
@@ -551,12 +462,7 @@ class Collections(Base):
                 message="The delete collection confirmation section could not be closed",
             )
 
-        @property
-        def confirm_delete_collection_button(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._confirm_delete_button_locator)
-            )
-            return self.find_element(*self._confirm_delete_button_locator)
+        confirm_delete_collection_button = Element(_confirm_delete_button_locator)
 
         def confirm_delete_collection(self):
             self.wait.until(
@@ -565,9 +471,4 @@ class Collections(Base):
             self.find_element(*self._confirm_delete_button_locator).click()
             return Collections(self.driver, self.page).wait_for_page_to_load()
 
-        @property
-        def sort_addons(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._collection_addons_sort_locator)
-            )
-            return self.find_element(*self._collection_addons_sort_locator)
+        sort_addons = Element(_collection_addons_sort_locator)
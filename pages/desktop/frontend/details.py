@@ -1,5 +1,7 @@
 import time
 
+from functools import cached_property
+
 from pypom import Region
 
 from selenium.webdriver.common.by import By
@@ -7,7 +9,7 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as expected
 from selenium.webdriver.support import expected_conditions as EC
 
-from pages.desktop.base import Base
+from pages.desktop.base import Base, Element, Text, extract_link_sections, extract_links
 from pages.desktop.frontend.reviews import Reviews
 from pages.desktop.frontend.versions import Versions
 
@@ -42,6 +44,17 @@ class Detail(Base):
     _card_header_text_message = (By.CSS_SELECTOR, ".Card-header-text")
     _why_was_it_blocked_message = (By.CSS_SELECTOR, ".Card-contents > h2")
     _block_metadata_message = (By.CSS_SELECTOR, ".Block-metadata")
+    # the links set by the developer, which AMO sends through its outgoing redirector
+    _outgoing_link_sections = {
+        "description": (By.CSS_SELECTOR, ".AddonDescription-contents a"),
+        "developer comments": (By.CSS_SELECTOR, ".Addon-developer-comments-contents a"),
+        "homepage": (By.CSS_SELECTOR, ".AddonMoreInfo-homepage-link"),
+        "support site": (By.CSS_SELECTOR, ".AddonMoreInfo-support-link"),
+        "release notes": (
+            By.CSS_SELECTOR,
+            ".AddonDescription-version-notes .ShowMoreCard-contents a",
+        ),
+    }
 
     def wait_for_page_to_load(self):
         """Waits for various page components to be loaded"""
@@ -70,20 +83,9 @@ class Detail(Base):
     def is_compatible(self):
         return not self.is_element_displayed(*self._compatible_locator)
 
-    @property
-    def incompatibility_message(self):
-        self.wait_for_element_to_be_displayed(self._compatible_locator)
-        return self.find_element(*self._compatible_locator).text
-
-    @property
-    def compatibility_banner(self):
-        self.wait_for_element_to_be_displayed(self._new_compatibility_banner_locator)
-        return self.find_element(*self._new_compatibility_banner_locator)
-
-    @property
-    def get_firefox_button(self):
-        self.wait_for_element_to_be_displayed(self._get_firefox_button_locator)
-        return self.find_element(*self._get_firefox_button_locator)
+    incompatibility_message = Text(_compatible_locator)
+    compatibility_banner = Element(_new_compatibility_banner_locator)
+    get_firefox_button = Element(_get_firefox_button_locator)
 
     def install(self):
         self.find_element(*self._install_button_locator).click()
@@ -130,34 +132,16 @@ class Detail(Base):
             expected.visibility_of_element_located((By.CLASS_NAME, "sumo-page-heading"))
         )
 
-    @property
-    def experimental_badge(self):
-        self.wait_for_element_to_be_displayed(self._experimental_badge_locator)
-        return self.find_element(*self._experimental_badge_locator)
-
-    @property
-    def addon_icon(self):
-        self.wait_for_element_to_be_displayed(self._addon_icon_locator)
-        return self.find_element(*self._addon_icon_locator)
+    experimental_badge = Element(_experimental_badge_locator)
+    addon_icon = Element(_addon_icon_locator)
 
     @property
     def authors(self):
         return self.find_element(*self._addon_author_locator)
 
-    @property
-    def summary(self):
-        self.wait_for_element_to_be_displayed(self._summary_locator)
-        return self.find_element(*self._summary_locator)
-
-    @property
-    def install_warning(self):
-        self.wait_for_element_to_be_displayed(self._install_warning_locator)
-        return self.find_element(*self._install_warning_locator)
-
-    @property
-    def install_warning_message(self):
-        self.wait_for_element_to_be_displayed(self._install_warning_text_locator)
-        return self.find_element(*self._install_warning_text_locator).text
+    summary = Element(_summary_locator)
+    install_warning = Element(_install_warning_locator)
+    install_warning_message = Text(_install_warning_text_locator)
 
     def click_install_warning_button(self):
         # clicks on the install warning and waits for the sumo page to load
@@ -175,58 +159,64 @@ class Detail(Base):
         self.wait_for_element_to_be_clickable(self._non_public_addon_notice_locator)
         return self.find_element(*self._non_public_addon_notice_locator)
 
-    @property
+    @cached_property
     def stats(self):
         return self.Stats(self)
 
-    @property
+    @cached_property
     def contribute(self):
         return self.Contribute(self)
 
-    @property
+    @cached_property
     def permissions(self):
         return self.Permissions(self)
 
-    @property
+    @cached_property
     def more_info(self):
         return self.MoreInfo(self)
 
-    @property
+    @cached_property
     def screenshots(self):
         return self.Screenshots(self)
 
-    @property
+    @cached_property
     def release_notes(self):
         return self.ReleaseNotes(self)
 
-    @property
+    @cached_property
     def same_author_addons(self):
         return self.AddonsByAuthor(self)
 
-    @property
+    @cached_property
     def add_to_collection(self):
         return self.AddToCollection(self)
 
-    @property
+    @cached_property
     def description(self):
         return self.AddonDescription(self)
 
-    @property
+    @cached_property
     def developer_comments(self):
         return self.DeveloperComments(self)
 
-    @property
+    @cached_property
     def recommendations(self):
         return self.AddonRecommendations(self)
 
-    @property
+    @cached_property
     def ratings(self):
         return self.Ratings(self)
 
-    @property
+    @cached_property
     def themes(self):
         return self.Theme(self)
 
+    @property
+    def outgoing_link_urls(self):
+        """The target of the links of the description, developer comments, more info card
+        and release notes, by section, read with a single WebDriver call"""
+        return extract_link_sections(self.driver, self._outgoing_link_sections)
+
     @property
     def addon_info_text(self):
         """used for privacy policy and license agreement"""
@@ -278,10 +268,7 @@ class Detail(Base):
         _rating_bar_locator = (By.CSS_SELECTOR, ".RatingsByStar-barContainer")
         _rating_bar_count_locator = (By.CSS_SELECTOR, ".RatingsByStar-count")
 
-        @property
-        def addon_user_stats(self):
-            self.wait.until(EC.visibility_of_element_located(self._stats_users_locator))
-            return self.find_element(*self._stats_users_locator)
+        addon_user_stats = Element(_stats_users_locator)
 
         @property
         def stats_users_count(self):
@@ -292,12 +279,7 @@ class Detail(Base):
         def no_user_stats(self):
             return self.addon_user_stats.find_element(By.CSS_SELECTOR, "dt").text
 
-        @property
-        def addon_reviews_stats(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._stats_reviews_locator)
-            )
-            return self.find_element(*self._stats_reviews_locator)
+        addon_reviews_stats = Element(_stats_reviews_locator)
 
         @property
         def stats_reviews_count(self):
@@ -312,12 +294,7 @@ class Detail(Base):
         def no_reviews_stats(self):
             return self.addon_reviews_stats.find_element(By.CSS_SELECTOR, "dt").text
 
-        @property
-        def addon_star_rating_stats(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._stats_ratings_locator)
-            )
-            return self.find_element(*self._stats_ratings_locator)
+        addon_star_rating_stats = Element(_stats_ratings_locator)
 
         @property
         def rating_score_tile(self):
@@ -328,12 +305,7 @@ class Detail(Base):
                 "title"
             )
 
-        @property
-        def rating_title(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._rating_title_locator)
-            )
-            return self.find_element(*self._rating_title_locator)
+        rating_title = Element(_rating_title_locator)
 
         @property
         def no_star_ratings(self):
@@ -364,12 +336,7 @@ class Detail(Base):
         _contribute_button_locator = (By.CLASS_NAME, "ContributeCard-button")
         _contribute_button_icon_locator = (By.CLASS_NAME, "Icon-heart")
 
-        @property
-        def contribute_card_header(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._contribute_header_locator)
-            )
-            return self.find_element(*self._contribute_header_locator).text
+        contribute_card_header = Text(_contribute_header_locator)
 
         @property
         def contribute_card_content(self):
@@ -378,19 +345,8 @@ class Detail(Base):
             )
             return self.find_element(*self._contribute_content_locator).text
 
-        @property
-        def contribute_button_text(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._contribute_button_locator)
-            )
-            return self.find_element(*self._contribute_button_locator).text
-
-        @property
-        def contribute_button_heart_icon(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._contribute_button_icon_locator)
-            )
-            return self.find_element(*self._contribute_button_icon_locator)
+        contribute_button_text = Text(_contribute_button_locator)
+        contribute_button_heart_icon = Element(_contribute_button_icon_locator)
 
         def click_contribute_button(self):
             self.find_element(*self._contribute_button_locator).click()
@@ -407,12 +363,7 @@ class Detail(Base):
         _permissions_learn_more_locator = (By.CLASS_NAME, "PermissionsCard-learn-more")
         _learn_more_button_icon_locator = (By.CLASS_NAME, "Icon-external-dark")
 
-        @property
-        def permissions_card_header(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._permissions_header_locator)
-            )
-            return self.find_element(*self._permissions_header_locator).text
+        permissions_card_header = Text(_permissions_header_locator)
 
         @property
         def permissions_list(self):
@@ -422,19 +373,8 @@ class Detail(Base):
             items = self.find_elements(*self._permissions_list_locator)
             return [self.PermissionDetails(self.page, el) for el in items]
 
-        @property
-        def permissions_learn_more_button(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._permissions_learn_more_locator)
-            )
-            return self.find_element(*self._permissions_learn_more_locator).text
-
-        @property
-        def permissions_learn_more_button_icon(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._learn_more_button_icon_locator)
-            )
-            return self.find_element(*self._learn_more_button_icon_locator)
+        permissions_learn_more_button = Text(_permissions_learn_more_locator)
+        permissions_learn_more_button_icon = Element(_learn_more_button_icon_locator)
 
         def click_permissions_button(self):
             self.wait.until(
@@ -449,21 +389,8 @@ class Detail(Base):
             _permission_icon_locator = (By.CSS_SELECTOR, ".Permission .Icon")
             _permission_description_locator = (By.CLASS_NAME, "Permission-description")
 
-            @property
-            def permission_icon(self):
-                self.wait.until(
-                    EC.visibility_of_element_located(self._permission_icon_locator)
-                )
-                return self.find_element(*self._permission_icon_locator)
-
-            @property
-            def permission_description(self):
-                self.wait.until(
-                    EC.visibility_of_element_located(
-                        self._permission_description_locator
-                    )
-                )
-                return self.find_element(*self._permission_description_locator)
+            permission_icon = Element(_permission_icon_locator)
+            permission_description = Element(_permission_description_locator)
 
     class MoreInfo(Region):
         _more_info_header_locator = (By.CSS_SELECTOR, ".AddonMoreInfo header")
@@ -487,12 +414,7 @@ class Detail(Base):
         _all_versions_locator = (By.CLASS_NAME, "AddonMoreInfo-version-history-link")
         _addon_tags_locator = (By.CSS_SELECTOR, ".AddonMoreInfo-tag-links-list a")
 
-        @property
-        def more_info_card_header(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._more_info_header_locator)
-            )
-            return self.find_element(*self._more_info_header_locator).text
+        more_info_card_header = Text(_more_info_header_locator)
 
         @property
         def addon_support_links(self):
@@ -501,38 +423,11 @@ class Detail(Base):
             )
             return self.find_elements(*self._support_links_locator)
 
-        @property
-        def addon_homepage_link(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._homepage_link_locator)
-            )
-            return self.find_element(*self._homepage_link_locator)
-
-        @property
-        def addon_support_site_link(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._support_site_link_locator)
-            )
-            return self.find_element(*self._support_site_link_locator)
-
-        @property
-        def addon_version_number(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._version_number_locator)
-            )
-            return self.find_element(*self._version_number_locator)
-
-        @property
-        def addon_size(self):
-            self.wait.until(EC.visibility_of_element_located(self._addon_size_locator))
-            return self.find_element(*self._addon_size_locator)
-
-        @property
-        def addon_last_update_date(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._last_updated_locator)
-            )
-            return self.find_element(*self._last_updated_locator)
+        addon_homepage_link = Element(_homepage_link_locator)
+        addon_support_site_link = Element(_support_site_link_locator)
+        addon_version_number = Element(_version_number_locator)
+        addon_size = Element(_addon_size_locator)
+        addon_last_update_date = Element(_last_updated_locator)
 
         @property
         def addon_categories(self):
@@ -541,21 +436,8 @@ class Detail(Base):
             )
             return self.find_elements(*self._addon_categories_locator)
 
-        @property
-        def addon_external_license_text(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._addon_license_locator)
-            )
-            return self.find_element(*self._addon_license_locator).text
-
-        @property
-        def addon_all_rights_reserved_license_text(self):
-            self.wait.until(
-                EC.visibility_of_element_located(
-                    self._all_rights_reserved_license_locator
-                )
-            )
-            return self.find_element(*self._all_rights_reserved_license_locator).text
+        addon_external_license_text = Text(_addon_license_locator)
+        addon_all_rights_reserved_license_text = Text(_all_rights_reserved_license_locator)
 
         def click_addon_external_license(self):
             self.wait.until(EC.element_to_be_clickable(self._addon_license_locator))
@@ -599,6 +481,7 @@ class Detail(Base):
             )
             _license_and_privacy_text_locator = (By.CSS_SELECTOR, ".AddonInfo-info p")
             _addon_summary_card_locator = (By.CSS_SELECTOR, ".AddonSummaryCard")
+            _license_and_privacy_links_locator = (By.CSS_SELECTOR, ".AddonInfo-info p a")
 
             def wait_for_region_to_load(self):
                 """Waits for various page components to be loaded"""
@@ -609,30 +492,13 @@ class Detail(Base):
                 )
                 return self
 
-            @property
-            def custom_licence_and_privacy_header(self):
-                self.wait.until(
-                    EC.visibility_of_element_located(
-                        self._license_and_privacy_header_locator
-                    )
-                )
-                return self.find_element(*self._license_and_privacy_header_locator).text
-
-            @property
-            def custom_licence_and_privacy_text(self):
-                self.wait.until(
-                    EC.visibility_of_element_located(
-                        self._license_and_privacy_text_locator
-                    )
-                )
-                return self.find_element(*self._license_and_privacy_text_locator)
+            custom_licence_and_privacy_header = Text(_license_and_privacy_header_locator)
+            custom_licence_and_privacy_text = Element(_license_and_privacy_text_locator)
+            custom_licence_and_privacy_summary_card = Element(_addon_summary_card_locator)
 
             @property
-            def custom_licence_and_privacy_summary_card(self):
-                self.wait.until(
-                    EC.visibility_of_element_located(self._addon_summary_card_locator)
-                )
-                return self.find_element(*self._addon_summary_card_locator)
+            def link_urls(self):
+                return extract_links(self.driver, self._license_and_privacy_links_locator)
 
     class Screenshots(Region):
         _screenshot_section_header_locator = (
@@ -649,14 +515,7 @@ class Detail(Base):
         )
         _screenshot_counter_location = (By.CSS_SELECTOR, ".pswp__counter")
 
-        @property
-        def screenshot_section_header(self):
-            self.wait.until(
-                EC.visibility_of_element_located(
-                    self._screenshot_section_header_locator
-                )
-            )
-            return self.find_element(*self._screenshot_section_header_locator)
+        screenshot_section_header = Element(_screenshot_section_header_locator)
 
         @property
         def screenshot_preview(self):
@@ -665,12 +524,7 @@ class Detail(Base):
             )
             return self.find_elements(*self._screenshot_thumbnail_locator)
 
-        @property
-        def screenshot_viewer(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._screenshot_viewer_locator)
-            )
-            return self.find_element(*self._screenshot_viewer_locator)
+        screenshot_viewer = Element(_screenshot_viewer_locator)
 
         def screenshot_full_view_displayed(self):
             self.wait.until(
@@ -696,12 +550,7 @@ class Detail(Base):
                 Keys.ARROW_LEFT
             )
 
-        @property
-        def screenshot_counter(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._screenshot_counter_location)
-            )
-            return self.find_element(*self._screenshot_counter_location).text
+        screenshot_counter = Text(_screenshot_counter_location)
 
         def close_screenshot_view(self):
             self.wait.until(
@@ -728,21 +577,8 @@ class Detail(Base):
             ".AddonDescription-version-notes .ShowMoreCard-contents",
         )
 
-        @property
-        def release_notes_header(self):
-            self.wait.until(
-                EC.visibility_of_element_located(
-                    self._release_notes_card_header_locator
-                )
-            )
-            return self.find_element(*self._release_notes_card_header_locator).text
-
-        @property
-        def release_notes_text(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._release_notes_content_locator)
-            )
-            return self.find_element(*self._release_notes_content_locator)
+        release_notes_header = Text(_release_notes_card_header_locator)
+        release_notes_text = Element(_release_notes_content_locator)
 
     class AddonsByAuthor(Region):
         _addons_by_author_header_locator = (
@@ -758,12 +594,7 @@ class Detail(Base):
             ".AddonsByAuthorsCard a",
         )
 
-        @property
-        def addons_by_author_header(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._addons_by_author_header_locator)
-            )
-            return self.find_element(*self._addons_by_author_header_locator).text
+        addons_by_author_header = Text(_addons_by_author_header_locator)
 
         @property
         def addons_by_author_results_list(self):
@@ -800,19 +631,8 @@ class Detail(Base):
             ".Notice-error .Notice-text",
         )
 
-        @property
-        def collections_card_header(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._collection_card_header_locator)
-            )
-            return self.find_element(*self._collection_card_header_locator).text
-
-        @property
-        def collections_select_field(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._collection_select_locator)
-            )
-            return self.find_element(*self._collection_select_locator)
+        collections_card_header = Text(_collection_card_header_locator)
+        collections_select_field = Element(_collection_select_locator)
 
         @property
         def add_to_collections_list(self):
@@ -848,19 +668,8 @@ class Detail(Base):
         _description_header_locator = (By.CSS_SELECTOR, ".AddonDescription header")
         _description_text_locator = (By.CLASS_NAME, "AddonDescription-contents")
 
-        @property
-        def addon_description_header(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._description_header_locator)
-            )
-            return self.find_element(*self._description_header_locator).text
-
-        @property
-        def addon_description_text(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._description_text_locator)
-            )
-            return self.find_element(*self._description_text_locator)
+        addon_description_header = Text(_description_header_locator)
+        addon_description_text = Element(_description_text_locator)
 
     class AddonRecommendations(Region):
         _addon_recommendations_root_locator = (By.CSS_SELECTOR, ".AddonRecommendations")
@@ -901,26 +710,14 @@ class Detail(Base):
         _header_locator = (By.CSS_SELECTOR, ".Addon-developer-comments > header > div")
         _content_locator = (By.CSS_SELECTOR, ".Addon-developer-comments-contents")
 
-        @property
-        def header(self):
-            self.wait.until(EC.visibility_of_element_located(self._header_locator))
-            return self.find_element(*self._header_locator)
-
-        @property
-        def content(self):
-            self.wait.until(EC.visibility_of_element_located(self._content_locator))
-            return self.find_element(*self._content_locator)
+        header = Element(_header_locator)
+        content = Element(_content_locator)
 
     class Theme(Region):
         _theme_preview_locator = (By.CSS_SELECTOR, ".ThemeImage-image")
         _same_author_theme_previews_locator = (By.CSS_SELECTOR, ".SearchResult-icon")
 
-        @property
-        def theme_preview(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._theme_preview_locator)
-            )
-            return self.find_element(*self._theme_preview_locator)
+        theme_preview = Element(_theme_preview_locator)
 
         @property
         def more_themes_by_author_previews(self):
@@ -982,12 +779,7 @@ class Detail(Base):
         _all_reviews_link_locator = (By.CLASS_NAME, "Addon-all-reviews-link")
         _submit_review_error_locator = (By.CSS_SELECTOR, ".Notice-error")
 
-        @property
-        def submit_review_error(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._submit_review_error_locator)
-            )
-            return self.find_element(*self._submit_review_error_locator)
+        submit_review_error = Element(_submit_review_error_locator)
 
         def submit_review_error_message(self, value):
             self.wait.until(
@@ -997,26 +789,9 @@ class Detail(Base):
                 message=f'The expected error message "{value}" was not raised',
             )
 
-        @property
-        def ratings_card_header(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._ratings_card_header_locator)
-            )
-            return self.find_element(*self._ratings_card_header_locator).text
-
-        @property
-        def ratings_card_summary(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._ratings_card_summary_locator)
-            )
-            return self.find_element(*self._ratings_card_summary_locator).text
-
-        @property
-        def rating_login_button(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._login_to_rate_button_locator)
-            )
-            return self.find_element(*self._login_to_rate_button_locator)
+        ratings_card_header = Text(_ratings_card_header_locator)
+        ratings_card_summary = Text(_ratings_card_summary_locator)
+        rating_login_button = Element(_login_to_rate_button_locator)
 
         @property
         def rating_stars(self):
@@ -1057,12 +832,7 @@ class Detail(Base):
             )
             return self.find_element(*self._delete_rating_link_locator)
 
-        @property
-        def delete_confirm_button(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._delete_confirm_button_locator)
-            )
-            return self.find_element(*self._delete_confirm_button_locator)
+        delete_confirm_button = Element(_delete_confirm_button_locator)
 
         def click_delete_confirm_button(self):
             self.wait.until(
@@ -1073,12 +843,7 @@ class Detail(Base):
                 expected.invisibility_of_element_located(self._review_text_locator)
             )
 
-        @property
-        def write_a_review(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._write_review_button_locator)
-            )
-            return self.find_element(*self._write_review_button_locator)
+        write_a_review = Element(_write_review_button_locator)
 
         def wait_for_rating_form(self):
             self.wait.until(
@@ -1094,12 +859,7 @@ class Detail(Base):
         def clear_review_text_field(self):
             self.find_element(*self._review_textarea_locator).clear()
 
-        @property
-        def submit_review_button(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._submit_review_button_locator)
-            )
-            return self.find_element(*self._submit_review_button_locator)
+        submit_review_button = Element(_submit_review_button_locator)
 
         def submit_review(self):
             self.wait.until(
@@ -1110,17 +870,8 @@ class Detail(Base):
                 expected.visibility_of_element_located(self._edit_review_link_locator)
             )
 
-        @property
-        def written_review(self):
-            self.wait.until(EC.visibility_of_element_located(self._review_text_locator))
-            return self.find_element(*self._review_text_locator)
-
-        @property
-        def cancel_review(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._cancel_review_write_locator)
-            )
-            return self.find_element(*self._cancel_review_write_locator)
+        written_review = Element(_review_text_locator)
+        cancel_review = Element(_cancel_review_write_locator)
 
         @property
         def edit_review(self):
@@ -1142,12 +893,7 @@ class Detail(Base):
             )
             return self.find_element(*self._delete_review_link_locator)
 
-        @property
-        def keep_review_button(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._keep_review_button_locator)
-            )
-            return self.find_element(*self._keep_review_button_locator)
+        keep_review_button = Element(_keep_review_button_locator)
 
         @property
         def review_permalink(self):
@@ -1159,12 +905,7 @@ class Detail(Base):
             )
             return self.find_element(*self._review_permalink_locator)
 
-        @property
-        def all_reviews_link(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._all_reviews_link_locator)
-            )
-            return self.find_element(*self._all_reviews_link_locator)
+        all_reviews_link = Element(_all_reviews_link_locator)
 
         def click_all_reviews_link(self):
             self.wait.until(EC.element_to_be_clickable(self._all_reviews_link_locator))
@@ -1179,12 +920,7 @@ class Detail(Base):
             count = self.find_element(*self._all_reviews_link_locator).text
             return int(count.split()[2])
 
-        @property
-        def report_abuse_button(self):
-            self.wait.until(
-                EC.visibility_of_element_located(self._report_abuse_button_locator)
-            )
-            return self.find_element(*self._report_abuse_button_locator)
+        report_abuse_button = Element(_report_abuse_button_locator)
 
         def click_report_abuse(self):
             self.wait.until(
@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+from typing import Optional
+
 import requests
 from pypom import Region
 
@@ -5,8 +8,22 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
 from scripts import custom_waits
-from pages.desktop.base import Base
+from pages.desktop.base import Base, extract_items, extract_links
 from pages.desktop.frontend.details import Detail
+from pages.desktop.frontend.search import parse_users
+
+
+@dataclass
+class ShelfItemData:
+    """The details of an add-on displayed in a homepage shelf, read in bulk by list_data"""
+
+    name: str
+    url: str
+    users: Optional[int]
+    name_displayed: bool
+    icon_displayed: bool
+    users_displayed: bool
+    rating_displayed: bool
 
 
 class Home(Base):
@@ -117,42 +134,13 @@ class Home(Base):
         )
         return self.find_elements(*self._shelves_see_more_links_locator)
 
-    def click_see_more_links(self, count):
-        link = [el for el in self.see_more_links_in_shelves]
-        target = link[count].get_attribute("target")
-        # external links are opened in new tabs, so we need to account for multiple windows
-        if target == "_blank":
-            home_tab = self.driver.current_window_handle
-            link[count].click()
-            self.wait.until(EC.number_of_windows_to_be(2))
-            new_tab = self.driver.window_handles[1]
-            self.driver.switch_to.window(new_tab)
-            # see more external links can contain variable content we might not know in advance (especially on prod)
-            # the solution used here is to verify that the content we link to is available (i.e. page response = 200)
-            self.wait.until(custom_waits.url_not_contains("about:blank"))
-            page = requests.head(self.driver.current_url)
-            assert (
-                page.status_code == 200
-            ), f"The response status code was {page.status_code}"
-            self.driver.close()
-            self.driver.switch_to.window(home_tab)
-        else:
-            # similar to external links, internal links might contain unpredictable content;
-            # in this case, we check that the content exists inside the AMO domain
-            link[count].click()
-            self.wait.until(
-                EC.invisibility_of_element_located((By.CLASS_NAME, "LoadingText"))
-            )
-            assert "addons" in self.driver.current_url
-            page = requests.head(self.driver.current_url)
-            assert (
-                page.status_code == 200
-            ), f"The response status code was {page.status_code}"
-            self.driver.back()
-            # waits for the homepage to reload
-            self.wait.until(
-                EC.invisibility_of_element_located((By.CLASS_NAME, "LoadingText"))
-            )
+    @property
+    def see_more_urls(self):
+        """The targets of the 'See more' links of all the shelves"""
+        self.wait.until(
+            EC.visibility_of_element_located(self._shelves_see_more_links_locator)
+        )
+        return extract_links(self.driver, self._shelves_see_more_links_locator)
 
     class ThemeCategory(Region):
         _home_theme_category_locator = (By.CLASS_NAME, "Home-SubjectShelf-list-item")
@@ -212,6 +200,12 @@ class Home(Base):
             items = self.find_elements(*self._extensions_locator)
             return [Home.PromoShelvesAddons(self.page, el) for el in items]
 
+        @property
+        def list_data(self):
+            """Returns the details of all the shelf add-ons, read with one WebDriver call"""
+            self.wait.until(EC.visibility_of_element_located(self._extensions_locator))
+            return Home.PromoShelvesAddons.items_data(self, self._extensions_locator)
+
         def browse_all(self):
             self.wait.until(EC.visibility_of_element_located(self._browse_all_locator))
             self.find_element(*self._browse_all_locator).click()
@@ -243,6 +237,12 @@ class Home(Base):
             items = self.find_elements(*self._themes_locator)
             return [Home.PromoShelvesAddons(self.page, el) for el in items]
 
+        @property
+        def list_data(self):
+            """Returns the details of all the shelf add-ons, read with one WebDriver call"""
+            self.wait.until(EC.visibility_of_element_located(self._themes_locator))
+            return Home.PromoShelvesAddons.items_data(self, self._themes_locator)
+
         def browse_all(self):
             self.wait.until(EC.visibility_of_element_located(self._browse_all_locator))
             self.find_element(*self._browse_all_locator).click()
@@ -291,6 +291,27 @@ class Home(Base):
         def addon_rating_preview(self):
             return self.find_element(*self._addon_rating_locator)
 
+        @classmethod
+        def items_data(cls, shelf, item_locator):
+            """Reads the details of all the add-ons from a <shelf> region in bulk"""
+            items = extract_items(
+                shelf.driver,
+                item_locator,
+                {
+                    "name": (cls._addon_name_locator, "text"),
+                    "url": (cls._addon_link_locator, "href"),
+                    "users": (cls._addon_users_locator, "text"),
+                    "name_displayed": (cls._addon_name_locator, "displayed"),
+                    "icon_displayed": (cls._addon_icon_locator, "displayed"),
+                    "users_displayed": (cls._addon_users_locator, "displayed"),
+                    "rating_displayed": (cls._addon_rating_locator, "displayed"),
+                },
+                root=shelf.root,
+            )
+            for values in items:
+                values["users"] = parse_users(values["users"]) if values["users"] else None
+            return [ShelfItemData(**values) for values in items]
+
         def shelf_item_elements(self, item):
             assert item.name
             assert item.addon_icon_preview.is_displayed()
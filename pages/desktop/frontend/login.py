@@ -1,7 +1,6 @@
 import os
 import time
 import requests
-import pyotp
 
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.by import By
@@ -9,6 +8,8 @@ from selenium.webdriver.support import expected_conditions as EC
 
 from pages.desktop.base import Base
 from scripts import reusables
+from scripts.restmail import mailbox
+from scripts.totp import totp
 
 
 class Login(Base):
@@ -198,17 +199,19 @@ class Login(Base):
         if key != "":
             self.wait.until(EC.url_contains("signin_totp_code"))
             self.wait.until(EC.visibility_of_element_located(self._2fa_input_locator))
-            time.sleep(30)
-            totp = pyotp.TOTP(key)
-            self.find_element(*self._2fa_input_locator).send_keys(totp.now())
+            # the scheduler only hands out codes that were not used before and don't expire
+            # right away, waiting for the next code window (30s at most) when needed
+            self.find_element(*self._2fa_input_locator).send_keys(totp.code(key))
             self.find_element(*self._confirm_2fa_button_locator).click()
-            time.sleep(5)
             for max_retries in range(0, 2):
+                # either the code is accepted and FxA moves on, or an error is displayed
+                self.wait.until(
+                    lambda _: "signin_totp_code" not in self.driver.current_url
+                    or self.is_element_displayed(*self._error_2fa_code_locator)
+                )
                 if self.is_element_displayed(*self._error_2fa_code_locator):
-                    time.sleep(500)
-                    totp = pyotp.TOTP(key)
                     self.find_element(*self._2fa_input_locator).clear()
-                    self.find_element(*self._2fa_input_locator).send_keys(totp.now())
+                    self.find_element(*self._2fa_input_locator).send_keys(totp.code(key))
                     self.find_element(*self._confirm_2fa_button_locator).click()
                 else:
                     break
@@ -245,26 +248,11 @@ class Login(Base):
         self.find_element(*self._repeat_password_locator).send_keys(password)
         self.find_element(*self._age_locator).send_keys(23)
         self.find_element(*self._login_btn_locator).click()
-        # sleep to allow FxA to process the request and communicate with the email client
-        time.sleep(10)
         verification_code = self.get_verification_code(email)
         self.find_element(*self._code_input_locator).send_keys(verification_code)
         self.find_element(*self._login_btn_locator).click()
 
     def get_verification_code(self, mail):
-        request = requests.get(f"https://restmail.net/mail/{mail}", timeout=10)
-        response = request.json()
-        # creating a timed loop to address a possible communication delay between
-        # FxA and restmail; this loop polls the endpoint for 20s to await a response
-        # and exits if there was no response received in the given amount of time
-        timeout_start = time.time()
-        while time.time() < timeout_start + 20:
-            if response:
-                verification_code = [
-                    key["headers"]["x-verify-short-code"] for key in response
-                ]
-                return verification_code
-            elif not response:
-                requests.get(f"https://restmail.net/mail/{mail}", timeout=10)
-                print("Restmail did not receive an email from FxA")
-        return self
+        """Waits for the FxA verification email to arrive in restmail and returns the code"""
+        message = mailbox.wait_for(mail, headers={"x-verify-short-code": None})
+        return message["headers"]["x-verify-short-code"]
@@ -1,3 +1,6 @@
+from dataclasses import dataclass
+from typing import Optional
+
 from pypom import Page, Region
 
 from selenium.webdriver.common.by import By
@@ -5,6 +8,32 @@ from selenium.webdriver.support import expected_conditions as expected
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from pages.desktop.base import extract_items
+
+
+@dataclass
+class SearchResultData:
+    """The details of a search result, read in bulk by SearchResultList.search_results_data"""
+
+    name: str
+    url: str
+    users: Optional[int]
+    rating: Optional[float]
+    author: Optional[str]
+    summary: Optional[str]
+    promoted_badge_label: Optional[str]
+    is_theme: bool
+
+
+def parse_users(text):
+    """Converts a '1,234 users' label to a number"""
+    return int(text.split()[0].replace(",", "").replace("users", ""))
+
+
+def parse_rating(title):
+    """Converts a 'Rated 4.5 out of 5' title to a number"""
+    return float(title.split()[1])
+
 
 class Search(Page):
     _context_card_locator = (By.CLASS_NAME, "SearchContextCard-header")
@@ -113,6 +142,40 @@ class Search(Page):
             items = self.find_elements(*self._result_locator)
             return [self.ResultListItems(self, el) for el in items]
 
+        @property
+        def search_results_data(self):
+            """Returns the details of all the search results, read with one WebDriver call"""
+            self.wait.until(EC.visibility_of_element_located(self._result_locator))
+            item = self.ResultListItems
+            items = extract_items(
+                self.driver,
+                self._result_locator,
+                {
+                    "name": (item._search_item_name_locator, "text"),
+                    "url": (item._search_item_name_locator, "href"),
+                    "users": (item._users_number_locator, "text"),
+                    "rating": (item._rating_locator, "title"),
+                    "author": (item._author_locator, "text"),
+                    "summary": (item._summary_locator, "text"),
+                    "promoted_badge_label": (item._promoted_badge_label_locator, "text"),
+                    "is_theme": (None, "className"),
+                },
+                root=self.root,
+            )
+            return [
+                SearchResultData(
+                    name=values["name"],
+                    url=values["url"],
+                    users=parse_users(values["users"]) if values["users"] else None,
+                    rating=parse_rating(values["rating"]) if values["rating"] else None,
+                    author=values["author"],
+                    summary=values["summary"],
+                    promoted_badge_label=values["promoted_badge_label"],
+                    is_theme="SearchResult--theme" in values["is_theme"].split(),
+                )
+                for values in items
+            ]
+
         @property
         def themes(self):
             items = self.find_elements(*self._theme_locator)
@@ -172,15 +235,15 @@ class Search(Page):
                 self.wait.until(
                     EC.visibility_of_element_located(self._users_number_locator)
                 )
-                users = self.find_element(*self._users_number_locator).text
-                return int(users.split()[0].replace(",", "").replace("users", ""))
+                return parse_users(self.find_element(*self._users_number_locator).text)
 
             @property
             def rating(self):
                 """Returns the rating"""
                 self.wait.until(EC.visibility_of_element_located(self._rating_locator))
-                rating = self.find_element(*self._rating_locator).get_property("title")
-                return float(rating.split()[1])
+                return parse_rating(
+                    self.find_element(*self._rating_locator).get_property("title")
+                )
 
             @property
             def search_result_icon(self):
@@ -1,7 +1,7 @@
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 
-from pages.desktop.base import Base
+from pages.desktop.base import Base, extract_links
 from pages.desktop.frontend.details import Detail
 
 
@@ -74,6 +74,14 @@ class StaticPages(Base):
         )
         return self.find_elements(*self._content_card_links_locator)
 
+    @property
+    def link_urls(self):
+        """The target of every link of the page content"""
+        self.wait.until(
+            EC.visibility_of_element_located(self._content_card_links_locator)
+        )
+        return extract_links(self.driver, self._content_card_links_locator)
+
     @property
     def thunderbird_link(self):
         self.wait.until(
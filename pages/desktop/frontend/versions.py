@@ -1,13 +1,35 @@
+from dataclasses import dataclass
+from typing import Optional
+
 from pypom import Region
 from selenium.common.exceptions import NoSuchElementException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as expected
 from selenium.webdriver.support import expected_conditions as EC
 
-from pages.desktop.base import Base
+from pages.desktop.base import Base, RegionList, extract_items, extract_links
 from regions.desktop.rating_stats_card import RatingStats
 
 
+def parse_file_info(text):
+    """Splits the file info of a version card, e.g. 'Released Jan 5, 2024 - 7.35 KB',
+    into its released date and file size"""
+    released, size = text.split("-")[0], text.split("-")[1][1:]
+    return released.split("Released ")[1][:-1], size
+
+
+@dataclass
+class VersionCardData:
+    """The details of a version card, read in bulk by Versions.version_cards_data"""
+
+    number: str
+    released_date: str
+    size: str
+    license: str
+    license_url: Optional[str]
+    release_notes: Optional[str]
+
+
 class Versions(Base):
     _versions_page_header_locator = (By.CSS_SELECTOR, ".AddonVersions-versions header")
     _latest_version_locator = (By.CSS_SELECTOR, ".Card-contents li:nth-child(2) h2")
@@ -18,6 +40,7 @@ class Versions(Base):
     )
     _notice_message_text_locator = (By.CSS_SELECTOR, ".AddonVersions-warning-text")
     _rating_card_locator = (By.CSS_SELECTOR, ".AddonSummaryCard")
+    _release_notes_links_locator = (By.CSS_SELECTOR, ".AddonVersionCard-releaseNotes a")
 
     def wait_for_page_to_load(self):
         """Waits for various page components to be loaded"""
@@ -49,8 +72,41 @@ class Versions(Base):
 
     @property
     def versions_list(self):
-        items = self.find_elements(*self._versions_list_locator)
-        return [self.VersionCard(self, el) for el in items]
+        """The version cards, kept by the page object; the cards are found once and only
+        looked up again when the page was reloaded"""
+        if "_versions_list" not in self.__dict__:
+            self._versions_list = RegionList(
+                self, self._versions_list_locator, self.VersionCard
+            )
+        return self._versions_list
+
+    def version_cards_data(self):
+        """Returns the details of all the version cards, read with one WebDriver call"""
+        self.wait.until(EC.visibility_of_element_located(self._versions_list_locator))
+        card = self.VersionCard
+        items = extract_items(
+            self.driver,
+            self._versions_list_locator,
+            {
+                "number": (card._version_number_locator, "text"),
+                "file_info": (card._released_date_locator, "text"),
+                "license": (card._license_text_locator, "text"),
+                "license_url": (card._license_link_locator, "href"),
+                "release_notes": (card._version_release_notes_locator, "text"),
+            },
+        )
+        cards = []
+        for values in items:
+            # same formats as the VersionCard properties
+            released_date, size = parse_file_info(values.pop("file_info"))
+            values["number"] = values["number"].split()[1]
+            cards.append(VersionCardData(released_date=released_date, size=size, **values))
+        return cards
+
+    @property
+    def release_notes_link_urls(self):
+        """The target of the links in the release notes of all the listed versions"""
+        return extract_links(self.driver, self._release_notes_links_locator)
 
     class VersionCard(Region):
         _version_number_locator = (By.CSS_SELECTOR, ".AddonVersionCard-version")
@@ -82,18 +138,15 @@ class Versions(Base):
                 EC.visibility_of_element_located(self._released_date_locator)
             )
             text = self.find_element(*self._released_date_locator).text
-            text = text.split("Released ")[1]
-            text = text.split("-")[0][:-1]
-            return text
+            return parse_file_info(text)[0]
 
         @property
         def version_size(self):  # memory size, ex: 7.35 KB
             self.wait.until(
                 EC.visibility_of_element_located(self._released_date_locator)
             )
-            return self.find_element(*self._released_date_locator).text.split("-")[1][
-                1:
-            ]
+            text = self.find_element(*self._released_date_locator).text
+            return parse_file_info(text)[1]
 
         @property
         def version_release_notes(self):
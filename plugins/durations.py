@@ -0,0 +1,208 @@
+"""Keeps the duration and outcome of every test of every run in a local SQLite database
+(durations.db in the project root), per AMO environment. With '--longest-first', a
+pytest-xdist run started with '--dist loadgroup' uses the past durations to hand out the
+longest work units (single tests, or the groups set by resource_groups) first, so that
+slow tests don't end up alone on one worker at the end of the run."""
+
+import sqlite3
+import statistics
+import time
+
+from xdist.scheduler import LoadGroupScheduling
+
+# number of recent runs of a test used to estimate its duration
+RECENT_RUNS = 5
+# estimate of the tests that never ran, when nothing else is known
+DEFAULT_DURATION = 10.0
+
+
+class DurationStore:
+    """Test durations saved per environment (base_url); a test that ran several times in
+    the same run (reruns) is saved once per attempt"""
+
+    def __init__(self, path):
+        self.path = str(path)
+        with self._connect() as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS durations ("
+                "run TEXT NOT NULL, env TEXT NOT NULL, nodeid TEXT NOT NULL, "
+                "outcome TEXT NOT NULL, duration REAL NOT NULL, worker TEXT, "
+                "finished_at REAL NOT NULL)"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS durations_env_nodeid "
+                "ON durations (env, nodeid, finished_at)"
+            )
+        connection.close()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    def save(self, rows):
+        """Saves (run, env, nodeid, outcome, duration, worker, finished_at) rows"""
+        with self._connect() as connection:
+            connection.executemany(
+                "INSERT INTO durations VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+        connection.close()
+
+    def estimates(self, env):
+        """Returns the expected duration of each test that ran before in the environment:
+        the median of its last RECENT_RUNS runs that were not skipped"""
+        recent = {}
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT nodeid, duration FROM durations "
+                "WHERE env = ? AND outcome != 'skipped' ORDER BY finished_at DESC",
+                (env,),
+            )
+            for nodeid, duration in rows:
+                durations = recent.setdefault(nodeid, [])
+                if len(durations) < RECENT_RUNS:
+                    durations.append(duration)
+        connection.close()
+        return {
+            nodeid: statistics.median(durations) for nodeid, durations in recent.items()
+        }
+
+    def flaky(self, env, attempts=10):
+        """Returns the tests that both passed and failed in their last <attempts> attempts
+        in the environment; a test rerun by pytest-rerunfailures failed at least once"""
+        outcomes = {}
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT nodeid, outcome FROM durations "
+                "WHERE env = ? AND outcome != 'skipped' ORDER BY finished_at DESC",
+                (env,),
+            )
+            for nodeid, outcome in rows:
+                recent = outcomes.setdefault(nodeid, [])
+                if len(recent) < attempts:
+                    recent.append(outcome)
+        connection.close()
+        return {
+            nodeid
+            for nodeid, recent in outcomes.items()
+            if "passed" in recent and ("failed" in recent or "rerun" in recent)
+        }
+
+    def trend(self, env, nodeid, limit=20):
+        """Returns the (run, outcome, duration) of the last runs of a test, newest first"""
+        with self._connect() as connection:
+            rows = connection.execute(
+                "SELECT run, outcome, duration FROM durations WHERE env = ? AND nodeid = ? "
+                "ORDER BY finished_at DESC LIMIT ?",
+                (env, nodeid, limit),
+            ).fetchall()
+        connection.close()
+        return rows
+
+
+class DurationRecorder:
+    """pytest plugin saving the durations of the tests at the end of the run; registered
+    by conftest.py on the controller only, which gets the results of all the workers"""
+
+    def __init__(self, store, config):
+        self.store = store
+        self.config = config
+        self.run = time.strftime("%Y%m%d-%H%M%S")
+        self._rows = []
+        self._tests = {}
+
+    @property
+    def env(self):
+        return run_env(self.config)
+
+    def pytest_runtest_logreport(self, report):
+        if report.when == "setup" and report.nodeid in self._tests:
+            # a new attempt of a test that is rerun by pytest-rerunfailures
+            self._save(report.nodeid)
+        # the duration of a test covers its setup, call and teardown
+        duration, outcome, _ = self._tests.get(report.nodeid, (0.0, "passed", None))
+        if report.outcome == "rerun":
+            outcome = "rerun"
+        elif report.failed:
+            outcome = "failed"
+        elif report.skipped and outcome == "passed":
+            outcome = "skipped"
+        node = getattr(report, "node", None)
+        self._tests[report.nodeid] = (
+            duration + report.duration,
+            outcome,
+            node.gateway.id if node else None,
+        )
+        if report.when == "teardown":
+            self._save(report.nodeid)
+
+    def _save(self, nodeid):
+        duration, outcome, worker = self._tests.pop(nodeid)
+        # saved without the group suffix, so that a test has the same history whether
+        # it ran grouped or not, and the scheduler finds it
+        row = (
+            self.run,
+            self.env,
+            strip_group(nodeid),
+            outcome,
+            duration,
+            worker,
+            time.time(),
+        )
+        self._rows.append(row)
+
+    def pytest_sessionfinish(self, session):
+        for nodeid in list(self._tests):
+            self._save(nodeid)
+        if self._rows:
+            self.store.save(self._rows)
+
+    def pytest_xdist_make_scheduler(self, config, log):
+        if (
+            config.getoption("longest_first")
+            and config.getoption("dist") == "loadgroup"
+        ):
+            return LongestFirstScheduling(config, log, self.store.estimates(self.env))
+
+
+class LongestFirstScheduling(LoadGroupScheduling):
+    """'loadgroup' scheduling that always hands out the work unit with the longest
+    expected duration first; the units are the same as with '--dist loadgroup'"""
+
+    def __init__(self, config, log=None, estimates=None):
+        super().__init__(config, log)
+        self.estimates = estimates or {}
+        known = list(self.estimates.values())
+        self.default = statistics.median(known) if known else DEFAULT_DURATION
+
+    def expected_duration(self, work_unit):
+        return sum(
+            self.estimates.get(strip_group(nodeid), self.default)
+            for nodeid in work_unit
+        )
+
+    # overrides a private method of xdist's LoadScopeScheduling and relies on its
+    # workqueue being an OrderedDict; pytest-xdist is pinned in requirements.txt and
+    # tests/plugins/test_durations.py checks the order in which the units are assigned
+    def _assign_work_unit(self, node):
+        longest = max(
+            self.workqueue,
+            key=lambda scope: self.expected_duration(self.workqueue[scope]),
+        )
+        # the parent class assigns the first unit of the queue
+        self.workqueue.move_to_end(longest, last=False)
+        super()._assign_work_unit(node)
+
+
+def run_env(config):
+    """The environment of the run: the base_url from the variables files or the command line.
+    The variables files are read by pytest-variables after conftest.py is configured, so this
+    is only known once the session has started"""
+    variables = getattr(config, "_variables", {})
+    return variables.get("base_url") or config.getoption("base_url") or "unknown"
+
+
+def strip_group(nodeid):
+    """Drops the '@<group>' suffix that pytest-xdist adds to the tests of a group"""
+    if nodeid.rfind("@") > nodeid.rfind("]"):
+        return nodeid.rsplit("@", 1)[0]
+    return nodeid
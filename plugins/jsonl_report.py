@@ -0,0 +1,164 @@
+"""Writes the results of a test run to a directory as the tests finish, when the suite is
+started with '--report-dir DIR':
+ - DIR/results.jsonl holds one JSON line per test result, with its outcome and timings
+ - DIR/artifacts holds the logs, tracebacks, page sources and screenshots of the results
+   (collected by pytest-selenium), each in its own file, gzip-compressed except the PNGs
+ - DIR/index.html is a static viewer that reads results.jsonl and loads the artifacts of
+   a result only when it is opened; it needs to be served over HTTP, e.g. with
+   'python -m http.server --directory DIR'
+Passed setup and teardown phases are left out; the line of a phase also has the durations
+of the phases before it. Since every line carries the run id and environment, the results of
+several runs can be aggregated by concatenating their results.jsonl files."""
+
+import base64
+import gzip
+import json
+import re
+import shutil
+import time
+
+from pathlib import Path
+
+VIEWER = Path(__file__).with_name("report_viewer.html")
+RESULTS = "results.jsonl"
+
+# file extensions of the pytest-html extras (attached by pytest-selenium)
+_extra_extensions = {"image": "png", "html": "html", "text": "txt", "json": "json"}
+
+
+def slug(name):
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-") or "artifact"
+
+
+class JsonlReport:
+    """pytest plugin writing the report; registered by conftest.py on the controller only,
+    since with pytest-xdist the results of the workers are all sent to the controller"""
+
+    def __init__(self, directory, base_url=None):
+        self.directory = Path(directory)
+        self.base_url = base_url
+        self.run = time.strftime("%Y%m%d-%H%M%S")
+        self.counts = {}
+        self._reports = 0
+        self._phases = {}
+        self._file = None
+
+    def pytest_sessionstart(self, session):
+        if self.base_url is None:
+            # the environment of the run, as read by pytest-variables
+            self.base_url = getattr(session.config, "_variables", {}).get("base_url")
+        (self.directory / "artifacts").mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(VIEWER, self.directory / "index.html")
+        self._file = open(self.directory / RESULTS, "a", encoding="utf-8")
+        self._write(
+            {
+                "event": "run_start",
+                "run": self.run,
+                "base_url": self.base_url,
+                "time": time.time(),
+            }
+        )
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self._write(
+            {
+                "event": "run_finish",
+                "run": self.run,
+                "base_url": self.base_url,
+                "time": time.time(),
+                "exitstatus": int(exitstatus),
+                "counts": self.counts,
+            }
+        )
+        self._file.close()
+
+    def _write(self, line):
+        self._file.write(json.dumps(line) + "\n")
+        # flushed on every line, so that the results can be followed while the run goes on
+        self._file.flush()
+
+    def _artifact(self, name, extension, content):
+        """Saves one artifact and returns its path, relative to the report directory"""
+        self._reports += 1
+        path = Path("artifacts", f"{self._reports:06d}-{slug(name)}.{extension}")
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        if extension == "png":
+            (self.directory / path).write_bytes(content)
+        else:
+            path = path.with_name(f"{path.name}.gz")
+            with gzip.open(self.directory / path, "wb", compresslevel=6) as artifact:
+                artifact.write(content)
+        return path.as_posix()
+
+    def _artifacts(self, report):
+        artifacts = []
+        if report.failed or (report.skipped and hasattr(report, "wasxfail")):
+            if report.longreprtext:
+                path = self._artifact(
+                    f"{report.when}-traceback", "txt", report.longreprtext
+                )
+                artifacts.append({"name": "traceback", "path": path})
+        if report.sections:
+            log = "\n\n".join(
+                f"----- {title} -----\n{content}" for title, content in report.sections
+            )
+            artifacts.append(
+                {
+                    "name": "log",
+                    "path": self._artifact(f"{report.when}-log", "txt", log),
+                }
+            )
+        for extra in getattr(report, "extra", []):
+            kind = extra.get("format_type") or extra.get("format")
+            name = extra.get("name") or kind
+            if kind == "url":
+                artifacts.append({"name": name, "url": extra["content"]})
+            elif kind in _extra_extensions:
+                content = extra["content"]
+                if kind == "image":
+                    content = base64.b64decode(content)
+                elif not isinstance(content, str):
+                    content = json.dumps(content)
+                path = self._artifact(
+                    f"{report.when}-{name}", _extra_extensions[kind], content
+                )
+                artifacts.append({"name": name, "path": path})
+        return artifacts
+
+    def pytest_runtest_logreport(self, report):
+        phases = self._phases.setdefault(report.nodeid, {})
+        phases[report.when] = report.duration
+        if report.when == "teardown":
+            # the test is over, the next report of the same test belongs to a rerun
+            self._phases.pop(report.nodeid)
+        if report.when != "call" and report.passed:
+            return
+        outcome = report.outcome
+        if hasattr(report, "wasxfail"):
+            outcome = "xfailed" if report.skipped else "xpassed"
+        message = None
+        if report.longrepr is not None and not report.passed:
+            crash = getattr(report.longrepr, "reprcrash", None)
+            message = crash.message if crash else str(report.longrepr)
+            message = message.splitlines()[0][:500] if message else None
+        # set on the results sent by the pytest-xdist workers
+        node = getattr(report, "node", None)
+        self._write(
+            {
+                "event": "result",
+                "run": self.run,
+                "base_url": self.base_url,
+                "nodeid": report.nodeid,
+                "when": report.when,
+                "outcome": outcome,
+                "duration": report.duration,
+                "phases": dict(phases),
+                "start": getattr(report, "start", None),
+                "stop": getattr(report, "stop", None),
+                "worker": node.gateway.id if node else None,
+                "message": message,
+                "artifacts": self._artifacts(report),
+            }
+        )
+        self.counts[outcome] = self.counts.get(outcome, 0) + 1
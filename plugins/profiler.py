@@ -0,0 +1,241 @@
+"""Shows where the time of a test run goes. When the suite is started with
+'--profile-run PATH', every test records:
+ - the number and duration of the WebDriver commands, by command
+ - the time spent in explicit waits (WebDriverWait.until), by page object method
+ - the time spent in time.sleep
+ - the number and duration of the HTTP requests sent with requests, by host
+Only the calls made by the thread running the tests are recorded; the background
+helpers (approval tracker, add-on pool, mailbox watcher) don't hold up the tests.
+The totals overlap: the WebDriver commands sent during a wait are counted in both.
+The results are written to PATH as JSON and summarized at the end of the run; with
+pytest-xdist, every worker writes its own file, merged by the controller."""
+
+import json
+import sys
+import threading
+import time
+
+from collections import defaultdict
+from pathlib import Path
+from urllib.parse import urlparse
+
+import pytest
+import requests
+
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.support.wait import WebDriverWait
+
+# upper bounds, in milliseconds, of the latency histogram buckets
+BUCKETS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+# frames skipped when looking for the page object method that started a wait
+_internal_frames = ("Element.", "Text.")
+
+
+def new_stats():
+    return {"count": 0, "seconds": 0.0, "histogram": [0] * (len(BUCKETS) + 1)}
+
+
+def add_timing(stats, seconds):
+    stats["count"] += 1
+    stats["seconds"] += seconds
+    milliseconds = seconds * 1000
+    bucket = next(
+        (i for i, bound in enumerate(BUCKETS) if milliseconds <= bound), len(BUCKETS)
+    )
+    stats["histogram"][bucket] += 1
+
+
+def merge_stats(total, stats):
+    total["count"] += stats["count"]
+    total["seconds"] += stats["seconds"]
+    total["histogram"] = [a + b for a, b in zip(total["histogram"], stats["histogram"])]
+
+
+def code_qualname(frame):
+    """The qualified name of the function of <frame>; co_qualname only exists since
+    Python 3.11, so before that the methods are named after the class of their 'self'"""
+    qualname = getattr(frame.f_code, "co_qualname", None)
+    if qualname is None:
+        owner = frame.f_locals.get("self")
+        name = frame.f_code.co_name
+        qualname = name if owner is None else f"{type(owner).__qualname__}.{name}"
+    return qualname
+
+
+def wait_owner(frame):
+    """The page object method (or test) that started a wait, e.g. 'details:Detail.name'"""
+    while frame is not None:
+        qualname = code_qualname(frame)
+        module = frame.f_globals.get("__name__", "")
+        if qualname in ("Element.__get__", "Text.__get__"):
+            # waits of the base.Element attributes are reported as the attribute
+            view = frame.f_locals["view"]
+            return f"{type(view).__module__.rsplit('.', 1)[-1]}:{type(view).__qualname__}.{frame.f_locals['self'].name}"
+        internal = qualname.startswith(_internal_frames)
+        if not module.startswith("selenium") and not internal:
+            return f"{module.rsplit('.', 1)[-1]}:{qualname}"
+        frame = frame.f_back
+    return "unknown"
+
+
+class Profiler:
+    """pytest plugin recording the timings of each test; registered by conftest.py"""
+
+    categories = ("webdriver", "waits", "sleep", "http")
+
+    def __init__(self, path, worker=None):
+        self.path = Path(path)
+        self.worker = worker
+        self.tests = {}
+        self._current = None
+        self._originals = []
+
+    def _record(self, category, key, seconds):
+        if (
+            self._current is None
+            or threading.current_thread() is not threading.main_thread()
+        ):
+            return
+        timings = self._current[category]
+        if key not in timings:
+            timings[key] = new_stats()
+        add_timing(timings[key], seconds)
+
+    def _patch(self, owner, name, wrapper):
+        original = getattr(owner, name)
+        self._originals.append((owner, name, original))
+        setattr(owner, name, wrapper(original))
+
+    def install(self):
+        profiler = self
+
+        def timed(category, key):
+            def wrapper(original):
+                def timed_call(*args, **kwargs):
+                    start = time.perf_counter()
+                    try:
+                        return original(*args, **kwargs)
+                    finally:
+                        profiler._record(
+                            category, key(*args, **kwargs), time.perf_counter() - start
+                        )
+
+                return timed_call
+
+            return wrapper
+
+        # time.sleep is read from the time module on every call in this repo, so
+        # replacing the module attribute is enough
+        self._patch(time, "sleep", timed("sleep", lambda seconds: "time.sleep"))
+        self._patch(
+            RemoteConnection,
+            "execute",
+            timed("webdriver", lambda connection, command, params: command),
+        )
+        self._patch(
+            requests.Session,
+            "send",
+            timed(
+                "http", lambda session, request, **kwargs: urlparse(request.url).netloc
+            ),
+        )
+
+        def timed_wait(original):
+            def until(wait, method, message=""):
+                start = time.perf_counter()
+                try:
+                    return original(wait, method, message)
+                finally:
+                    owner = wait_owner(sys._getframe(1))
+                    profiler._record("waits", owner, time.perf_counter() - start)
+
+            return until
+
+        self._patch(WebDriverWait, "until", timed_wait)
+
+    def uninstall(self):
+        while self._originals:
+            owner, name, original = self._originals.pop()
+            setattr(owner, name, original)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item):
+        self._current = {category: {} for category in self.categories}
+        start = time.perf_counter()
+        yield
+        self._current["duration"] = time.perf_counter() - start
+        self.tests[item.nodeid] = self._current
+        self._current = None
+
+    def pytest_sessionfinish(self, session):
+        self.uninstall()
+        path = self.path
+        if self.worker:
+            path = path.with_name(f"{path.stem}.{self.worker}{path.suffix}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            json.dumps({"buckets_ms": BUCKETS, "tests": self.tests}, indent=1)
+        )
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if self.worker:
+            return
+        # with xdist, the controller ran no tests and reads the files of its workers
+        for worker_file in sorted(
+            self.path.parent.glob(f"{self.path.stem}.gw*{self.path.suffix}")
+        ):
+            self.tests.update(json.loads(worker_file.read_text())["tests"])
+            worker_file.unlink()
+        if not self.tests:
+            return
+        self.path.write_text(
+            json.dumps({"buckets_ms": BUCKETS, "tests": self.tests}, indent=1)
+        )
+        for line in summary(self.tests):
+            terminalreporter.write_line(line)
+        terminalreporter.write_line(f"profile written to {self.path}")
+
+
+def summary(tests, top=10):
+    """Lines of the summary table: the totals of each category, then the slowest
+    WebDriver commands, waits and hosts, then the slowest tests"""
+    totals = {category: defaultdict(new_stats) for category in Profiler.categories}
+    for timings in tests.values():
+        for category in Profiler.categories:
+            for key, stats in timings[category].items():
+                merge_stats(totals[category][key], stats)
+    lines = ["", "profile: time per category"]
+    for category in Profiler.categories:
+        stats = totals[category].values()
+        count = sum(s["count"] for s in stats)
+        seconds = sum(s["seconds"] for s in stats)
+        lines.append(f"  {category:<10} {count:>8} calls {seconds:>10.1f}s")
+    for category in ("webdriver", "waits", "http"):
+        if not totals[category]:
+            continue
+        lines.append(f"profile: slowest {category}")
+        buckets = ", ".join(map(str, BUCKETS))
+        lines.append(
+            f"  {'':<60} {'calls':>7} {'total':>9} {'mean':>8}  calls up to {buckets}ms, more"
+        )
+        ranked = sorted(
+            totals[category].items(),
+            key=lambda entry: entry[1]["seconds"],
+            reverse=True,
+        )
+        for key, stats in ranked[:top]:
+            mean = stats["seconds"] / stats["count"] * 1000
+            histogram = " ".join(str(n) for n in stats["histogram"])
+            lines.append(
+                f"  {key[:60]:<60} {stats['count']:>7} {stats['seconds']:>8.1f}s {mean:>6.0f}ms  {histogram}"
+            )
+    lines.append("profile: slowest tests")
+    for nodeid, timings in sorted(
+        tests.items(), key=lambda entry: entry[1]["duration"], reverse=True
+    )[:top]:
+        parts = " ".join(
+            f"{category}={sum(s['seconds'] for s in timings[category].values()):.1f}s"
+            for category in Profiler.categories
+        )
+        lines.append(f"  {timings['duration']:>7.1f}s {nodeid} ({parts})")
+    return lines
@@ -0,0 +1,171 @@
+"""Quarantine for the flaky tests, enabled with '--quarantine'. A test is flaky when it
+both passed and failed in its recent runs on the same environment, as saved in
+durations.db by plugins.durations. When a flaky test fails:
+ - it is reported as QUARANTINED instead of failed and doesn't fail the run
+ - at the end of the run, the failed flaky tests are run again, on their own, in a new
+   pytest-xdist run, instead of retrying the whole suite
+ - the outcome of that rerun is shown in a separate section of the summary, so a test
+   that fails again can still be looked at
+Tests that never passed or never failed before are not quarantined."""
+
+import json
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+
+from pathlib import Path
+
+import pytest
+
+from plugins.durations import run_env, strip_group
+
+# options of the main run that are not passed to the rerun, with the number of values
+# they take; the rerun picks its own workers and writes its own results
+_rerun_excluded_options = {
+    "--quarantine": 0,
+    "--longest-first": 0,
+    "--lf": 0,
+    "--last-failed": 0,
+    "--ff": 0,
+    "--failed-first": 0,
+    "-x": 0,
+    "--exitfirst": 0,
+    "--self-contained-html": 0,
+    "-n": 1,
+    "--numprocesses": 1,
+    "--dist": 1,
+    "--maxfail": 1,
+    "--html": 1,
+    "--report-dir": 1,
+    "--profile-run": 1,
+    "--junitxml": 1,
+}
+MAX_RERUN_WORKERS = 4
+
+
+def rerun_arguments(invocation_args, test_paths):
+    """The command line options of the main run, without its test paths and without the
+    options that don't apply to the rerun"""
+    arguments = []
+    skip = 0
+    for argument in invocation_args:
+        if skip:
+            skip -= 1
+            continue
+        name = argument.split("=", 1)[0]
+        if name in _rerun_excluded_options:
+            skip = _rerun_excluded_options[name] if "=" not in argument else 0
+            continue
+        if argument in test_paths:
+            continue
+        arguments.append(argument)
+    return arguments
+
+
+def rerun_environment(environ):
+    """The environment variables of the rerun: the options in PYTEST_ADDOPTS are filtered
+    like the command line ones, otherwise a '--quarantine' set there would make the rerun
+    quarantine and rerun its own failures again"""
+    environ = dict(environ)
+    if environ.get("PYTEST_ADDOPTS"):
+        addopts = rerun_arguments(shlex.split(environ["PYTEST_ADDOPTS"]), [])
+        environ["PYTEST_ADDOPTS"] = shlex.join(addopts)
+    return environ
+
+
+class Quarantine:
+    """pytest plugin quarantining the flaky tests; registered by conftest.py on the
+    controller only, which gets the results of all the workers"""
+
+    def __init__(self, config, store):
+        self.config = config
+        self.store = store
+        self.flaky = set()
+        self.failed = []
+        self.failures = 0
+        self.rerun = {}
+
+    def pytest_sessionstart(self, session):
+        # the environment is only known once pytest-variables has read the variables files
+        self.flaky = self.store.flaky(run_env(session.config))
+
+    def is_quarantined(self, report):
+        # grouped tests have a '@<group>' suffix with '--dist loadgroup', not in durations.db
+        nodeid = strip_group(report.nodeid)
+        return (
+            report.failed and nodeid in self.flaky and not hasattr(report, "wasxfail")
+        )
+
+    def pytest_report_teststatus(self, report):
+        if self.is_quarantined(report):
+            return "quarantined", "Q", ("QUARANTINED", {"yellow": True})
+
+    def pytest_runtest_logreport(self, report):
+        if self.is_quarantined(report):
+            # counted by pytest as well, once per failed phase
+            self.failures += 1
+            # the suffix is not a valid node id on the command line of the rerun
+            nodeid = strip_group(report.nodeid)
+            if nodeid not in self.failed:
+                self.failed.append(nodeid)
+
+    def pytest_sessionfinish(self, session):
+        if not self.failed:
+            return
+        session.testsfailed = max(session.testsfailed - self.failures, 0)
+        if (
+            session.testsfailed == 0
+            and session.exitstatus == pytest.ExitCode.TESTS_FAILED
+        ):
+            session.exitstatus = pytest.ExitCode.OK
+        self.rerun = self.run_again(self.failed)
+
+    def run_again(self, nodeids):
+        """Runs the tests in a new pytest run and returns their outcome by node id"""
+        with tempfile.TemporaryDirectory() as directory:
+            command = [
+                sys.executable,
+                "-m",
+                "pytest",
+                *rerun_arguments(self.config.invocation_params.args, self.config.args),
+                "-n",
+                str(min(len(nodeids), MAX_RERUN_WORKERS)),
+                "--dist",
+                "loadgroup",
+                # the attempts of the rerun are not saved with the durations of the main run
+                "-p",
+                "no:durations",
+                # the node ids are relative to the root directory of the main run
+                f"--rootdir={self.config.rootpath}",
+                f"--report-dir={directory}",
+                *nodeids,
+            ]
+            subprocess.run(
+                command,
+                cwd=self.config.invocation_params.dir,
+                env=rerun_environment(os.environ),
+                stdout=subprocess.DEVNULL,
+            )
+            outcomes = {}
+            results = Path(directory, "results.jsonl")
+            lines = results.read_text().splitlines() if results.exists() else []
+            for line in map(json.loads, lines):
+                nodeid = strip_group(line.get("nodeid", ""))
+                if line["event"] == "result" and outcomes.get(nodeid) != "failed":
+                    outcomes[nodeid] = line["outcome"]
+        return {nodeid: outcomes.get(nodeid, "not run") for nodeid in nodeids}
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.failed:
+            return
+        terminalreporter.section("quarantined flaky tests")
+        for nodeid in self.failed:
+            outcome = self.rerun.get(nodeid, "not run")
+            verdict = (
+                "flaky, passed on rerun"
+                if outcome == "passed"
+                else f"{outcome} on rerun"
+            )
+            terminalreporter.write_line(f"{nodeid}: {verdict}", red=outcome != "passed")
@@ -0,0 +1,56 @@
+"""Groups the tests that change the same resources (user sessions, add-ons, collections)
+so that pytest-xdist runs them on the same worker, in collection order, when the suite
+is started with '--dist loadgroup'. All the other tests are distributed freely."""
+
+import pytest
+
+# markers that authenticate a test as the user passed in the marker arguments
+_session_markers = ("login", "create_session")
+
+
+def item_resources(item):
+    """Returns two sets with the resources a test uses and the ones it changes.
+    A test changes:
+     - the resources passed to its 'resources' markers, e.g. 'addon:my-slug'
+     - the session of its user, if it is marked with 'clear_session'
+     - the state shared by its module, if it is marked with 'serial', since serial
+    suites rely on tests running in order (e.g. create a collection, then edit it)"""
+    uses = set()
+    changes = set()
+    for mark in item.iter_markers("resources"):
+        changes.update(mark.args)
+    for name in _session_markers:
+        for mark in item.iter_markers(name):
+            uses.update(f"user:{user}" for user in mark.args)
+    if item.get_closest_marker("clear_session"):
+        # clear_session invalidates the session of the user set with 'create_session'
+        changes.update(uses)
+    if item.get_closest_marker("serial"):
+        changes.add(f"module:{item.module.__name__}")
+    return uses | changes, changes
+
+
+def assign_groups(items):
+    """Adds an 'xdist_group' marker to every test that touches a resource changed by
+    at least one test of the run. Tests sharing such resources, directly or through
+    other tests, end up in the same group; resources that are only read by the tests
+    don't create groups, so these tests stay fully parallel."""
+    resources = {item.nodeid: item_resources(item) for item in items}
+    changed = set().union(*(changes for _, changes in resources.values()))
+    parent = {resource: resource for resource in changed}
+
+    def find(resource):
+        while parent[resource] != resource:
+            parent[resource] = parent[parent[resource]]
+            resource = parent[resource]
+        return resource
+
+    conflicts = {}
+    for item in items:
+        conflicts[item.nodeid] = sorted(resources[item.nodeid][0] & changed)
+        roots = [find(resource) for resource in conflicts[item.nodeid]]
+        for root in roots[1:]:
+            parent[root] = roots[0]
+    for item in items:
+        if conflicts[item.nodeid] and not item.get_closest_marker("xdist_group"):
+            item.add_marker(pytest.mark.xdist_group(find(conflicts[item.nodeid][0])))
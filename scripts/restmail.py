@@ -0,0 +1,90 @@
+"""Helper for the tests that need to read emails sent to restmail.net inboxes, such as
+the FxA verification codes or the newsletter confirmation emails"""
+
+import os
+import threading
+import time
+
+import requests
+
+# can be pointed to a local restmail instance to run the email checks offline
+RESTMAIL_URL = os.environ.get('RESTMAIL_URL', 'https://restmail.net')
+
+
+class MailboxWatcher:
+    """Waits for emails to arrive in restmail inboxes. The inbox is polled as often as
+    every <interval> seconds at first, and less often the longer the email takes to
+    arrive (up to <max_interval>), so fast emails are picked up quickly without
+    flooding restmail with requests. Messages returned once are remembered and not
+    returned again, which allows waiting for several emails sent to the same inbox.
+    An instance can be shared by tests waiting on different inboxes at the same time."""
+
+    def __init__(self, url=RESTMAIL_URL, timeout=60, interval=0.5, max_interval=5):
+        self.url = url
+        self.timeout = timeout
+        self.interval = interval
+        self.max_interval = max_interval
+        self.session = requests.Session()
+        # inbox -> ids of the messages already returned by wait_for
+        self._seen = {}
+        self._lock = threading.Lock()
+
+    def messages(self, inbox):
+        """Returns all the messages currently found in the inbox"""
+        response = self.session.get(f'{self.url}/mail/{inbox}', timeout=10)
+        response.raise_for_status()
+        return response.json()
+
+    def clear(self, inbox):
+        self.session.delete(f'{self.url}/mail/{inbox}', timeout=10)
+        with self._lock:
+            self._seen.pop(inbox, None)
+
+    def wait_for(self, inbox, subject=None, headers=None, timeout=None):
+        """Waits for a new message and returns it; only messages containing <subject> in
+        their subject and having all the <headers> are considered (a None header value
+        only checks that the header is present). Fails if none arrives in <timeout>."""
+        timeout = timeout or self.timeout
+        deadline = time.monotonic() + timeout
+        interval = self.interval
+        while True:
+            for message in self.messages(inbox):
+                matches = self._matches(message, subject, headers)
+                if matches and self._mark_seen(inbox, message):
+                    return message
+            remaining = deadline - time.monotonic()
+            assert remaining > 0, (
+                f'No email matching subject={subject}, headers={headers} '
+                f'was received by {inbox} in {timeout}s'
+            )
+            time.sleep(min(interval, remaining))
+            interval = min(interval * 2, self.max_interval)
+
+    def _matches(self, message, subject, headers):
+        if subject is not None and subject not in message.get('subject', ''):
+            return False
+        message_headers = message.get('headers', {})
+        for name, value in (headers or {}).items():
+            if name not in message_headers:
+                return False
+            if value is not None and message_headers[name] != value:
+                return False
+        return True
+
+    def _mark_seen(self, inbox, message):
+        """Returns False if the message was already returned for this inbox"""
+        # restmail messages have no id, but their receive date and content identify them
+        key = message.get('messageId') or (
+            message.get('receivedAt'),
+            message.get('subject'),
+        )
+        with self._lock:
+            seen = self._seen.setdefault(inbox, set())
+            if key in seen:
+                return False
+            seen.add(key)
+            return True
+
+
+# shared by all the tests of a worker
+mailbox = MailboxWatcher()
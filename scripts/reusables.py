@@ -24,6 +24,11 @@ def get_random_string(length):
     return result_str
 
 
+def addon_slug_from_url(url):
+    """Returns the add-on slug from devhub urls, e.g. /developers/addon/<slug>/edit"""
+    return url.split('/addon/')[1].split('/')[0]
+
+
 def current_date():
     """Getting the current date in string format"""
     today = datetime.datetime.today()
@@ -0,0 +1,87 @@
+"""Generates the 2FA codes for the FxA accounts that use an authenticator app"""
+
+import hashlib
+import sqlite3
+import time
+
+from pathlib import Path
+
+import pyotp
+
+# shared with the session store, so all the xdist workers of a run see the same used codes
+DEFAULT_DB_PATH = Path(__file__).resolve().parents[1] / 'sessions.db'
+
+
+class TotpScheduler:
+    """Hands out TOTP codes that are safe to submit: a code is only returned if it stays
+    valid for at least <min_validity> seconds and if it wasn't handed out before for the
+    same key, since FxA rejects codes that were already used. Otherwise, it waits for the
+    start of the next code window, which takes 30 seconds at most.
+    The used codes are saved in a SQLite database (<path>), to be shared by parallel
+    workers; with path=None they are only tracked in memory. <clock> and <sleep> can be
+    replaced to test the scheduling with a frozen clock; by default, time.sleep is
+    looked up when waiting, so that the waits are seen by the run profiler, which
+    patches it."""
+
+    def __init__(
+        self, path=DEFAULT_DB_PATH, min_validity=5, clock=time.time, sleep=None
+    ):
+        self.path = None if path is None else str(path)
+        self.min_validity = min_validity
+        self.clock = clock
+        self.sleep = sleep
+        self._used = set()
+
+    def _connect(self):
+        connection = sqlite3.connect(self.path, timeout=30)
+        # created on first use, so that importing the module doesn't create the database
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS totp_codes ('
+            'key TEXT NOT NULL, counter INTEGER NOT NULL, used_at REAL NOT NULL, '
+            'PRIMARY KEY (key, counter))'
+        )
+        return connection
+
+    def code(self, key):
+        """Returns a fresh code for the authenticator <key>, waiting for the next code
+        window if the current code expires too soon or was already used"""
+        totp = pyotp.TOTP(key)
+        while True:
+            now = self.clock()
+            counter = int(now // totp.interval)
+            remaining = totp.interval - now % totp.interval
+            if remaining >= self.min_validity and self._claim(key, counter):
+                return totp.at(counter * totp.interval)
+            # wait for the next window; the code will be valid for the whole interval
+            (self.sleep or time.sleep)(remaining)
+
+    def _claim(self, key, counter):
+        """Marks a code as used; returns False if it was used already"""
+        # keys are secrets, so only their hash is saved
+        key = hashlib.sha256(key.encode()).hexdigest()
+        if self.path is None:
+            if (key, counter) in self._used:
+                return False
+            self._used.add((key, counter))
+            return True
+        connection = self._connect()
+        try:
+            with connection:
+                connection.execute(
+                    'INSERT INTO totp_codes VALUES (?, ?, ?)',
+                    (key, counter, self.clock()),
+                )
+                # old codes are of no use anymore
+                connection.execute(
+                    'DELETE FROM totp_codes WHERE key = ? AND counter < ?',
+                    (key, counter - 10),
+                )
+            return True
+        except sqlite3.IntegrityError:
+            return False
+        finally:
+            connection.close()
+
+
+# shared by all the logins of a worker
+totp = TotpScheduler()
@@ -1,24 +1,15 @@
-import json
-
 import pytest
-import requests
 
-from api import payloads, api_helpers, responses
+from api import payloads, responses
 
 
 # endpoints used in the post abuse report tests
 _post_abuse_report = "/api/v5/abuse/report/addon/"
 
-@pytest.mark.skip(reason="Skipped for the moment due to throttle in place, to be removed with next pr")
-def test_abuse_report_unauthenticated_post(base_url, selenium):
+
+def test_abuse_report_unauthenticated_post(api_client):
     payload = payloads.abuse_report_full_body
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = api_client.post(_post_abuse_report, json=payload)
     assert (
             create_abuse_report.status_code == 201
     ), f"Actual response: {create_abuse_report.status_code}, {create_abuse_report.text}"
@@ -29,16 +20,11 @@ def test_abuse_report_unauthenticated_post(base_url, selenium):
 
 
 @pytest.mark.login("api_user")
-def test_abuse_report_authenticated(base_url, selenium):
+def test_abuse_report_authenticated(selenium, api_client):
     payload = payloads.abuse_report_full_body
     session_cookie = selenium.get_cookie("sessionid")
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f'Session {session_cookie["value"]}'
-        },
-        data=json.dumps(payload)
+    create_abuse_report = api_client.post(
+        _post_abuse_report, auth=session_cookie["value"], json=payload
     )
     assert (
             create_abuse_report.status_code == 201
@@ -49,19 +35,12 @@ def test_abuse_report_authenticated(base_url, selenium):
     ), f"Actual response: {create_abuse_report.json()}"
 
 @pytest.mark.create_session("api_user")
-def test_abuse_report_minimal_details(base_url, selenium, session_auth):
+def test_abuse_report_minimal_details(selenium, api_client):
     payload = {
         "addon": "{463b483d-6150-43c9-9b52-a3d08d5ecd3a}",
         "message": "test from the API,both"
     }
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Session {session_auth}"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = api_client.post(_post_abuse_report, json=payload)
     assert (
             create_abuse_report.status_code == 201
     ), f"Actual response: {create_abuse_report.status_code}, {create_abuse_report.text}";
@@ -82,16 +61,9 @@ def test_abuse_report_minimal_details(base_url, selenium, session_auth):
     ]
 )
 @pytest.mark.create_session("api_user")
-def test_addon_install_method_parameter(base_url, selenium, session_auth, addon_install_method):
+def test_addon_install_method_parameter(selenium, api_client, addon_install_method):
     payload = payloads.abuse_report_body(f"{addon_install_method}", "amo", "settings", "signed", "menu", "amo")
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Session {session_auth}"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = api_client.post(_post_abuse_report, json=payload)
     if addon_install_method == "random_text":
         assert (
                 create_abuse_report.status_code == 201
@@ -120,16 +92,9 @@ def test_addon_install_method_parameter(base_url, selenium, session_auth, addon_
     ]
 )
 @pytest.mark.create_session("api_user")
-def test_addon_install_source_parameter(base_url, selenium, session_auth, addon_install_source):
+def test_addon_install_source_parameter(selenium, api_client, addon_install_source):
     payload = payloads.abuse_report_body("link", f"{addon_install_source}", "settings", "signed", "menu", "amo")
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Session {session_auth}"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = api_client.post(_post_abuse_report, json=payload)
     if addon_install_source == "random_text":
         assert (
                 create_abuse_report.status_code == 201
@@ -158,16 +123,9 @@ def test_addon_install_source_parameter(base_url, selenium, session_auth, addon_
     ]
 )
 @pytest.mark.create_session("api_user")
-def test_reason_parameter(base_url, selenium, session_auth, reason):
+def test_reason_parameter(selenium, api_client, reason):
     payload = payloads.abuse_report_body("link", "amo", f"{reason}", "signed", "menu", "amo")
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Session {session_auth}"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = api_client.post(_post_abuse_report, json=payload)
     if reason == "random_text":
         assert (
                 create_abuse_report.status_code == 400
@@ -196,17 +154,10 @@ def test_reason_parameter(base_url, selenium, session_auth, reason):
     ]
 )
 @pytest.mark.create_session("api_user")
-def test_addon_signature_parameter(base_url, selenium, session_auth, addon_signature):
+def test_addon_signature_parameter(selenium, api_client, addon_signature):
     payload = payloads.abuse_report_body("installtrigger", "about_preferences", "broken", f"{addon_signature}",
                                          "uninstall", "addon")
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Session {session_auth}"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = api_client.post(_post_abuse_report, json=payload)
     if addon_signature == "random_text":
         assert (
                 create_abuse_report.status_code == 400
@@ -235,17 +186,10 @@ def test_addon_signature_parameter(base_url, selenium, session_auth, addon_signa
     ]
 )
 @pytest.mark.create_session("api_user")
-def test_report_entry_point_parameter(base_url, selenium, session_auth, report_entry_point):
+def test_report_entry_point_parameter(selenium, api_client, report_entry_point):
     payload = payloads.abuse_report_body("drag_and_drop", "app_profile", "policy", "preliminary",
                                          f"{report_entry_point}", "addon")
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Session {session_auth}"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = api_client.post(_post_abuse_report, json=payload)
     if report_entry_point == "random_text":
         assert (
                 create_abuse_report.status_code == 400
@@ -274,16 +218,9 @@ def test_report_entry_point_parameter(base_url, selenium, session_auth, report_e
     ]
 )
 @pytest.mark.create_session("api_user")
-def test_location_parameter(base_url, selenium, session_auth, location):
+def test_location_parameter(selenium, api_client, location):
     payload = payloads.abuse_report_body("link", "amo", "settings", "signed", "menu", f"{location}")
-    create_abuse_report = requests.post(
-        url=f"{base_url}{_post_abuse_report}",
-        headers={
-            "Content-Type": "application/json",
-            "Authorization": f"Session {session_auth}"
-        },
-        data=json.dumps(payload)
-    )
+    create_abuse_report = api_client.post(_post_abuse_report, json=payload)
     if location == "random_text":
         assert (
                 create_abuse_report.status_code == 400
@@ -1,8 +1,6 @@
 import json
-import time
 
 import pytest
-import requests
 
 from api import payloads, api_helpers
 from pages.desktop.frontend.home import Home
@@ -27,13 +25,10 @@ _addon_create = "/api/v5/addons/addon/"
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_listed_extension_tc_id_c4369(base_url, session_auth):
+def test_upload_listed_extension_tc_id_c4369(api_client):
     with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
+        upload = api_client.post(
+            _upload, files={"upload": file}, data={"channel": "listed"}
         )
     resp = upload.json()
     print(json.dumps(resp, indent=2))
@@ -41,17 +36,10 @@ def test_upload_listed_extension_tc_id_c4369(base_url, session_auth):
     assert "listed" in resp["channel"]
     # get the addon uuid generated after upload
     uuid = resp["uuid"]
+    # wait for the upload to be processed before using it
+    api_helpers.wait_for_upload_processing(api_client, uuid)
     payload = payloads.listed_addon_details(uuid)
-    # sleep to allow the first request to be processed
-    time.sleep(10)
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.post(_addon_create, json=payload)
     print(create_addon)
     create_addon.raise_for_status()
     response = create_addon.json()
@@ -62,16 +50,9 @@ def test_upload_listed_extension_tc_id_c4369(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_listed_addon_details(base_url, session_auth):
+def test_edit_listed_addon_details(api_client):
     payload = payloads.edit_addon_details
-    edit_addon = requests.patch(
-        url=f"{base_url}{_addon_create}my_sluggish_slug/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_addon = api_client.patch(f"{_addon_create}my_sluggish_slug/", json=payload)
     edit_addon.raise_for_status()
     response = edit_addon.json()
     print(json.dumps(response, indent=2))
@@ -81,21 +62,18 @@ def test_edit_listed_addon_details(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_extension_add_invalid_categories(base_url, session_auth):
+def test_extension_add_invalid_categories(api_client):
     """Try to upload an addon that has invalid android categories set in the JSON payload"""
     with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
+        upload = api_client.post(
+            _upload, files={"upload": file}, data={"channel": "listed"}
         )
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(3)
     print(upload.json())
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    # wait for the upload to be processed before using it
+    api_helpers.wait_for_upload_processing(api_client, uuid)
     invalid_android_catg = ["", 123, None]
     for item in invalid_android_catg:
         payload = {
@@ -103,14 +81,7 @@ def test_extension_add_invalid_categories(base_url, session_auth):
             "categories": [item],
             "slug": "invalid-cat",
         }
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = api_client.post(_addon_create, json=payload)
         print(
             f'For android category "{item}": Response status is {create_addon.status_code}; {create_addon.text}\n'
         )
@@ -121,23 +92,21 @@ def test_extension_add_invalid_categories(base_url, session_auth):
             "Invalid category name" in create_addon.text
         ), f"Actual response message was {create_addon.text}"
 
+
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_extension_one_category_and_other_category(base_url, session_auth):
+def test_extension_one_category_and_other_category(api_client):
     """Try to upload an addon that has invalid android categories set in the JSON payload"""
     with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
+        upload = api_client.post(
+            _upload, files={"upload": file}, data={"channel": "listed"}
         )
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(3)
     print(upload.json())
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    # wait for the upload to be processed before using it
+    api_helpers.wait_for_upload_processing(api_client, uuid)
     invalid_android_catg = ["Appearance"]
     for item in invalid_android_catg:
         payload = {
@@ -145,14 +114,7 @@ def test_extension_one_category_and_other_category(base_url, session_auth):
             "categories": ["Other", item],
             "slug": "invalid-cat",
         }
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = api_client.post(_addon_create, json=payload)
         print(
             f'For android category "{item}": Response status is {create_addon.status_code}; {create_addon.text}\n'
         )
@@ -163,23 +125,21 @@ def test_extension_one_category_and_other_category(base_url, session_auth):
             "Invalid category name" in create_addon.text
         ), f"Actual response message was {create_addon.text}"
 
+
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_extension_add_invalid_firefox_categories(base_url, session_auth):
+def test_extension_add_invalid_firefox_categories(api_client):
     """Try to upload an addon that has invalid firefox categories set in the JSON payload"""
     with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
+        upload = api_client.post(
+            _upload, files={"upload": file}, data={"channel": "listed"}
         )
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(3)
     print(upload.json())
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    # wait for the upload to be processed before using it
+    api_helpers.wait_for_upload_processing(api_client, uuid)
     invalid_firefox_catg = ["fashion", "security-privacy", "", 12.3]
     for item in invalid_firefox_catg:
         payload = {
@@ -187,14 +147,7 @@ def test_extension_add_invalid_firefox_categories(base_url, session_auth):
             "categories": {"android": ["performance"], "firefox": [item]},
             "slug": "invalid-firefox-cat",
         }
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = api_client.post(_addon_create, json=payload)
         print(
             f'For firefox category "{item}": Response status is {create_addon.status_code}; {create_addon.text}\n'
         )
@@ -208,21 +161,18 @@ def test_extension_add_invalid_firefox_categories(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_extension_other_category_is_standalone(base_url, session_auth):
+def test_extension_other_category_is_standalone(api_client):
     """Extensions with a category set to 'other' cannot have another category set"""
     with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
+        upload = api_client.post(
+            _upload, files={"upload": file}, data={"channel": "listed"}
         )
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(3)
     print(upload.json())
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    # wait for the upload to be processed before using it
+    api_helpers.wait_for_upload_processing(api_client, uuid)
     payload = {
         **payloads.listed_addon_details(uuid),
         "categories": {
@@ -231,14 +181,7 @@ def test_extension_other_category_is_standalone(base_url, session_auth):
         },
         "slug": "other-category",
     }
-    create_addon = requests.post(
-        url=f"{base_url}{_addon_create}",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    create_addon = api_client.post(_addon_create, json=payload)
     assert (
         create_addon.status_code == 400
     ), f"Actual status code was {create_addon.status_code}"
@@ -250,33 +193,23 @@ def test_extension_other_category_is_standalone(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_extension_invalid_slug(base_url, session_auth):
+def test_extension_invalid_slug(api_client):
     """Addon slugs can be composed only from letters and numbers"""
     with open("sample-addons/listed-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
+        upload = api_client.post(
+            _upload, files={"upload": file}, data={"channel": "listed"}
         )
     upload.raise_for_status()
-    # sleep to allow the first request to be processed
-    time.sleep(3)
     print(upload.json())
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    # wait for the upload to be processed before using it
+    api_helpers.wait_for_upload_processing(api_client, uuid)
     invalid_slugs = [102030, "---", "?name", "@#_" ")(", None]
     for item in invalid_slugs:
         # crete a new dictionary from the original payload, with invalid slug values
         payload = {**payloads.listed_addon_details(uuid), "slug": item}
-        create_addon = requests.post(
-            url=f"{base_url}{_addon_create}",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        create_addon = api_client.post(_addon_create, json=payload)
         print(
             f'For slug "{item}": Response status is {create_addon.status_code}; {create_addon.text}\n'
         )
@@ -296,21 +229,14 @@ def test_extension_invalid_slug(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_duplicate_slug(base_url, session_auth, variables):
+def test_edit_extension_duplicate_slug(variables, api_client):
     """Use a slug that already belongs to another addon"""
     addon = payloads.edit_addon_details["slug"]
     payload = {
         **payloads.edit_addon_details,
         "slug": variables["approved_addon_with_sources"],
     }
-    edit_addon = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    edit_addon = api_client.patch(f"{_addon_create}{addon}/", json=payload)
     assert (
         edit_addon.status_code == 400
     ), f"Actual status code was {edit_addon.status_code}"
@@ -321,21 +247,14 @@ def test_edit_extension_duplicate_slug(base_url, session_auth, variables):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_name(base_url, session_auth):
+def test_edit_extension_invalid_name(api_client):
     """Addon names are required to have at least one letter or number character to be valid"""
     addon = payloads.edit_addon_details["slug"]
     invalid_names = ["", ".", "****", None]
     for item in invalid_names:
         # crete a new dictionary from the original payload, with invalid name values
         payload = {**payloads.edit_addon_details, "name": {"en-US": item}}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.patch(f"{_addon_create}{addon}/", json=payload)
         print(
             f'For name "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -371,19 +290,12 @@ def test_edit_extension_invalid_name(base_url, session_auth):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_with_trademark_in_name(base_url, session_auth, trademark_name):
+def test_edit_extension_with_trademark_in_name(trademark_name, api_client):
     """Verifies that addon names can't be edited to include a Mozilla or Firefox trademark"""
     addon = payloads.edit_addon_details["slug"]
     # crete a new dictionary from the original payload, with variable name values
     name = {**payloads.edit_addon_details, "name": {"en-US": trademark_name}}
-    edit_addon = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(name),
-    )
+    edit_addon = api_client.patch(f"{_addon_create}{addon}/", json=name)
     print(
         f'For name "{trademark_name}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
     )
@@ -399,7 +311,7 @@ def test_edit_extension_with_trademark_in_name(base_url, session_auth, trademark
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_summary(base_url, session_auth):
+def test_edit_extension_invalid_summary(api_client):
     """Addon summaries need to be in string format and below 250 characters"""
     addon = payloads.edit_addon_details["slug"]
     over_250_summary = reusables.get_random_string(251)
@@ -407,14 +319,7 @@ def test_edit_extension_invalid_summary(base_url, session_auth):
     # crete a new dictionary from the original payload, with invalid summary values
     for item in summaries:
         payload = {**payloads.edit_addon_details, "summary": {"en-US": item}}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.patch(f"{_addon_create}{addon}/", json=payload)
         print(
             f'For summary "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -439,7 +344,7 @@ def test_edit_extension_invalid_summary(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_homepage(base_url, session_auth):
+def test_edit_extension_invalid_homepage(base_url, api_client):
     """Try to add some invalid and unaccepted homepage urls for an addon"""
     addon = payloads.edit_addon_details["slug"]
     invalid_homepage = [
@@ -454,14 +359,7 @@ def test_edit_extension_invalid_homepage(base_url, session_auth):
     for item in invalid_homepage:
         # crete a new dictionary from the original payload, with variable homepage values
         homepage = {**payloads.edit_addon_details, "homepage": {"en-US": item}}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(homepage),
-        )
+        edit_addon = api_client.patch(f"{_addon_create}{addon}/", json=homepage)
         print(
             f'For homepage "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -487,21 +385,14 @@ def test_edit_extension_invalid_homepage(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_support_email(base_url, session_auth):
+def test_edit_extension_invalid_support_email(api_client):
     """Try to add some invalid and unaccepted emails for an addon"""
     addon = payloads.edit_addon_details["slug"]
     invalid_email = ["", ".", "abc123", "mail.com", "abc@defg", 123, None]
     for item in invalid_email:
         # crete a new dictionary from the original payload, with variable email values
         email = {**payloads.edit_addon_details, "support_email": {"en-US": item}}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(email),
-        )
+        edit_addon = api_client.patch(f"{_addon_create}{addon}/", json=email)
         print(
             f'For email "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -526,7 +417,7 @@ def test_edit_extension_invalid_support_email(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_experimental_and_payment(base_url, session_auth):
+def test_edit_extension_invalid_experimental_and_payment(api_client):
     """Try to set the 'experimental' and 'requires_payment' fields to other values than boolean"""
     addon = payloads.edit_addon_details["slug"]
     # 'is_experimental' and 'requires_payment' can only be True or False
@@ -538,14 +429,7 @@ def test_edit_extension_invalid_experimental_and_payment(base_url, session_auth)
             "is_experimental": item,
             "requires_payment": item,
         }
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.patch(f"{_addon_create}{addon}/", json=payload)
         print(
             f'For email "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -565,7 +449,7 @@ def test_edit_extension_invalid_experimental_and_payment(base_url, session_auth)
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_valid_contribute_domains(base_url, session_auth):
+def test_edit_extension_valid_contribute_domains(api_client):
     """Add a valid contributions url to an addon; requests should be successful"""
     addon = payloads.edit_addon_details["slug"]
     valid_domains = [
@@ -584,14 +468,7 @@ def test_edit_extension_valid_contribute_domains(base_url, session_auth):
     for item in valid_domains:
         # crete a new dictionary from the original payload, with variable domain values
         payload = {**payloads.edit_addon_details, "contributions_url": item}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.patch(f"{_addon_create}{addon}/", json=payload)
         print(
             f'For domain "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -602,7 +479,7 @@ def test_edit_extension_valid_contribute_domains(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_contribute_domains(base_url, session_auth, variables):
+def test_edit_extension_invalid_contribute_domains(variables, api_client):
     """Set an invalid or an unaccepted value as the addon's contribution url;
     accepted domains are predefined and must all start with 'https'"""
     addon = payloads.edit_addon_details["slug"]
@@ -619,14 +496,7 @@ def test_edit_extension_invalid_contribute_domains(base_url, session_auth, varia
     for item in invalid_domains:
         # crete a new dictionary from the original payload, with variable domain values
         payload = {**payloads.edit_addon_details, "contributions_url": item}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.patch(f"{_addon_create}{addon}/", json=payload)
         print(
             f'For domain "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -658,7 +528,7 @@ def test_edit_extension_invalid_contribute_domains(base_url, session_auth, varia
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_invalid_addon_tags(base_url, session_auth):
+def test_edit_extension_invalid_addon_tags(api_client):
     """Try to set some invalid or unaccepted tags to an addon; valid tags are predefined"""
     addon = payloads.edit_addon_details["slug"]
     # set some invalid or combinations of invalid tags; for example,
@@ -667,14 +537,7 @@ def test_edit_extension_invalid_addon_tags(base_url, session_auth):
     for item in invalid_tags:
         # crete a new dictionary from the original payload, with variable values
         payload = {**payloads.edit_addon_details, "tags": item}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.patch(f"{_addon_create}{addon}/", json=payload)
         print(
             f'For tags "{item}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -709,15 +572,11 @@ def test_edit_extension_invalid_addon_tags(base_url, session_auth):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_add_valid_icon(base_url, session_auth, icon):
+def test_edit_extension_add_valid_icon(base_url, icon, api_client):
     """Upload a custom icon for an addon; JPG and PNG are the only accepted formats"""
     addon = payloads.edit_addon_details["slug"]
     with open(icon, "rb") as img:
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"icon": img},
-        )
+        edit_addon = api_client.patch(f"{_addon_create}{addon}/", files={"icon": img})
         print(
             f'For icon "{icon}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -754,18 +613,12 @@ def test_edit_extension_add_valid_icon(base_url, session_auth, icon):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_add_invalid_icons(
-    base_url, session_auth, count, icon, variables
-):
+def test_edit_extension_add_invalid_icons(count, icon, variables, api_client):
     """Verify that requests fail if icons do not meet these acceptance criteria:
     PNG or JPG, square images, non-animated images, valid image file"""
     addon = payloads.edit_addon_details["slug"]
     with open(icon, "rb") as img:
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"icon": img},
-        )
+        edit_addon = api_client.patch(f"{_addon_create}{addon}/", files={"icon": img})
         print(
             f'For icon "{icon}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -791,17 +644,14 @@ def test_edit_extension_add_invalid_icons(
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_add_valid_screenshots(base_url, session_auth, count, preview):
+def test_edit_extension_add_valid_screenshots(base_url, count, preview, api_client):
     """Set valid preview images for an addon; only JPG and JPG formats are accepted"""
     addon = payloads.edit_addon_details["slug"]
     with open(preview, "rb") as img:
-        edit_addon = requests.post(
-            url=f"{base_url}{_addon_create}{addon}/previews/",
-            headers={"Authorization": f"Session {session_auth}"},
+        edit_addon = api_client.post(
+            f"{_addon_create}{addon}/previews/",
             files={"image": img},
-            data={
-                "position": count
-            },  # sets the order in which the previews should appear
+            data={"position": count},
         )
         print(
             f'For image "{preview}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
@@ -816,28 +666,20 @@ def test_edit_extension_add_valid_screenshots(base_url, session_auth, count, pre
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_previews_add_caption(base_url, session_auth):
+def test_edit_extension_previews_add_caption(api_client):
     """Adds a short text for each screenshot uploaded for an addon"""
     addon = payloads.edit_addon_details["slug"]
     # capture the preview ids to be used in the PATCH request and add them to a list
     previews_id = []
-    get_addon = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_addon = api_client.get(f"{_addon_create}{addon}/")
     r = get_addon.json()
     for image in r["previews"]:
         previews_id.append(image.get("id"))
     payload = payloads.preview_captions
     # add a caption for all the available previews
     for preview in previews_id:
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/previews/{preview}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
+        edit_addon = api_client.patch(
+            f"{_addon_create}{addon}/previews/{preview}/", json=payload
         )
         response = edit_addon.json()
         assert (
@@ -847,13 +689,10 @@ def test_edit_extension_previews_add_caption(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_no_image_attached(base_url, session_auth):
+def test_edit_extension_no_image_attached(api_client):
     """Send a screenshot upload request without adding an image"""
     addon = payloads.edit_addon_details["slug"]
-    edit_addon = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/previews/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    edit_addon = api_client.post(f"{_addon_create}{addon}/previews/")
     assert (
         edit_addon.status_code == 400
     ), f"Actual status code was {edit_addon.status_code}"
@@ -881,17 +720,13 @@ def test_edit_extension_no_image_attached(base_url, session_auth):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_add_invalid_image(
-    base_url, session_auth, count, preview, variables
-):
+def test_edit_extension_add_invalid_image(count, preview, variables, api_client):
     """Verify that requests fail if images do not meet these acceptance criteria:
     PNG or JPG, non-animated images, valid image file"""
     addon = payloads.edit_addon_details["slug"]
     with open(preview, "rb") as img:
-        edit_addon = requests.post(
-            url=f"{base_url}{_addon_create}{addon}/previews/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"image": img},
+        edit_addon = api_client.post(
+            f"{_addon_create}{addon}/previews/", files={"image": img}
         )
         print(
             f'For image "{preview}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
@@ -905,38 +740,31 @@ def test_edit_extension_add_invalid_image(
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_extension_delete_previews(base_url, session_auth):
+def test_edit_extension_delete_previews(api_client):
     """Verify that addon previews can be deleted"""
     addon = payloads.edit_addon_details["slug"]
     # get the preview ids for the available images
     preview_ids = []
-    get_addon = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_addon = api_client.get(f"{_addon_create}{addon}/")
     r = get_addon.json()
     for image in r["previews"]:
         preview_ids.append(image.get("id"))
     for preview_id in preview_ids:
-        delete_image = requests.delete(
-            url=f"{base_url}{_addon_create}{addon}/previews/{preview_id}",
-            headers={"Authorization": f"Session {session_auth}"},
+        delete_image = api_client.delete(
+            f"{_addon_create}{addon}/previews/{preview_id}"
         )
         assert (
             delete_image.status_code == 204
         ), f"Actual status code was {delete_image.status_code}"
     # get the add-on details again
-    get_addon = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_addon = api_client.get(f"{_addon_create}{addon}/")
     # check that there are no screenshots left for this addon
     assert len(get_addon.json()["previews"]) == 0
 
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_default_locale_with_translations(base_url, session_auth):
+def test_edit_default_locale_with_translations(api_client):
     """Change the 'default_locale' of the addon to another locale for which we
     already have translations for the mandatory fields - i.e. 'name' and 'summary'"""
     addon = payloads.edit_addon_details["slug"]
@@ -945,14 +773,7 @@ def test_edit_default_locale_with_translations(base_url, session_auth):
     for locale in available_translations:
         # crete a new dictionary from the original payload, with variable values
         payload = {**payloads.edit_addon_details, "default_locale": locale}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.patch(f"{_addon_create}{addon}/", json=payload)
         print(
             f'For locale "{locale}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -966,7 +787,7 @@ def test_edit_default_locale_with_translations(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_default_locale_with_missing_translations(base_url, session_auth):
+def test_edit_default_locale_with_missing_translations(api_client):
     """Change the 'default_locale' of the addon to another locale for which we
     don't have translations for all the required fields - i.e. 'homepage', 'email'"""
     addon = payloads.edit_addon_details["slug"]
@@ -975,14 +796,7 @@ def test_edit_default_locale_with_missing_translations(base_url, session_auth):
     for locale in unavailable_translations:
         # crete a new dictionary from the original payload, with variable values
         payload = {**payloads.edit_addon_details, "default_locale": locale}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.patch(f"{_addon_create}{addon}/", json=payload)
         print(
             f'For locale "{locale}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -998,21 +812,14 @@ def test_edit_default_locale_with_missing_translations(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_default_locale_invalid_values(base_url, session_auth):
+def test_edit_default_locale_invalid_values(api_client):
     """Use some invalid/unaccepted data types for setting a 'default_locale'"""
     addon = payloads.edit_addon_details["slug"]
     invalid_locales = ["foo", 123, None, ["de", "fr"], ""]
     for locale in invalid_locales:
         # crete a new dictionary from the original payload, with variable values
         payload = {**payloads.edit_addon_details, "default_locale": locale}
-        edit_addon = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/",
-            headers={
-                "Authorization": f"Session {session_auth}",
-                "Content-Type": "application/json",
-            },
-            data=json.dumps(payload),
-        )
+        edit_addon = api_client.patch(f"{_addon_create}{addon}/", json=payload)
         print(
             f'For locale "{locale}": Response status is {edit_addon.status_code}; {edit_addon.text}\n'
         )
@@ -1032,7 +839,7 @@ def test_edit_default_locale_invalid_values(base_url, session_auth):
 
 
 @pytest.mark.serial
-def test_edit_addon_with_incorrect_account(base_url, selenium):
+def test_edit_addon_with_incorrect_account(base_url, selenium, api_client):
     """Edit the add-on details while being authenticated with a different, non-owner developer account"""
     amo = Home(selenium, base_url).open().wait_for_page_to_load()
     # login with a user that has no authorship over the addon we want to edit
@@ -1041,13 +848,8 @@ def test_edit_addon_with_incorrect_account(base_url, selenium):
     addon = payloads.edit_addon_details["slug"]
     # crete a new dictionary from the original payload, with a different name values
     payload = {**payloads.edit_addon_details, "name": {"en-US": "some_name"}}
-    edit_addon = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={
-            "Authorization": f'Session {session_cookie["value"]}',
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_addon = api_client.patch(
+        f"{_addon_create}{addon}/", auth=session_cookie["value"], json=payload
     )
     assert (
         edit_addon.status_code == 403
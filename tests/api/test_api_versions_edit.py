@@ -1,8 +1,4 @@
-import json
-import time
-
 import pytest
-import requests
 
 from api import payloads, api_helpers
 
@@ -26,23 +22,15 @@ _upload = "/api/v5/addons/upload/"
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_details(base_url, session_auth):
+def test_edit_version_details(api_client):
     """Edit the version specific fields, i.e. 'release_notes', 'license, 'compatibility'"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = api_client.get(f"{_addon_create}{addon}")
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = payloads.edit_version_details
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_version = api_client.patch(
+        f"{_addon_create}{addon}/versions/{version}/", json=payload
     )
     edit_version.raise_for_status()
     response = edit_version.json()
@@ -54,26 +42,18 @@ def test_edit_version_details(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_custom_license_no_text(base_url, session_auth):
+def test_edit_version_custom_license_no_text(api_client):
     """When setting a custom license, it is mandatory for that license to contain a text"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = api_client.get(f"{_addon_create}{addon}")
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {
         **payloads.custom_license,
         "custom_license": {"name": {"en-US": "no-text-provided"}},
     }
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_version = api_client.patch(
+        f"{_addon_create}{addon}/versions/{version}/", json=payload
     )
     assert (
         edit_version.status_code == 400
@@ -85,24 +65,16 @@ def test_edit_version_custom_license_no_text(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_set_custom_license(base_url, session_auth):
+def test_edit_version_set_custom_license(api_client):
     """Instead of using a predefined addon license provided by AMO, add a
     custom license with 'name' and 'text' defined by the addon author"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = api_client.get(f"{_addon_create}{addon}")
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = payloads.custom_license
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_version = api_client.patch(
+        f"{_addon_create}{addon}/versions/{version}/", json=payload
     )
     edit_version.raise_for_status()
     response = edit_version.json()
@@ -112,29 +84,20 @@ def test_edit_version_set_custom_license(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_listed_version(base_url, session_auth):
+def test_upload_new_listed_version(api_client):
     """Uploads a new listed version for an existing addon"""
     with open("sample-addons/listed-addon-new-version.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
+        upload = api_client.post(
+            _upload, files={"upload": file}, data={"channel": "listed"}
         )
-    time.sleep(5)
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    # wait for the upload to be processed before using it
+    api_helpers.wait_for_upload_processing(api_client, uuid)
     addon = payloads.edit_addon_details["slug"]
     payload = payloads.new_version_details(uuid)
-    new_version = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/versions/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    new_version = api_client.post(f"{_addon_create}{addon}/versions/", json=payload)
     new_version.raise_for_status()
     response = new_version.json()
     # verify that the new version was created with the data provided
@@ -146,33 +109,24 @@ def test_upload_new_listed_version(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_version_with_existing_version_number(base_url, session_auth):
+def test_upload_new_version_with_existing_version_number(api_client):
     """Uploads a new version with an existing version number; the upload should fail"""
     with open("sample-addons/listed-addon-new-version.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
+        upload = api_client.post(
+            _upload, files={"upload": file}, data={"channel": "listed"}
         )
-    time.sleep(5)
     print("Post upload json: " + f"{upload}")
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    # wait for the upload to be processed before using it
+    api_helpers.wait_for_upload_processing(api_client, uuid)
     print("UUID json: " + f"{uuid}")
     addon = payloads.edit_addon_details["slug"]
     print("addon json: " + f"{addon}")
     payload = payloads.new_version_details(uuid)
     print("payload json: " + f"{payload}")
-    new_version = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/versions/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    new_version = api_client.post(f"{_addon_create}{addon}/versions/", json=payload)
     print("payload json: " + f"{new_version}")
     assert (
         new_version.status_code == 409
@@ -184,39 +138,29 @@ def test_upload_new_version_with_existing_version_number(base_url, session_auth)
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_unlisted_version_with_put_method(base_url, session_auth):
+def test_upload_new_unlisted_version_with_put_method(api_client):
     """Takes an addon with listed version only and submits an unlisted version;
     this is creating an addon with mixed versions. Use the PUT endpoint in this
      case to check that it also works for a new version submission process"""
     addon = payloads.edit_addon_details["slug"]
     # get the addon guid required for the PUT method
-    get_addon_details = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_addon_details = api_client.get(f"{_addon_create}{addon}/")
     guid = get_addon_details.json()["guid"]
     # upload a new unlisted version
     with open("sample-addons/mixed-addon-versions.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "unlisted"},
+        upload = api_client.post(
+            _upload, files={"upload": file}, data={"channel": "unlisted"}
         )
-    time.sleep(5)
     upload.raise_for_status()
     resp = upload.json()
     # verify that the upload was created as unlisted
     assert "unlisted" in resp["channel"]
     # get the addon uuid generated after upload
     uuid = resp["uuid"]
-    new_version = requests.put(
-        url=f"{base_url}{_addon_create}{guid}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps({"version": {"upload": uuid}}),
+    # wait for the upload to be processed before using it
+    api_helpers.wait_for_upload_processing(api_client, uuid)
+    new_version = api_client.put(
+        f"{_addon_create}{guid}/", json={"version": {"upload": uuid}}
     )
     new_version.raise_for_status()
     response = new_version.json()
@@ -226,30 +170,21 @@ def test_upload_new_unlisted_version_with_put_method(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_version_with_different_addon_type(base_url, session_auth):
+def test_upload_new_version_with_different_addon_type(api_client):
     """Take an exiting addon of type 'extensions' and try to upload a new version
     of type 'statictheme' for it; the submission should fail"""
     with open("sample-addons/theme.xpi", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
+        upload = api_client.post(
+            _upload, files={"upload": file}, data={"channel": "listed"}
         )
-    time.sleep(5)
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    # wait for the upload to be processed before using it
+    api_helpers.wait_for_upload_processing(api_client, uuid)
     addon = payloads.edit_addon_details["slug"]
     payload = {"upload": uuid}
-    new_version = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/versions/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    new_version = api_client.post(f"{_addon_create}{addon}/versions/", json=payload)
     assert (
         new_version.status_code == 400
     ), f"Actual response: status code = {new_version.status_code}, message = {new_version.text}"
@@ -261,7 +196,7 @@ def test_upload_new_version_with_different_addon_type(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_version_with_different_guid(base_url, session_auth):
+def test_upload_new_version_with_different_guid(api_client):
     """Take an exiting addon and submit a new version that has a different GUID
     from what we have on AMO for this addon; the submission should fail"""
     guid = f"random-guid@{reusables.get_random_string(6)}"
@@ -272,28 +207,18 @@ def test_upload_new_version_with_different_guid(base_url, session_auth):
         "name": "New version with different guid",
         "browser_specific_settings": {"gecko": {"id": guid}},
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+    xpi = api_helpers.make_addon(manifest)
+    upload = api_client.post(
+        _upload, files={"upload": ("make-addon.zip", xpi)}, data={"channel": "listed"}
+    )
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    # wait for the upload to be processed before using it
+    api_helpers.wait_for_upload_processing(api_client, uuid)
     addon = payloads.edit_addon_details["slug"]
     payload = {"upload": uuid}
-    new_version = requests.post(
-        url=f"{base_url}{_addon_create}{addon}/versions/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
-    )
+    new_version = api_client.post(f"{_addon_create}{addon}/versions/", json=payload)
     assert (
         new_version.status_code == 400
     ), f"Actual response: status code = {new_version.status_code}, message = {new_version.text}"
@@ -305,31 +230,27 @@ def test_upload_new_version_with_different_guid(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_upload_new_version_with_sources(base_url, session_auth):
+def test_upload_new_version_with_sources(base_url, session_auth, api_client):
     """Uploads a new version for an exiting addon while also attaching additional source code"""
     manifest = {
         **payloads.minimal_manifest,
         "name": "EN-US Name edited",
         "version": "3.0",
     }
-    api_helpers.make_addon(manifest)
-    with open("sample-addons/make-addon.zip", "rb") as file:
-        upload = requests.post(
-            url=f"{base_url}{_upload}",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"upload": file},
-            data={"channel": "listed"},
-        )
-    time.sleep(5)
+    xpi = api_helpers.make_addon(manifest)
+    upload = api_client.post(
+        _upload, files={"upload": ("make-addon.zip", xpi)}, data={"channel": "listed"}
+    )
     upload.raise_for_status()
     # get the addon uuid generated after upload
     uuid = upload.json()["uuid"]
+    # wait for the upload to be processed before using it
+    api_helpers.wait_for_upload_processing(api_client, uuid)
     addon = payloads.edit_addon_details["slug"]
     # submit the version and attach source code
     with open("sample-addons/listed-addon.zip", "rb") as source:
-        new_version = requests.post(
-            url=f"{base_url}{_addon_create}{addon}/versions/",
-            headers={"Authorization": f"Session {session_auth}"},
+        new_version = api_client.post(
+            f"{_addon_create}{addon}/versions/",
             data={"upload": uuid},
             files={"source": source},
         )
@@ -339,7 +260,9 @@ def test_upload_new_version_with_sources(base_url, session_auth):
     assert f"{base_url}/firefox/downloads/source/" in response["source"]
     url = response["source"]
     # compare the actual source file uploaded with the one returned by the API to make sure they match
-    response_source = requests.get(url, cookies={"sessionid": session_auth}, timeout=10)
+    response_source = api_client.get(
+        url, auth=False, cookies={"sessionid": session_auth}, stream=True, timeout=10
+    )
     api_helpers.compare_source_files(
         "sample-addons/listed-addon.zip", response_source, "POST"
     )
@@ -347,38 +270,37 @@ def test_upload_new_version_with_sources(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_change_sources(base_url, session_auth):
+def test_edit_version_change_sources(session_auth, api_client):
     """Upload different source file for an existing version and make sure that changes were applied"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = api_client.get(f"{_addon_create}{addon}")
     print("Request addon create: " + f"{request.json()}")
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
-    get_old_source = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_old_source = api_client.get(f"{_addon_create}{addon}/versions/{version}/")
     print("get old source request: " + f"{get_old_source.json()}")
-    # download the previous source code attached to the version
-    previous_source = requests.get(
-        get_old_source.json()["source"], cookies={"sessionid": session_auth}, timeout=10
+    # download the previous source code attached to the version; it has to be fetched
+    # before the PATCH replaces it, so the two downloads can't run concurrently
+    previous_source = api_client.get(
+        get_old_source.json()["source"],
+        auth=False,
+        cookies={"sessionid": session_auth},
+        timeout=10,
     )
     with open("sample-addons/unlisted-addon.zip", "rb") as source:
-        change_source = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"source": source},
+        change_source = api_client.patch(
+            f"{_addon_create}{addon}/versions/{version}/", files={"source": source}
         )
 
     print("previous source: " + f"{previous_source.json()}")
     print("change source: " + f"{change_source.json()}")
 
     # download the new source code attached to the  version
-    new_source = requests.get(
-        change_source.json()["source"], cookies={"sessionid": session_auth}, timeout=10
+    new_source = api_client.get(
+        change_source.json()["source"],
+        auth=False,
+        cookies={"sessionid": session_auth},
+        timeout=10,
     )
     print("new source: " + f"{new_source.json()}")
 
@@ -386,7 +308,6 @@ def test_edit_version_change_sources(base_url, session_auth):
     api_helpers.compare_source_files(previous_source, new_source, "PATCH")
 
 
-
 @pytest.mark.parametrize(
     "file_type",
     [
@@ -402,20 +323,17 @@ def test_edit_version_change_sources(base_url, session_auth):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_upload_supported_source_files(base_url, session_auth, file_type):
+def test_edit_version_upload_supported_source_files(
+    session_auth, file_type, api_client
+):
     """Upload all the supported source file types and make sure the request is successful"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = api_client.get(f"{_addon_create}{addon}")
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     with open(f"sample-addons/{file_type}", "rb") as file:
-        upload_source = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"source": file},
+        upload_source = api_client.patch(
+            f"{_addon_create}{addon}/versions/{version}/", files={"source": file}
         )
     print(upload_source)
     assert (
@@ -424,7 +342,9 @@ def test_edit_version_upload_supported_source_files(base_url, session_auth, file
     # verify that the file upload was successful by comparing the uploaded file with the file returned by the API
     response = upload_source.json()
     url = response["source"]
-    response_source = requests.get(url, cookies={"sessionid": session_auth}, timeout=10)
+    response_source = api_client.get(
+        url, auth=False, cookies={"sessionid": session_auth}, stream=True, timeout=10
+    )
     api_helpers.compare_source_files(
         f"sample-addons/{file_type}", response_source, "post"
     )
@@ -432,22 +352,15 @@ def test_edit_version_upload_supported_source_files(base_url, session_auth, file
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_sources_cannot_be_changed_for_approved_versions(
-    base_url, session_auth, variables
-):
+def test_sources_cannot_be_changed_for_approved_versions(variables, api_client):
     """Addons that were Approved by a reviewer can't have their source files changed"""
     addon = variables["approved_addon_with_sources"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = api_client.get(f"{_addon_create}{addon}")
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     with open("sample-addons/source-img.zip", "rb") as file:
-        upload_source = requests.patch(
-            url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-            headers={"Authorization": f"Session {session_auth}"},
-            files={"source": file},
+        upload_source = api_client.patch(
+            f"{_addon_create}{addon}/versions/{version}/", files={"source": file}
         )
     assert (
         upload_source.status_code == 400
@@ -479,23 +392,15 @@ def test_sources_cannot_be_changed_for_approved_versions(
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_invalid_license(base_url, session_auth, slug):
+def test_edit_version_invalid_license(slug, api_client):
     """Extension license slugs have to match one of the predefined licenses accepted by AMO"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = api_client.get(f"{_addon_create}{addon}")
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {**payloads.edit_version_details, "license": slug}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_version = api_client.patch(
+        f"{_addon_create}{addon}/versions/{version}/", json=payload
     )
     print(
         f'For license slug "{slug}": Response status is '
@@ -516,13 +421,10 @@ def test_edit_version_invalid_license(base_url, session_auth, slug):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_both_license_and_custom_license(base_url, session_auth):
+def test_edit_version_both_license_and_custom_license(api_client):
     """An addon can have either a predefined license or a custom license but not both"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = api_client.get(f"{_addon_create}{addon}")
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     # add a custom license besides the 'license' we already have in the edit version payload
@@ -530,13 +432,8 @@ def test_edit_version_both_license_and_custom_license(base_url, session_auth):
         **payloads.edit_version_details,
         "custom_license": {"name": {"en-US": "custom-name"}},
     }
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_version = api_client.patch(
+        f"{_addon_create}{addon}/versions/{version}/", json=payload
     )
     assert (
         edit_version.status_code == 400
@@ -566,23 +463,15 @@ def test_edit_version_both_license_and_custom_license(base_url, session_auth):
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_invalid_custom_license_format(base_url, session_auth, value):
+def test_edit_version_invalid_custom_license_format(value, api_client):
     """Custom licenses should be a dictionary containing the license name and text; other formats should fail"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = api_client.get(f"{_addon_create}{addon}")
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {**payloads.custom_license, "custom_license": value}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_version = api_client.patch(
+        f"{_addon_create}{addon}/versions/{version}/", json=payload
     )
     print(
         f'For custom_license "{value}": Response status is '
@@ -614,29 +503,19 @@ def test_edit_version_invalid_custom_license_format(base_url, session_auth, valu
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_invalid_custom_license_name_and_text(
-    base_url, session_auth, value
-):
+def test_edit_version_invalid_custom_license_name_and_text(value, api_client):
     """Custom licenses should be a dictionary containing the license name and text;
     also, the name and text need to be specified in a valid locale"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = api_client.get(f"{_addon_create}{addon}")
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {
         **payloads.custom_license,
         "custom_license": {"name": value, "text": value},
     }
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_version = api_client.patch(
+        f"{_addon_create}{addon}/versions/{version}/", json=payload
     )
     print(
         f'For custom_license "{value}": Response status is '
@@ -674,23 +553,15 @@ def test_edit_version_invalid_custom_license_name_and_text(
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_invalid_compatibility_format(base_url, session_auth, value):
+def test_edit_version_invalid_compatibility_format(value, api_client):
     """The compatibility field needs to be either a dictionary or a list; other formats should fail"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = api_client.get(f"{_addon_create}{addon}")
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {**payloads.edit_version_details, "compatibility": value}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_version = api_client.patch(
+        f"{_addon_create}{addon}/versions/{version}/", json=payload
     )
     print(
         f'For compatibility "{value}": Response status is '
@@ -720,36 +591,28 @@ def test_edit_version_invalid_compatibility_format(base_url, session_auth, value
             },
         ),
         (["firefox"], {"firefox": {"min": "58.0", "max": "*"}}),
-        ({"firefox": {"min": "65.0"}}, {"firefox": {"min": "65.0", "max": "*"}})
+        ({"firefox": {"min": "65.0"}}, {"firefox": {"min": "65.0", "max": "*"}}),
     ],
     ids=[
         "Compatibility in list format, valid apps (firefox and android)",
         "Compatibility in list format, only firefox compatibility",
-        "Valid app - firefox and valid appversion"
+        "Valid app - firefox and valid appversion",
     ],
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 def test_edit_version_valid_compatibility_values(
-    base_url, session_auth, request_value, response_value
+    request_value, response_value, api_client
 ):
     """Tests the compatibility field with a set of valid values"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = api_client.get(f"{_addon_create}{addon}")
     print(request)
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {**payloads.edit_version_details, "compatibility": request_value}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_version = api_client.patch(
+        f"{_addon_create}{addon}/versions/{version}/", json=payload
     )
     print(edit_version)
     print(
@@ -785,24 +648,16 @@ def test_edit_version_valid_compatibility_values(
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_invalid_compatibility_values(base_url, session_auth, value):
+def test_edit_version_invalid_compatibility_values(value, api_client):
     """Compatibility values should be a combination of valid applications (firefox or android)
     and application versions (existing versions of Firefox for desktop/android)"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = api_client.get(f"{_addon_create}{addon}")
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {**payloads.edit_version_details, "compatibility": value}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_version = api_client.patch(
+        f"{_addon_create}{addon}/versions/{version}/", json=payload
     )
     print(
         f'For compatibility "{value}": Response status is '
@@ -828,59 +683,34 @@ def test_edit_version_invalid_compatibility_values(base_url, session_auth, value
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_edit_version_disable_current_version(base_url, session_auth):
+def test_edit_version_disable_current_version(api_client):
     """Disable then re-enable the current version of an addon as a developer"""
     addon = payloads.edit_addon_details["slug"]
-    request = requests.get(
-        url=f"{base_url}{_addon_create}{addon}",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    request = api_client.get(f"{_addon_create}{addon}")
     # get the version id of the version we want to edit
     version = request.json()["current_version"]["id"]
     payload = {"is_disabled": True}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_version = api_client.patch(
+        f"{_addon_create}{addon}/versions/{version}/", json=payload
     )
     assert (
         edit_version.status_code == 200
     ), f"Actual response was: {edit_version.status_code}; {edit_version.text}"
     # verify that the version has been disabled successfully
-    version_status = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-    )
+    version_status = api_client.get(f"{_addon_create}{addon}/versions/{version}/")
     assert (
         version_status.json()["is_disabled"] is True
     ), f"Actual response was: {version_status.json()}"
     # re-enable the version
     payload = {"is_disabled": False}
-    edit_version = requests.patch(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-        data=json.dumps(payload),
+    edit_version = api_client.patch(
+        f"{_addon_create}{addon}/versions/{version}/", json=payload
     )
     assert (
         edit_version.status_code == 200
     ), f"Actual response was: {edit_version.status_code}; {edit_version.text}"
     # verify that the version has been re-enabled successfully
-    version_status = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/versions/{version}/",
-        headers={
-            "Authorization": f"Session {session_auth}",
-            "Content-Type": "application/json",
-        },
-    )
+    version_status = api_client.get(f"{_addon_create}{addon}/versions/{version}/")
     assert (
         version_status.json()["is_disabled"] is False
     ), f"Actual response was: {version_status.json()}"
@@ -888,13 +718,10 @@ def test_edit_version_disable_current_version(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_delete_extension_non_existent_addon(base_url, session_auth):
+def test_delete_extension_non_existent_addon(api_client):
     """Try to obtain a delete token for a non-existent addon"""
     addon = "rand-om123"
-    get_delete_confirm = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/delete_confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_delete_confirm = api_client.get(f"{_addon_create}{addon}/delete_confirm/")
     assert (
         get_delete_confirm.status_code == 404
     ), f"Actual response: {get_delete_confirm.status_code}, {get_delete_confirm.text}"
@@ -902,13 +729,10 @@ def test_delete_extension_non_existent_addon(base_url, session_auth):
 
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_delete_extension_from_another_author(base_url, session_auth, variables):
+def test_delete_extension_from_another_author(variables, api_client):
     """Try to delete someone else's addon; the request should fail"""
     addon = variables["detail_extension_slug"]
-    get_delete_confirm = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/delete_confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_delete_confirm = api_client.get(f"{_addon_create}{addon}/delete_confirm/")
     assert (
         get_delete_confirm.status_code == 403
     ), f"Actual response: {get_delete_confirm.status_code}, {get_delete_confirm.text}"
@@ -935,13 +759,11 @@ def test_delete_extension_from_another_author(base_url, session_auth, variables)
 )
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
-def test_delete_extension_with_invalid_tokens(base_url, session_auth, token):
+def test_delete_extension_with_invalid_tokens(token, api_client):
     """Use invalid formats or data types for the token required to delete an addon"""
     addon = payloads.edit_addon_details["slug"]
-    delete_addon = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-        params={"delete_confirm": token},
+    delete_addon = api_client.delete(
+        f"{_addon_create}{addon}/", params={"delete_confirm": token}
     )
     assert (
         delete_addon.status_code == 400
@@ -959,27 +781,19 @@ def test_delete_extension_with_invalid_tokens(base_url, session_auth, token):
 @pytest.mark.serial
 @pytest.mark.create_session("api_user")
 @pytest.mark.clear_session
-def test_delete_extension_valid_token(selenium, base_url, session_auth, variables):
+def test_delete_extension_valid_token(selenium, variables, api_client):
     addon = payloads.edit_addon_details["slug"]
-    get_delete_confirm = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/delete_confirm/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_delete_confirm = api_client.get(f"{_addon_create}{addon}/delete_confirm/")
     get_delete_confirm.raise_for_status()
     r = get_delete_confirm.json()
     token = r["delete_confirm"]
-    delete_addon = requests.delete(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-        params={"delete_confirm": token},
+    delete_addon = api_client.delete(
+        f"{_addon_create}{addon}/", params={"delete_confirm": token}
     )
     assert (
         delete_addon.status_code == 204
     ), f"Actual status code was {delete_addon.status_code}"
-    get_addon = requests.get(
-        url=f"{base_url}{_addon_create}{addon}/",
-        headers={"Authorization": f"Session {session_auth}"},
-    )
+    get_addon = api_client.get(f"{_addon_create}{addon}/")
     assert (
         get_addon.status_code == 404
     ), f"Actual status code was {get_addon.status_code}"
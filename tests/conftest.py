@@ -1,22 +1,142 @@
-import os
-
 import pytest
 import requests
 
-from selenium.common.exceptions import StaleElementReferenceException
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    WebDriverException,
+)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+from api import api_client as client
+from api.addon_pool import AddonPoolManager
+from api.addon_seeder import AddonSeeder
+from api.amo_oracle import AmoOracle
+from api.approval_tracker import ApprovalTracker
+from api.fake_amo import FakeAmo
+from api.link_checker import LinkChecker
+from api.session_broker import SessionBroker
+from api.session_store import SessionStore
+from pages.desktop.frontend.details import Detail
 from pages.desktop.frontend.home import Home
 from pages.desktop.frontend.login import Login
+from plugins import resource_groups
+from plugins.durations import DurationRecorder, DurationStore
+from plugins.jsonl_report import JsonlReport
+from plugins.profiler import Profiler
+from plugins.quarantine import Quarantine
 
 # Window resolutions
 DESKTOP = (1920, 1080)
+# parallel requests made by the link_checker fixture
+LINK_CHECK_WORKERS = 8
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--reuse-browser",
+        action="store_true",
+        default=False,
+        help="keep one browser open per worker and reset its state between tests, "
+        "instead of starting a new browser for every test",
+    )
+    parser.addoption(
+        "--fake-amo",
+        action="store_true",
+        default=False,
+        help="run the API tests against a local, in-memory AMO stand-in instead of "
+        "the environment from the variables file; tests needing a browser are skipped",
+    )
+    parser.addoption(
+        "--addon-pool",
+        type=int,
+        default=0,
+        metavar="SIZE",
+        help="create the add-ons used by the listed_addon, unlisted_addon and theme "
+        "fixtures in the background, keeping up to SIZE of each kind ready per user",
+    )
+    parser.addoption(
+        "--profile-run",
+        metavar="PATH",
+        default=None,
+        help="record the WebDriver commands, waits, sleeps and HTTP requests of every test, "
+        "write them to PATH as JSON and show a summary at the end of the run",
+    )
+    parser.addoption(
+        "--report-dir",
+        metavar="DIR",
+        default=None,
+        help="write the test results to DIR/results.jsonl as the tests finish, with their logs "
+        "and screenshots as separate compressed files and a static viewer (DIR/index.html)",
+    )
+    parser.addoption(
+        "--longest-first",
+        action="store_true",
+        default=False,
+        help="with '--dist loadgroup', start the tests and groups of tests that took the "
+        "longest in the previous runs first, using the durations saved in durations.db",
+    )
+    parser.addoption(
+        "--quarantine",
+        action="store_true",
+        default=False,
+        help="don't fail the run for the tests that were flaky in the previous runs; "
+        "when they fail, run them again on their own at the end and report them separately",
+    )
+
+
+def pytest_configure(config):
+    path = config.getoption("profile_run")
+    if path:
+        worker = getattr(config, "workerinput", {}).get("workerid")
+        profiler = Profiler(path, worker)
+        profiler.install()
+        config.pluginmanager.register(profiler, "profiler")
+    # with xdist, the results of the workers are all written by the controller
+    if hasattr(config, "workerinput"):
+        return
+    directory = config.getoption("report_dir")
+    if directory:
+        config.pluginmanager.register(
+            JsonlReport(directory, config.getoption("base_url")), "jsonl_report"
+        )
+    # the runs against the local AMO stand-in say nothing about the real durations
+    if not config.getoption("fake_amo") and not config.getoption("collectonly"):
+        store = DurationStore(config.rootpath / "durations.db")
+        config.pluginmanager.register(DurationRecorder(store, config), "durations")
+        if config.getoption("quarantine"):
+            config.pluginmanager.register(Quarantine(config, store), "quarantine")
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    # needs to run before pytest-xdist reads the 'xdist_group' markers
+    resource_groups.assign_groups(items)
+    if config.getoption("fake_amo"):
+        skip = pytest.mark.skip(reason="needs a browser, not available with --fake-amo")
+        for item in items:
+            if "selenium" in item.fixturenames:
+                item.add_marker(skip)
 
 
 @pytest.fixture(scope="session")
-def base_url(base_url, variables):
+def fake_amo(pytestconfig, variables):
+    """Local AMO stand-in started once per test run (per xdist worker) when the
+    suite is run with '--fake-amo'; None otherwise"""
+    if not pytestconfig.getoption("fake_amo"):
+        yield None
+        return
+    amo = FakeAmo().start()
+    amo.seed(variables)
+    yield amo
+    amo.stop()
+
+
+@pytest.fixture(scope="session")
+def base_url(base_url, variables, fake_amo):
+    if fake_amo is not None:
+        return fake_amo.url
     return variables["base_url"]
 
 
@@ -88,6 +208,121 @@ def firefox_options(firefox_options, base_url, variables):
     return firefox_options
 
 
+@pytest.fixture(scope="session")
+def reusable_browser():
+    """Holds the browser kept open between tests when running with --reuse-browser;
+    the browser is closed once all the tests on the worker have finished"""
+    browser = {}
+    yield browser
+    if "driver" in browser:
+        browser["driver"].quit()
+
+
+def reset_browser(driver, base_url, fxa_host=None):
+    """Bring a reused browser back to a clean state before the next test:
+    close any extra windows, drop the AMO and FxA cookies and the AMO web storage
+    and leave the page"""
+    for handle in driver.window_handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(driver.window_handles[0])
+    if fxa_host:
+        # without this, the next test logging in would get the FxA session of the previous user;
+        # robots.txt is the lightest page to be on the FxA domain
+        driver.get(f"https://{fxa_host}/robots.txt")
+        driver.delete_all_cookies()
+    # cookies and web storage are bound to the domain of the current page,
+    # so we need to be on AMO to be able to clear them
+    if not driver.current_url.startswith(base_url):
+        driver.get(base_url)
+    driver.delete_all_cookies()
+    driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+    driver.get("about:blank")
+    driver.set_window_size(*DESKTOP)
+
+
+def reuses_browser(request):
+    """Whether the test runs in the browser kept open between tests: with --reuse-browser,
+    or when it shares a detail page. Tests that change the browser profile, such as add-on
+    installs using the 'firefox' fixture, or that are marked with 'fresh_browser' always
+    get a new browser instance."""
+    return (
+        request.config.getoption("reuse_browser")
+        or "detail_page" in request.fixturenames
+    ) and not (
+        request.node.get_closest_marker("fresh_browser")
+        or "firefox" in request.fixturenames
+    )
+
+
+@pytest.fixture
+def shared_driver(
+    request, base_url, variables, driver_class, driver_kwargs, reusable_browser
+):
+    """The browser kept open across tests, used instead of the pytest-selenium driver by the
+    tests selected with reuses_browser. Tests using 'detail_page' share their browser even
+    without --reuse-browser; it is then closed when a test that doesn't share it starts"""
+    shares_page = "detail_page" in request.fixturenames
+    if "driver" in reusable_browser:
+        driver = reusable_browser["driver"]
+        if "detail_page" in reusable_browser and not shares_page:
+            # the previous test left its page loaded for the tests sharing it
+            reusable_browser.pop("detail_page")
+            reset_browser(driver, base_url, variables.get("fxa_login_page"))
+    else:
+        driver = driver_class(**driver_kwargs)
+        reusable_browser["driver"] = driver
+    # needed by pytest-selenium to capture screenshots and logs for the html report
+    request.node._driver = driver
+    yield driver
+    try:
+        shared = reusable_browser.get("detail_page")
+        if (
+            shared
+            and not request.node.get_closest_marker("changes_page")
+            and driver.current_url == shared["url"]
+            and len(driver.window_handles) == 1
+        ):
+            # the page is kept as it is for the next test reading it
+            return
+        reusable_browser.pop("detail_page", None)
+        reset_browser(driver, base_url, variables.get("fxa_login_page"))
+    except WebDriverException as error:
+        # the browser is in a state we can't recover from; the next test will start a new one
+        print(f"Could not reset the browser, it will be restarted: {error.msg}")
+        reusable_browser.pop("driver")
+        reusable_browser.pop("detail_page", None)
+        driver.quit()
+
+
+@pytest.fixture
+def detail_page(request, selenium, base_url, reusable_browser):
+    """Opens the detail page of an add-on, by slug, guid or id, in a browser kept open for
+    the tests using this fixture. The page is left loaded after the test, so that the next
+    test reading the same add-on gets it, and the elements its Detail object already found,
+    without loading the page again. Tests that click, type or navigate on the page must
+    be marked with 'changes_page' so that the page is loaded again for the next test."""
+    authenticated = request.node.get_closest_marker(
+        "login"
+    ) or request.node.get_closest_marker("create_session")
+    assert not authenticated, "Shared detail pages are only available to anonymous users"
+
+    def open_page(addon):
+        shared = reusable_browser.get("detail_page")
+        if shared and shared["addon"] == addon:
+            return shared["page"]
+        selenium.get(f"{base_url}/addon/{addon}")
+        page = Detail(selenium, base_url).wait_for_page_to_load()
+        reusable_browser["detail_page"] = {
+            "addon": addon,
+            "url": selenium.current_url,
+            "page": page,
+        }
+        return page
+
+    return open_page
+
+
 @pytest.fixture
 def firefox_notifications(notifications):
     return notifications
@@ -98,9 +333,18 @@ def firefox_notifications(notifications):
     params=[DESKTOP],
     ids=["Desktop"],
 )
-def selenium(selenium, base_url, session_auth, request):
+def selenium(request, base_url, session_auth, session_broker, reusable_browser):
     """Fixture to set a custom resolution for tests running on Desktop
-    and handle browser sessions when needed"""
+    and handle browser sessions when needed. The browser comes from the pytest-selenium
+    driver, or from shared_driver for the tests reusing the browser kept open"""
+    if reuses_browser(request):
+        selenium = request.getfixturevalue("shared_driver")
+    else:
+        if not request.config.getoption("reuse_browser") and "driver" in reusable_browser:
+            # the browser was only kept open for the tests sharing a detail page
+            reusable_browser.pop("detail_page", None)
+            reusable_browser.pop("driver").quit()
+        selenium = request.getfixturevalue("driver")
     selenium.set_window_size(*request.param)
     # establishing actions  based on markers
     create_session = request.node.get_closest_marker("create_session")
@@ -120,26 +364,36 @@ def selenium(selenium, base_url, session_auth, request):
             }
         )
     # this is used when we want to start the browser with a normal login
-    # mostly used for the scope of getting the session cookie and storing it for later use
+    # mostly used for the scope of getting the session cookie and storing it for later use;
+    # the session is shared through the session store with the other tests and workers
     if login:
-        home = Home(selenium, base_url).open().wait_for_page_to_load()
-        home.header.click_login()
-        home.wait.until(
-            EC.visibility_of_element_located((By.NAME, "email")),
-            message=f"FxA email input field was not displayed in {selenium.current_url}",
-        )
         user = login.args[0]
-        Login(selenium, base_url).account(user)
-        home.wait.until(
-            EC.url_contains("addons"),
-            message=f"AMO could not be loaded in {selenium.current_url}",
-        )
-        session_cookie = selenium.get_cookie("sessionid")
-        with open(user + ".txt", "w") as file:
-            file.write(session_cookie["value"])
+        sessionid = session_broker.get(user)
+        if sessionid:
+            # the user has already logged in during this run and the session is
+            # still valid, so we only need to set the cookie instead of a new FxA login
+            selenium.get(base_url)
+            selenium.add_cookie({"name": "sessionid", "value": sessionid})
+            Home(selenium, base_url).open().wait_for_page_to_load()
+        else:
+            home = Home(selenium, base_url).open().wait_for_page_to_load()
+            home.header.click_login()
+            home.wait.until(
+                EC.visibility_of_element_located((By.NAME, "email")),
+                message=f"FxA email input field was not displayed in {selenium.current_url}",
+            )
+            Login(selenium, base_url).account(user)
+            home.wait.until(
+                EC.url_contains("addons"),
+                message=f"AMO could not be loaded in {selenium.current_url}",
+            )
+            session_cookie = selenium.get_cookie("sessionid")
+            session_broker.store_session(
+                user, session_cookie["value"], session_cookie.get("expiry")
+            )
     yield selenium
 
-    # delete the user session and files created for a test suite;
+    # delete the user session created for a test suite;
     # this is normally used in the last test of a suite to handle the clean-up part
     if clear_session:
         # clear session by calling the DELETE session API
@@ -162,29 +416,90 @@ def selenium(selenium, base_url, session_auth, request):
             "Valid user session not found matching the provided session key."
             in get_user.text
         ), f"Actual response message was {get_user.text}"
-        user_file = create_session.args[0]
-        if os.path.exists(f"{user_file}.txt"):
-            os.remove(f"{user_file}.txt")
-        else:
-            # fail if the file does not exist
-            raise FileNotFoundError("The file does not exist")
+        # remove the session from the store so that no other test tries to use it
+        session_broker.invalidate(create_session.args[0])
 
 
 @pytest.fixture(scope="function")
-def session_auth(request):
+def session_auth(request, session_broker, fake_amo):
     """Fixture that reads and returns the sessionid cookie; to be used as a
     standalone fixture for in API tests that require authentication and
     also complements the selenium fixture  when we want to start
     the browser with an active user session"""
     marker = request.node.get_closest_marker("create_session")
-    # the user file is passed in the test as a marker argument
+    # the user is passed in the test as a marker argument
     if marker:
-        user_file = marker.args[0]
-        with open(f"{user_file}.txt", "r") as file:
-            sessionid = str(file.read())
+        user = marker.args[0]
+        if fake_amo is not None:
+            # the stand-in creates the users on demand, no need to log in first
+            return fake_amo.session_for(user)
+        sessionid = session_broker.get(user)
+        if sessionid is None:
+            pytest.fail(
+                f"No valid session was found for '{user}'; the user needs to log in first "
+                f"in a test marked with @pytest.mark.login('{user}')"
+            )
         return sessionid
 
 
+@pytest.fixture(scope="session")
+def api_session():
+    """A pooled requests.Session kept open for the whole test run (one per xdist worker),
+    so that API calls reuse connections and share the same retry policy"""
+    session = client.create_session()
+    yield session
+    session.close()
+
+
+@pytest.fixture(scope="session")
+def amo_oracle(api_session, base_url):
+    """Add-on, version and rating data read from the public API, to compare with the values
+    displayed on the site; the responses are kept for the whole run (one cache per worker)"""
+    return AmoOracle(client.ApiClient(api_session, base_url))
+
+
+@pytest.fixture(scope="session")
+def link_checker():
+    """Checks page links over HTTP, in parallel; each URL is requested once per worker,
+    so the header and footer links read by several tests are only checked the first time"""
+    checker = LinkChecker(client.create_session(retries=1, pool_size=LINK_CHECK_WORKERS), LINK_CHECK_WORKERS)
+    yield checker
+    checker.session.close()
+
+
+@pytest.fixture(scope="session")
+def session_store(pytestconfig):
+    """SQLite store holding the user sessions; it lives in the project root
+    so that all the xdist workers of a run share the same sessions"""
+    return SessionStore(pytestconfig.rootpath / "sessions.db")
+
+
+@pytest.fixture(scope="session")
+def session_broker(api_session, base_url, session_store):
+    """Caches the sessionid of each user logged in through the 'login' marker, so that
+    every user goes through the FxA login only once per test run"""
+    return SessionBroker(client.ApiClient(api_session, base_url), session_store)
+
+
+@pytest.fixture
+def api_client(api_session, base_url, session_auth):
+    """API client bound to the current base_url; requests are authenticated with the
+    session of the user passed in the 'create_session' marker, if the test has one"""
+    return client.ApiClient(api_session, base_url, session_auth)
+
+
+@pytest.fixture(scope="session")
+def approval_tracker(base_url):
+    """Watches submitted versions through the API until they are auto-approved; shared
+    by all the tests of a worker, so several versions can be awaited at the same time.
+    It polls from its own thread, so it gets its own session instead of api_session."""
+    session = client.create_session()
+    tracker = ApprovalTracker(client.ApiClient(session, base_url))
+    yield tracker
+    tracker.stop()
+    session.close()
+
+
 @pytest.fixture
 def wait():
     """A preset wait to be used in test methods. Removes the necessity to declare a
@@ -194,21 +509,90 @@ def wait():
     )
 
 
+# the fixtures served by the add-on pool and the kind of add-on each of them needs
+POOLED_ADDONS = {"listed_addon": "listed", "unlisted_addon": "unlisted", "theme": "theme"}
+
+
+def seeded_addons_user(item):
+    """The user that the add-ons seeded for a test belong to"""
+    marker = item.get_closest_marker("create_session") or item.get_closest_marker("login")
+    return marker.args[0] if marker else None
+
+
+@pytest.fixture(scope="session")
+def addon_pools(request, api_session, base_url):
+    """Add-on pools of the users of the run when the suite is run with '--addon-pool';
+    each pool pre-creates the add-ons that the collected tests will lease, so the
+    listed_addon, unlisted_addon and theme fixtures don't wait for them. None otherwise."""
+    size = request.config.getoption("addon_pool")
+    if not size:
+        yield None
+        return
+    demand = {}
+    for item in request.session.items:
+        user = seeded_addons_user(item)
+        for fixture, kind in POOLED_ADDONS.items():
+            if user and fixture in item.fixturenames:
+                demand.setdefault(user, {}).setdefault(kind, 0)
+                demand[user][kind] += 1
+    # every xdist worker collects all the tests but only runs its share of them; the tests
+    # that find no ready add-on create their own, as they do without the pool
+    workers = getattr(request.config, "workerinput", {}).get("workercount", 1)
+    for kinds in demand.values():
+        for kind, count in kinds.items():
+            kinds[kind] = -(-count // workers)
+    manager = AddonPoolManager(
+        lambda sessionid: client.ApiClient(api_session, base_url, sessionid), size, demand
+    )
+    yield manager
+    manager.close()
+
+
+@pytest.fixture
+def addon_seeder(request, api_session, base_url, session_auth, session_broker, addon_pools):
+    """Creates add-ons through the API for the user set with the 'create_session' or
+    'login' marker of the test and deletes them once the test has completed"""
+    sessionid = session_auth
+    if sessionid is None:
+        login = request.node.get_closest_marker("login")
+        assert login, "Seeding add-ons needs a user set with the 'create_session' or 'login' markers"
+        # the user logs in when the browser is started
+        request.getfixturevalue("selenium")
+        sessionid = session_broker.get(login.args[0])
+    pool = None
+    if addon_pools is not None:
+        pool = addon_pools.pool(seeded_addons_user(request.node), sessionid)
+    seeder = AddonSeeder(client.ApiClient(api_session, base_url, sessionid), pool)
+    yield seeder
+    seeder.cleanup()
+
+
+@pytest.fixture
+def listed_addon(addon_seeder):
+    """A listed extension, created through the API and deleted after the test"""
+    return addon_seeder.lease("listed")
+
+
+@pytest.fixture
+def unlisted_addon(addon_seeder):
+    """An unlisted extension, created through the API and deleted after the test"""
+    return addon_seeder.lease("unlisted")
+
+
+@pytest.fixture
+def theme(addon_seeder):
+    """A listed static theme, created through the API and deleted after the test"""
+    return addon_seeder.lease("theme")
+
+
 @pytest.fixture
-def delete_themes(selenium, base_url):
+def delete_themes(selenium, api_session, base_url):
     """Use this fixture in devhub theme submission tests when we want to
-    immediately delete the theme once the test has completed"""
-    yield
-
-    from pages.desktop.developers.devhub_home import DevHubHome
-
-    page = DevHubHome(selenium, base_url).open().wait_for_page_to_load()
-    manage_addons = page.click_my_addons_header_link()
-    manage_addons.click_on_my_themes()
-    while len(manage_addons.addon_list) > 0:
-        addon = manage_addons.addon_list[0]
-        edit = addon.click_addon_name()
-        manage = edit.click_manage_versions_link()
-        delete = manage.delete_addon()
-        delete.input_delete_confirmation_string()
-        delete.confirm_delete_addon()
+    immediately delete the theme once the test has completed; the test adds
+    the slugs of the themes it submits to the list yielded by the fixture"""
+    slugs = []
+    yield slugs
+    sessionid = selenium.get_cookie("sessionid")["value"]
+    seeder = AddonSeeder(client.ApiClient(api_session, base_url, sessionid))
+    seeder.created.extend(slugs)
+    seeder.cleanup()
@@ -102,6 +102,8 @@ def test_submit_listed_wizard_theme_tc_id_c97500(selenium, base_url, variables,
     confirmation_page = theme_details.submit_addon()
     # verify that the theme preview has been generated after submission
     wait.until(lambda _: confirmation_page.generated_theme_preview.is_displayed())
+    # the theme is deleted through the API after the test
+    delete_themes.append(reusables.addon_slug_from_url(selenium.current_url))
     manage_themes = confirmation_page.click_manage_listing_button()
     # check that the submitted theme appears in the user's themes list
     assert theme_name in manage_themes.addon_list[0].name
@@ -116,7 +118,7 @@ def test_submit_a_new_version_for_addon_prod(selenium, base_url, variables, wait
         "name": "listed_addon_1_1",
         "description": "addon used for test",
     }
-    api_helpers.make_addon(manifest)
+    xpi = api_helpers.make_addon_file(manifest)
     page = DevHubHome(selenium, base_url).open().wait_for_page_to_load()
     page.devhub_login("submissions_user")
     manage_versions = ManageVersions(selenium, base_url)
@@ -124,7 +126,7 @@ def test_submit_a_new_version_for_addon_prod(selenium, base_url, variables, wait
     manage_versions.click_visible_radio_button()
     manage_versions.click_upload_new_version_button()
     submit_addon_page = SubmitAddon(selenium, base_url).wait_for_page_to_load()
-    submit_addon_page.upload_addon("make-addon.zip")
+    submit_addon_page.upload_addon(xpi)
     submit_addon_page.is_validation_successful()
     submit_addon_page.click_continue()
     upload_source = UploadSource(selenium, base_url).wait_for_page_to_load()
@@ -246,14 +248,18 @@ def test_upload_unsupported_file_validation_error(selenium, base_url, wait):
 
 @pytest.mark.serial
 @pytest.mark.create_session("submissions_user")
-def test_verify_first_version_autoapproval(selenium, base_url, variables, wait):
-    """This test will wait (for max 5 minutes) until the status of an add-on changes to approved"""
+def test_verify_first_version_autoapproval(
+    selenium, base_url, variables, wait, session_auth, approval_tracker
+):
+    """This test will wait (for max 7 minutes) until the status of an add-on changes to approved"""
     page = DevHubHome(selenium, base_url).open().wait_for_page_to_load()
     my_addons = page.click_my_addons_header_link()
     # open the edit page of the latest listed add-on submitted
-    edit_addon = my_addons.addon_list[0].click_addon_name()
-    version_status = edit_addon.click_manage_versions_link()
-    version_status.wait_for_version_autoapproval("Approved")
+    my_addons.addon_list[0].click_addon_name()
+    # the add-on slug is found in the edit page url, i.e. /developers/addon/<slug>/edit
+    addon = reusables.addon_slug_from_url(selenium.current_url)
+    approval = approval_tracker.watch(addon, session_auth)
+    approval_tracker.wait(approval)
 
 
 @pytest.mark.serial
@@ -411,7 +417,9 @@ def test_submit_mixed_addon_versions_tc_id_c14981(selenium, base_url, variables,
 
 
 @pytest.mark.serial
-def test_verify_new_unlisted_version_autoapproval_tc_id_C4372(selenium, base_url, variables):
+def test_verify_new_unlisted_version_autoapproval_tc_id_C4372(
+    selenium, base_url, variables, approval_tracker, api_client
+):
     """Uploads a new version to an existing addon and verifies that is auto-approved"""
     page = DevHubHome(selenium, base_url).open().wait_for_page_to_load()
     page.devhub_login("developer")
@@ -419,7 +427,7 @@ def test_verify_new_unlisted_version_autoapproval_tc_id_C4372(selenium, base_url
     # in order to upload a new version, we need to increment on the existing version number
     # to obtain the current version number, we make an API request that returns the value
     auth = selenium.get_cookie("sessionid")["value"]
-    version_string = api_helpers.get_addon_version_string(base_url, addon, auth)
+    version_string = api_helpers.get_addon_version_string(api_client, addon, auth)
     # create a new addon version with the incremented versio number
     manifest = {
         "manifest_version": 2,
@@ -427,24 +435,27 @@ def test_verify_new_unlisted_version_autoapproval_tc_id_C4372(selenium, base_url
         "version": f"{float(version_string) + 1}",
         "name": "New version auto-approval",
     }
-    api_helpers.make_addon(manifest)
+    xpi = api_helpers.make_addon_file(manifest)
     # go to the unlisted distribution page to submit a new version
     selenium.get(f"{base_url}/developers/addon/{addon}/versions/submit/")
     submit_version = SubmitAddon(selenium).wait_for_page_to_load()
-    submit_version.upload_addon("make-addon.zip")
+    submit_version.upload_addon(xpi)
     # wait for the validation to finish and check if it is successful
     submit_version.is_validation_successful()
     assert submit_version.success_validation_message.is_displayed()
     submit_version.click_continue()
+    # the approval is tracked in the background while the test checks the submission
+    approval = approval_tracker.watch(addon, auth, version=manifest["version"])
     confirmation_page = SubmissionConfirmationPage(selenium)
     assert (
         variables["unlisted_submission_confirmation"]
         in confirmation_page.submission_confirmation_messages[0].text
     )
-    # open the manage versions page for the addon and wait for the latest version to be auto-approved
-    selenium.get(f"{base_url}/developers/addon/{addon}/versions")
-    version_status = ManageVersions(selenium).wait_for_page_to_load()
-    version_status.wait_for_version_autoapproval("Approved")
+    ManageVersions.open_manage_versions_page_for_addon(selenium, base_url, addon)
+    manage_versions = ManageVersions(selenium, base_url).wait_for_page_to_load()
+    assert manage_versions.version_approval_status[0].is_displayed()
+    # wait for the new version to be auto-approved
+    approval_tracker.wait(approval)
 
 
 @pytest.mark.parametrize(
@@ -475,12 +486,12 @@ def test_submit_unicode_addon_tc_id_c4590(
         "name": addon_name,
         "description": description,
     }
-    api_helpers.make_addon(manifest)
+    xpi = api_helpers.make_addon_file(manifest)
     selenium.get(f"{base_url}/developers/addon/submit/upload-listed")
     submit_addon = SubmitAddon(selenium, base_url).wait_for_page_to_load()
     # checking that the Firefox compatibility checkbox is selected by default
     wait.until(lambda _: submit_addon.firefox_compat_checkbox.is_selected())
-    submit_addon.upload_addon("make-addon.zip")
+    submit_addon.upload_addon(xpi)
     # waits for the validation to complete and checks that is successful
     submit_addon.is_validation_successful()
     # on submit source code page, select 'No' to upload source code
@@ -1,6 +1,5 @@
 import time
 import pytest
-import urllib.request
 import urllib.parse
 import requests
 
@@ -10,6 +9,7 @@ from selenium.webdriver.support.wait import WebDriverWait
 from selenium.webdriver.support import expected_conditions as expected
 from selenium.webdriver.support.select import Select
 
+from api.link_checker import outgoing_target
 from pages.desktop.frontend.details import Detail
 from pages.desktop.frontend.search import Search
 from pages.desktop.frontend.static_pages import StaticPages
@@ -21,11 +21,9 @@ from scripts import reusables
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
-def test_extension_meta_card_tc_id_c392798(selenium, base_url, variables):
+def test_extension_meta_card_tc_id_c392798(detail_page, variables):
     # Checks addon essential data (name, icon, author name, summary)
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url)
+    addon = detail_page(variables["detail_extension_slug"])
     assert variables["detail_extension_name"] in addon.name
     assert addon.addon_icon.is_displayed()
     assert addon.authors.is_displayed()
@@ -47,10 +45,9 @@ def test_detail_author_links(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_addon_detail_recommended_badge(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url)
+@pytest.mark.changes_page
+def test_addon_detail_recommended_badge(detail_page, selenium, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     assert addon.promoted_badge.is_displayed()
     assert "Recommended" in addon.promoted_badge_category
     # checks that the badge redirects to the correct sumo article
@@ -59,10 +56,9 @@ def test_addon_detail_recommended_badge(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_addon_detail_by_firefox_badge(selenium, base_url, variables):
-    extension = variables["by_firefox_addon"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url)
+@pytest.mark.changes_page
+def test_addon_detail_by_firefox_badge(detail_page, selenium, variables):
+    addon = detail_page(variables["by_firefox_addon"])
     assert addon.promoted_badge.is_displayed()
     assert "By Firefox" in addon.promoted_badge_category
     # checks that the badge redirects to the correct sumo article
@@ -71,10 +67,9 @@ def test_addon_detail_by_firefox_badge(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_non_promoted_addon(selenium, base_url, variables):
-    extension = variables["experimental_addon"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url)
+@pytest.mark.changes_page
+def test_non_promoted_addon(detail_page, selenium, variables):
+    addon = detail_page(variables["experimental_addon"])
     # check that the Promoted badge is not displayed
     with pytest.raises(NoSuchElementException):
         selenium.find_element(By.CLASS_NAME, "PromotedBadge-large")
@@ -86,10 +81,8 @@ def test_non_promoted_addon(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_experimental_addon(selenium, base_url, variables):
-    extension = variables["experimental_addon"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url)
+def test_experimental_addon(detail_page, variables):
+    addon = detail_page(variables["experimental_addon"])
     assert addon.experimental_badge.is_displayed()
 
 
@@ -112,11 +105,9 @@ def test_invisible_addon(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_access_addon_by_guid(selenium, base_url, variables):
+def test_access_addon_by_guid(detail_page, selenium, variables):
     """Access an addon detail page by its guid"""
-    extension = variables["addon_detail_guid"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+    addon = detail_page(variables["addon_detail_guid"])
     # making sure that the page doesn't return a 404
     response = requests.get(selenium.current_url)
     assert (
@@ -126,11 +117,9 @@ def test_access_addon_by_guid(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_access_addon_by_id(selenium, base_url, variables):
+def test_access_addon_by_id(detail_page, selenium, variables):
     """Access an addon detail page by its internal AMO id"""
-    extension = variables["addon_detail_id"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+    addon = detail_page(variables["addon_detail_id"])
     # making sure that the page doesn't return a 404
     response = requests.get(selenium.current_url)
     assert (
@@ -140,11 +129,9 @@ def test_access_addon_by_id(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_access_addon_by_unicode_slug(selenium, base_url, variables):
+def test_access_addon_by_unicode_slug(detail_page, selenium, variables):
     """Access an addon detail page with a unicode slug"""
-    extension = variables["addon_unicode_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+    addon = detail_page(variables["addon_unicode_slug"])
     # making sure that the page doesn't return a 404
     response = requests.get(selenium.current_url)
     assert (
@@ -154,10 +141,8 @@ def test_access_addon_by_unicode_slug(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_lower_firefox_incompatibility(selenium, base_url, variables):
-    extension = variables["lower_firefox_version"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url)
+def test_lower_firefox_incompatibility(detail_page, variables):
+    addon = detail_page(variables["lower_firefox_version"])
     assert (
         "This add-on is not compatible with your version of Firefox."
         in addon.incompatibility_message
@@ -166,10 +151,9 @@ def test_lower_firefox_incompatibility(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_higher_firefox_incompatibility(selenium, base_url, variables):
-    extension = variables["higher_firefox_version"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_higher_firefox_incompatibility(detail_page, variables):
+    addon = detail_page(variables["higher_firefox_version"])
     assert (
         "You need an updated version of Firefox for this extension"
         in addon.compatibility_banner.text
@@ -184,10 +168,8 @@ def test_higher_firefox_incompatibility(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_platform_incompatibility_tc_id_c4453(selenium, base_url, variables):
-    extension = variables["incompatible_platform"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url)
+def test_platform_incompatibility_tc_id_c4453(detail_page, variables):
+    addon = detail_page(variables["incompatible_platform"])
     assert (
         "This add-on is not available on your platform."
         in addon.incompatibility_message
@@ -196,10 +178,8 @@ def test_platform_incompatibility_tc_id_c4453(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_addon_with_stats_summary(selenium, base_url, variables):
-    extension = variables["addon_with_stats"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+def test_addon_with_stats_summary(detail_page, variables):
+    addon = detail_page(variables["addon_with_stats"])
     # checks that a summary of users, reviews and star ratings are present
     assert addon.stats.stats_users_count > 0
     assert addon.stats.stats_reviews_count > 0
@@ -207,10 +187,8 @@ def test_addon_with_stats_summary(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_addon_without_stats_summary(selenium, base_url, variables):
-    extension = variables["addon_without_stats"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+def test_addon_without_stats_summary(detail_page, variables):
+    addon = detail_page(variables["addon_without_stats"])
     assert "No Users" in addon.stats.no_user_stats
     assert "No Reviews" in addon.stats.no_reviews_stats
     assert "Not rated yet" in addon.stats.no_star_ratings
@@ -218,10 +196,9 @@ def test_addon_without_stats_summary(selenium, base_url, variables):
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
-def test_stats_reviews_summary_click(selenium, base_url, variables):
-    extension = variables["addon_with_stats"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_stats_reviews_summary_click(detail_page, variables):
+    addon = detail_page(variables["addon_with_stats"])
     stats_review_counts = addon.stats.stats_reviews_count
     # clicks on reviews stats link to open all reviews page
     reviews = addon.stats.stats_reviews_link()
@@ -231,10 +208,8 @@ def test_stats_reviews_summary_click(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_stats_rating_bars_summary(selenium, base_url, variables):
-    extension = variables["addon_with_stats"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+def test_stats_rating_bars_summary(detail_page, variables):
+    addon = detail_page(variables["addon_with_stats"])
     # checks that there are 5 rating bars displayed, grouped by
     # ratings scores from 1 to 5 and tha rating counts are also
     # present for each bar - i.e. 5 elements in each category
@@ -245,10 +220,9 @@ def test_stats_rating_bars_summary(selenium, base_url, variables):
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
-def test_click_stats_rating_bar(selenium, base_url, variables):
-    extension = variables["addon_with_stats"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_click_stats_rating_bar(detail_page, selenium, base_url, variables):
+    addon = detail_page(variables["addon_with_stats"])
     # clicks on the first rating bar, verifies that all reviews page opens and
     # is filtered by the correct rating score, which is 5 stars for the first bar
     addon.stats.rating_bars[0].click()
@@ -258,10 +232,9 @@ def test_click_stats_rating_bar(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_click_stats_bar_rating_counts(selenium, base_url, variables):
-    extension = variables["addon_with_stats"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_click_stats_bar_rating_counts(detail_page, selenium, base_url, variables):
+    addon = detail_page(variables["addon_with_stats"])
     # clicks on the second bar ratings count (number displayed on the right side of the bar)
     # verifies that all reviews page opens and is filtered by the correct rating score
     # which should be 4 stars in this case
@@ -272,10 +245,9 @@ def test_click_stats_bar_rating_counts(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_click_stats_grouped_ratings(selenium, base_url, variables):
-    extension = variables["addon_with_stats"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_click_stats_grouped_ratings(detail_page, selenium, base_url, variables):
+    addon = detail_page(variables["addon_with_stats"])
     # clicks on the grouped ratings number displayed left to a rating bar,
     # verifies that all reviews page opens and is filtered by the correct rating score
     addon.stats.bar_grouped_ratings[2].click()
@@ -285,23 +257,21 @@ def test_click_stats_grouped_ratings(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_stats_rating_counts_compare(selenium, base_url, variables):
-    extension = variables["addon_with_stats"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
-    # sums up the rating counts displayed next to each stats rating bar
-    bar_count = sum([int(el.text) for el in addon.stats.bar_rating_counts])
+def test_stats_rating_counts_compare(detail_page, variables, amo_oracle):
+    addon = detail_page(variables["addon_with_stats"])
+    # the rating counts displayed next to each stats rating bar, from 5 to 1 stars
+    bar_counts = [int(el.text.replace(",", "")) for el in addon.stats.bar_rating_counts]
+    assert bar_counts == list(amo_oracle.grouped_ratings(variables["addon_with_stats"]).values())
     # reads the total number of reviews displayed in stats summary
     stats_count = addon.stats.stats_reviews_count
-    assert bar_count == stats_count
+    assert sum(bar_counts) == stats_count
 
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
-def test_contribute_button_tc_id_c4402(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url)
+@pytest.mark.changes_page
+def test_contribute_button_tc_id_c4402(detail_page, selenium, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     assert "Support this developer" in addon.contribute.contribute_card_header
     assert (
         variables["contribute_card_summary"] in addon.contribute.contribute_card_content
@@ -315,10 +285,9 @@ def test_contribute_button_tc_id_c4402(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_extension_permissions_tc_id_c139966(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url)
+@pytest.mark.changes_page
+def test_extension_permissions_tc_id_c139966(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     assert "Permissions" in addon.permissions.permissions_card_header
     permissions = addon.permissions.permissions_list
     # checks that each permission has a corresponding icon and description
@@ -332,10 +301,8 @@ def test_extension_permissions_tc_id_c139966(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_more_info_card_header(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+def test_more_info_card_header(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     assert "More information" in addon.more_info.more_info_card_header
 
 
@@ -344,10 +311,9 @@ def test_more_info_card_header(selenium, base_url, variables):
     "count, link", enumerate(["Homepage", "Support site", "Support Email"])
 )
 @pytest.mark.nondestructive
-def test_more_info_support_links(selenium, base_url, variables, count, link):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_more_info_support_links(detail_page, variables, count, link):
+    addon = detail_page(variables["detail_extension_slug"])
     assert link in addon.more_info.addon_support_links[count].text
     # excluding 'Support Email' since it doesn't open a new page when
     # clicked; this is a mailto link which is not handled by the browser
@@ -359,43 +325,36 @@ def test_more_info_support_links(selenium, base_url, variables, count, link):
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
-def test_more_info_version_number(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+def test_more_info_version_number(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     assert addon.more_info.addon_version_number.is_displayed()
 
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
-def test_more_info_addon_size(selenium, base_url, variables):
-    extension = variables["addon_size_extension"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+def test_more_info_addon_size(detail_page, variables, amo_oracle):
+    addon = detail_page(variables["addon_size_extension"])
     assert addon.more_info.addon_size.is_displayed()
     more_info_size = addon.more_info.addon_size.text
-    # get the file URL and read its size
-    file = urllib.request.urlopen(addon.addon_xpi)
-    # convert the size returned by the file.length from bytes to the unit displayed on AMO
-    size = reusables.convert_bytes(file.length)
+    # get the size of the current version file from the API
+    file = amo_oracle.current_version(variables["addon_size_extension"])["file"]
+    # convert the file size from bytes to the unit displayed on AMO
+    size = reusables.convert_bytes(file["size"])
     assert size == more_info_size
 
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
-def test_more_info_addon_last_update(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+def test_more_info_addon_last_update(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     assert addon.more_info.addon_last_update_date.is_displayed()
 
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
-def test_more_info_related_categories(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_more_info_related_categories(detail_page, selenium, base_url, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     # get the name of one of the categories related to this addon
     category_name = addon.more_info.addon_categories[0].text
     addon.more_info.addon_categories[0].click()
@@ -415,10 +374,9 @@ def test_more_info_related_categories(selenium, base_url, variables):
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
-def test_more_info_external_license(selenium, base_url, variables):
-    extension = variables["addon_with_stats"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_more_info_external_license(detail_page, selenium, variables):
+    addon = detail_page(variables["addon_with_stats"])
     addon.more_info.click_addon_external_license()
     # checks that redirection to an external page happens
     assert variables["base_url"] not in selenium.current_url
@@ -511,10 +469,9 @@ def test_more_info_reserved_license_is_not_linkified(selenium, base_url):
 
 
 @pytest.mark.nondestructive
-def test_more_info_custom_license(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_more_info_custom_license(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     addon_name = addon.name
     # checks that the AMO custom license page opens and has the correct content
     custom_license = addon.more_info.click_addon_custom_license()
@@ -527,10 +484,9 @@ def test_more_info_custom_license(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_more_info_privacy_policy(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_more_info_privacy_policy(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     addon_name = addon.name
     privacy = addon.more_info.click_addon_privacy_policy()
     # checks that the AMO privacy policy page opens and has the correct content
@@ -542,20 +498,17 @@ def test_more_info_privacy_policy(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_more_info_privacy_policy_missing(selenium, base_url, variables):
-    extension = variables["addon_without_stats"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    Detail(selenium, base_url).wait_for_page_to_load()
+def test_more_info_privacy_policy_missing(detail_page, selenium, variables):
+    detail_page(variables["addon_without_stats"])
     with pytest.raises(NoSuchElementException):
         selenium.find_element(By.CLASS_NAME, "AddonMoreInfo-privacy-policy-link")
     print("The add-on does not have a Privacy Policy")
 
 
 @pytest.mark.nondestructive
-def test_more_info_eula(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_more_info_eula(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     addon_name = addon.name
     eula = addon.more_info.addon_eula()
     # checks that the AMO eula page opens and has the correct content
@@ -568,35 +521,28 @@ def test_more_info_eula(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_more_info_eula_missing(selenium, base_url, variables):
-    extension = variables["addon_without_stats"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    Detail(selenium, base_url).wait_for_page_to_load()
+def test_more_info_eula_missing(detail_page, selenium, variables):
+    detail_page(variables["addon_without_stats"])
     with pytest.raises(NoSuchElementException):
         selenium.find_element(By.CLASS_NAME, "AddonMoreInfo-eula")
     print("The add-on does not have an End User License Agreement")
 
 
 @pytest.mark.nondestructive
-def test_compare_more_info_latest_version(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
-    addon_name = addon.name
-    more_info_version = addon.more_info.addon_version_number.text
-    all_versions = addon.more_info.addon_versions()
-    assert addon_name in all_versions.versions_page_header.text
+def test_compare_more_info_latest_version(detail_page, variables, amo_oracle):
+    addon = detail_page(variables["detail_extension_slug"])
+    slug = variables["detail_extension_slug"]
+    assert addon.name == amo_oracle.addon_name(slug)
     # verifies that the version number displayed in the more info card
-    # matches the latest version number present in all versions page
-    latest_version = all_versions.latest_version_number
-    assert more_info_version == latest_version
+    # matches the latest version number returned by the API
+    more_info_version = addon.more_info.addon_version_number.text
+    assert more_info_version == amo_oracle.current_version(slug)["version"]
 
 
 @pytest.mark.nondestructive
-def test_more_info_addon_tags(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_more_info_addon_tags(detail_page, selenium, base_url, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     # get the name of one of the tags related to this addon
     tag_name = addon.more_info.addon_tags[0].text
     addon.more_info.addon_tags[0].click()
@@ -624,10 +570,9 @@ def test_more_info_addon_tags(selenium, base_url, variables):
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
-def test_screenshot_viewer(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_screenshot_viewer(detail_page, selenium, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     assert "Screenshots" in addon.screenshots.screenshot_section_header.text
     # clicks through each screenshot and verifies that the screenshot full size viewer is opened
     # also check that the image preview sources are actually retrieved from the server (no broken previews)
@@ -646,10 +591,9 @@ def test_screenshot_viewer(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_screenshot_ui_navigation(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_screenshot_ui_navigation(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     addon.screenshots.screenshot_preview[0].click()
     time.sleep(1)
     # click on the right arrow to navigate to the next image
@@ -661,10 +605,9 @@ def test_screenshot_ui_navigation(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_screenshot_keyboard_navigation_tc_id_c4535(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_screenshot_keyboard_navigation_tc_id_c4535(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     addon.screenshots.screenshot_preview[0].click()
     time.sleep(1)
     # send the right key to navigate to the next image
@@ -678,20 +621,16 @@ def test_screenshot_keyboard_navigation_tc_id_c4535(selenium, base_url, variable
 
 
 @pytest.mark.nondestructive
-def test_add_to_collection_card(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+def test_add_to_collection_card(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     # verifies that the Add to Collection card is present on the detail page
     assert "Add to collection" in addon.add_to_collection.collections_card_header
     assert addon.add_to_collection.collections_select_field.is_displayed()
 
 
 @pytest.mark.nondestructive
-def test_release_notes(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+def test_release_notes(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     assert (
         f"Release notes for {addon.more_info.addon_version_number.text}"
         in addon.release_notes.release_notes_header
@@ -700,10 +639,8 @@ def test_release_notes(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_more_addons_by_author_card(selenium, base_url, variables):
-    extension = variables["experimental_addon"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+def test_more_addons_by_author_card(detail_page, variables):
+    addon = detail_page(variables["experimental_addon"])
     # verifies that the author name from the add-on summary card
     # is also present in the add-ons by same author card
     assert (
@@ -716,10 +653,9 @@ def test_more_addons_by_author_card(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_click_addon_in_more_addons_by_author(selenium, base_url, variables):
-    extension = variables["experimental_addon"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_click_addon_in_more_addons_by_author(detail_page, variables):
+    addon = detail_page(variables["experimental_addon"])
     result_name = addon.same_author_addons.addons_by_author_results_items[0].text
     # clicks on an addon present in the card and checks that the addon detail page is loaded
     addon.same_author_addons.addons_by_author_results_items[0].click()
@@ -729,29 +665,23 @@ def test_click_addon_in_more_addons_by_author(selenium, base_url, variables):
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
-def test_addon_description(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+def test_addon_description(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     assert "About this extension" in addon.description.addon_description_header
     assert addon.description.addon_description_text.is_displayed()
 
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
-def test_developer_comments(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+def test_developer_comments(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     assert "Developer comments" in addon.developer_comments.header.text
     assert addon.developer_comments.content.is_displayed()
 
 
 @pytest.mark.nondestructive
-def test_addon_ratings_card(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+def test_addon_ratings_card(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     assert "Rate your experience" in addon.ratings.ratings_card_header
     assert variables["ratings_card_summary"] in addon.ratings.ratings_card_summary
     # checks that the login button is present in the ratings card
@@ -764,10 +694,8 @@ def test_addon_ratings_card(selenium, base_url, variables):
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
-def test_addon_recommendations(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+def test_addon_recommendations(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     recommendations = addon.recommendations.addons_recommendations_results_list
     # verifies that the recommendations card shows up to 4 recommendations if available
     assert len(recommendations) <= 4
@@ -775,10 +703,9 @@ def test_addon_recommendations(selenium, base_url, variables):
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
-def test_click_addon_recommendations(selenium, base_url, variables):
-    extension = variables["detail_extension_slug"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_click_addon_recommendations(detail_page, variables):
+    addon = detail_page(variables["detail_extension_slug"])
     recommendation_name = addon.recommendations.recommendations_results_item[0].text
     # clicks on a recommendations and checks that the addon detail page is loaded
     addon.recommendations.recommendations_results_item[0].click()
@@ -788,10 +715,8 @@ def test_click_addon_recommendations(selenium, base_url, variables):
 
 @pytest.mark.sanity
 @pytest.mark.nondestructive
-def test_theme_detail_page_tc_id_c95590(selenium, base_url, variables):
-    extension = variables["theme_detail_page"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+def test_theme_detail_page_tc_id_c95590(detail_page, variables):
+    addon = detail_page(variables["theme_detail_page"])
     assert addon.themes.theme_preview.is_displayed()
     # checks that we display More themes from the same artist and that
     # each additional theme has its own preview from a total of 6
@@ -806,10 +731,9 @@ def test_theme_detail_page_tc_id_c95590(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_current_theme_not_in_more_by_artist_previews(selenium, base_url, variables):
-    extension = variables["theme_detail_page"]
-    selenium.get(f"{base_url}/addon/{extension}")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
+@pytest.mark.changes_page
+def test_current_theme_not_in_more_by_artist_previews(detail_page, variables):
+    addon = detail_page(variables["theme_detail_page"])
     # makes a record of the preview image source displayed first in the more themes by artist
     # card, clicks on the preview and verifies that the theme is no longer present in
     # the preview list since it is the currently opened theme detail page
@@ -833,121 +757,34 @@ def test_current_theme_not_in_more_by_artist_previews(selenium, base_url, variab
 #     addon.wait_for_current_url("https://extensionworkshop.allizom.org/")
 
 
-def test_addon_description_outgoing_urls(selenium, base_url):
-    """Checks that external URLs in description are redirected through the outgoing domain"""
+def test_addon_outgoing_urls(selenium, base_url, link_checker):
+    """Checks that the external URLs set by the developer are redirected through the outgoing
+    domain and that the redirects lead to the expected page"""
     selenium.get(f"{base_url}/addon/outgoing-urls/")
     addon = Detail(selenium, base_url).wait_for_page_to_load()
-    outgoing_description = addon.description.addon_description_text.find_element(
-        By.CSS_SELECTOR, "a"
-    )
-    assert (
-        "https://stage.outgoing.nonprod.webservices.mozgcp.net"
-        in outgoing_description.get_attribute("href")
-    )
-    outgoing_description.click()
-    addon.wait_for_current_url("https://extensionworkshop.allizom.org/")
-
-
-def test_addon_developer_comments_outgoing_urls(selenium, base_url):
-    """Checks that external URLs in developer comments are redirected through the outgoing domain"""
+    links = addon.outgoing_link_urls
+    # the custom license and privacy policy are shown on pages of their own
+    links["custom license"] = addon.more_info.click_addon_custom_license().link_urls
     selenium.get(f"{base_url}/addon/outgoing-urls/")
     addon = Detail(selenium, base_url).wait_for_page_to_load()
-    outgoing_dev_comments = addon.developer_comments.content.find_element(
-        By.CSS_SELECTOR, "a"
-    )
-    assert (
-        "https://stage.outgoing.nonprod.webservices.mozgcp.net"
-        in outgoing_dev_comments.get_attribute("href")
-    )
-    outgoing_dev_comments.click()
-    addon.wait_for_current_url("https://extensionworkshop.allizom.org/")
-
-
-def test_addon_more_info_homepage_outgoing_urls(selenium, base_url):
-    """Checks that external URLs in homepage are redirected through the outgoing domain"""
-    selenium.get(f"{base_url}/addon/outgoing-urls/")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
-    outgoing_homepage = addon.more_info.addon_homepage_link
-    assert (
-        "https://stage.outgoing.nonprod.webservices.mozgcp.net"
-        in outgoing_homepage.get_attribute("href")
-    )
-    outgoing_homepage.click()
-    addon.wait_for_current_url("https://extensionworkshop.allizom.org/")
-
-
-def test_addon_more_info_support_site_outgoing_urls(selenium, base_url):
-    """Checks that external URLs in support site are redirected through the outgoing domain"""
-    selenium.get(f"{base_url}/addon/outgoing-urls/")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
-    outgoing_support_site = addon.more_info.addon_support_site_link
-    assert (
-        "https://stage.outgoing.nonprod.webservices.mozgcp.net"
-        in outgoing_support_site.get_attribute("href")
-    )
-    outgoing_support_site.click()
-    addon.wait_for_current_url("https://extensionworkshop.allizom.org/")
-
-
-def test_addon_custom_license_outgoing_urls(selenium, base_url):
-    """Checks that external URLs in custom license are redirected through the outgoing domain"""
-    selenium.get(f"{base_url}/addon/outgoing-urls/")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
-    custom_license = addon.more_info.click_addon_custom_license()
-    outgoing_custom_license = (
-        custom_license.custom_licence_and_privacy_text.find_element(
-            By.CSS_SELECTOR, "a"
-        )
-    )
-    assert (
-        "https://stage.outgoing.nonprod.webservices.mozgcp.net"
-        in outgoing_custom_license.get_attribute("href")
-    )
-    outgoing_custom_license.click()
-    addon.wait_for_current_url("https://extensionworkshop.allizom.org/")
-
-
-def test_addon_privacy_policy_outgoing_urls(selenium, base_url):
-    """Checks that external URLs in privacy policy are redirected through the outgoing domain"""
-    selenium.get(f"{base_url}/addon/outgoing-urls/")
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
-    privacy_policy = addon.more_info.click_addon_privacy_policy()
-    outgoing_privacy_policy = (
-        privacy_policy.custom_licence_and_privacy_text.find_element(
-            By.CSS_SELECTOR, "a"
-        )
-    )
-    assert (
-        "https://stage.outgoing.nonprod.webservices.mozgcp.net"
-        in outgoing_privacy_policy.get_attribute("href")
-    )
-    outgoing_privacy_policy.click()
-    addon.wait_for_current_url("https://extensionworkshop.allizom.org/")
-
-
-def test_addon_version_notes_outgoing_urls(selenium, base_url):
-    """Checks that external URLs in release notes are redirected through the outgoing domain"""
-    selenium.get(f"{base_url}/addon/outgoing-urls/")
-    # check release notes in addon detail page
-    addon = Detail(selenium, base_url).wait_for_page_to_load()
-    release_notes_outgoing = addon.release_notes.release_notes_text.find_element(
-        By.CSS_SELECTOR, "a"
-    )
-    assert (
-        "https://stage.outgoing.nonprod.webservices.mozgcp.net"
-        in release_notes_outgoing.get_attribute("href")
-    )
-    release_notes_outgoing.click()
-    addon.wait_for_current_url("https://extensionworkshop.allizom.org/")
-    # check release notes in addon versions page
+    links["privacy policy"] = addon.more_info.click_addon_privacy_policy().link_urls
     selenium.get(f"{base_url}/addon/outgoing-urls/versions/")
-    version = Versions(selenium, base_url).wait_for_page_to_load()
-    version_notes_outgoing = version.versions_list[
-        0
-    ].version_release_notes.find_element(By.CSS_SELECTOR, "a")
-    assert (
-        "https://stage.outgoing.nonprod.webservices.mozgcp.net"
-        in version_notes_outgoing.get_attribute("href")
-    )
-    version_notes_outgoing.click()
-    addon.wait_for_current_url("https://extensionworkshop.allizom.org/")
+    links["version notes"] = Versions(
+        selenium, base_url
+    ).wait_for_page_to_load().release_notes_link_urls
+    # all the redirects are followed at once, in parallel
+    results = link_checker.check(url for urls in links.values() for url in urls)
+    for section, urls in links.items():
+        assert urls, f"No links were found in the {section}"
+        for url in urls:
+            assert url.startswith(
+                "https://stage.outgoing.nonprod.webservices.mozgcp.net"
+            ), f"The {section} link is not redirected through the outgoing domain: {url}"
+            target = outgoing_target(url) or ""
+            assert target.startswith(
+                "https://extensionworkshop.allizom.org/"
+            ), f"The {section} link leads to an unexpected page: {url}"
+            result = results[url]
+            assert result.ok and result.final_url.startswith(
+                target
+            ), f"The {section} link was not redirected to {target}: {result}"
@@ -23,12 +23,12 @@ def test_blog_homepage_header_logo_button(base_url, selenium):
 @pytest.mark.nondesstructive
 def test_articles_elements_are_displayed(base_url, selenium):
     page = BlogHomepage(selenium, base_url).open().wait_for_page_to_load()
-    for article in page.articles:
-        assert article.image.is_displayed()
-        assert article.title.is_displayed()
-        assert article.date.is_displayed()
-        assert article.intro_text.is_displayed()
-        assert article.read_more_link.is_displayed()
+    for article in page.articles_data:
+        assert article.image_displayed
+        assert article.title_displayed
+        assert article.date_displayed
+        assert article.intro_text_displayed
+        assert article.read_more_link_displayed
 
 
 @pytest.mark.sanity
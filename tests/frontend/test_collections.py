@@ -79,9 +79,9 @@ def test_my_collections_page_items_tc_id_c4478(selenium, base_url, variables):
     assert variables["collections_card_summary"] in collections.collections_card_summary
     assert "Create a collection" in collections.create_collection_button.text
     assert "My collections" in collections.collections_list_header
-    for collection in collections.list:
-        assert collection.name.is_displayed()
-        assert collection.number_of_addons.is_displayed()
+    for collection in collections.list_data:
+        assert collection.name_displayed
+        assert collection.addons_count_displayed
 
 
 @pytest.mark.serial
@@ -303,7 +303,7 @@ def test_add_to_collection_in_addon_detail_page_tc_id_c125541(selenium, base_url
     # make a note of the collection name to be used for this test
     collection_name = collections.list[0].name.text
     # make a note of the collections present in My Collections page
-    my_collections_list = [el.name.text for el in collections.list]
+    my_collections_list = [el.name for el in collections.list_data]
     extension = variables["non_recommended_addon"]
     # open an addon detail page
     selenium.get(f"{base_url}/addon/{extension}")
@@ -8,6 +8,9 @@ from pages.desktop.about_addons import AboutAddons
 from pages.desktop.frontend.details import Detail
 from pages.desktop.frontend.versions import Versions
 
+# add-on installs change the browser profile, so these tests always need a new browser
+pytestmark = pytest.mark.fresh_browser
+
 def test_install_uninstall_extension_tc_id_c393003(
     selenium, base_url, firefox, firefox_notifications, wait
 ):
@@ -213,7 +213,7 @@ def test_blank_search_loads_results_tc_id_c97496(base_url, selenium):
         assert result.promoted_badge
     sort = "users"
     results = [
-        getattr(result, sort) for result in search_page.result_list.search_results
+        getattr(result, sort) for result in search_page.result_list.search_results_data
     ]
     assert sorted(results, reverse=True) == results
 
@@ -252,7 +252,7 @@ def test_filter_by_users_tc_id_c92462(base_url, selenium):
     selenium.get(f"{base_url}/search/?&q={term}&sort={sort}")
     search_page = Search(selenium, base_url).wait_for_page_to_load()
     results = [
-        getattr(result, sort) for result in search_page.result_list.search_results
+        getattr(result, sort) for result in search_page.result_list.search_results_data
     ]
     assert sorted(results, reverse=True) == results
 
@@ -270,7 +270,7 @@ def test_filter_by_rating_and_hotness_tc_id_c92462(base_url, selenium, category,
     search_page = Search(selenium, base_url).wait_for_page_to_load()
     results = search_page.result_list.search_results
     if sort_attr == "rating":
-        for result in search_page.result_list.search_results:
+        for result in search_page.result_list.search_results_data:
             assert result.rating > 4
     else:
         assert len(results) == 25
@@ -301,10 +301,10 @@ def test_top_rated_recommended_addons_tc_id_c92462(base_url, selenium, variables
     page.search.search_field.clear()
     page.search.search_for("")
     # verify if sort filter applied correctly
-    for result in search_page.result_list.search_results:
+    for result in search_page.result_list.search_results_data:
         assert getattr(result, "rating") > 2
     # verify badge type
-    results = search_page.result_list.search_results
+    results = search_page.result_list.search_results_data
     for result in results:
         assert "Recommended" in result.promoted_badge_label
 
@@ -320,12 +320,12 @@ def test_top_rated_recommended_extensions_tc_id_c92462(base_url, selenium, varia
     page.search.search_field.clear()
     page.search.search_for("")
     # verify if sort filter applied correctly
-    for result in search_page.result_list.search_results:
+    for result in search_page.result_list.search_results_data:
         assert getattr(result, "rating") >= 3
     # verify that no themes are displayed
     assert len(search_page.result_list.themes) == 0
     # verify badge type
-    results = search_page.result_list.search_results
+    results = search_page.result_list.search_results_data
     for result in results:
         assert "Recommended" in result.promoted_badge_label
 
@@ -341,14 +341,14 @@ def test_top_rated_recommended_themes_tc_id_c92462(base_url, selenium, variables
     page.search.search_field.clear()
     page.search.search_for("")
     # verify if sort filter applied correctly
-    for result in search_page.result_list.search_results:
+    for result in search_page.result_list.search_results_data:
         assert getattr(result, "rating") >= 4
     # verify that all elements are themes
     assert len(search_page.result_list.themes) == len(
         search_page.result_list.search_results
     )
     # verify badge type
-    results = search_page.result_list.search_results
+    results = search_page.result_list.search_results_data
     for result in results:
         assert "Recommended" in result.promoted_badge_label
 
@@ -364,11 +364,12 @@ def test_most_users_recommended_addons_tc_id_c92462(base_url, selenium, variable
     page.search.search_for(variables["search_term"])
     # verify if elements are correctly sorted
     results = [
-        getattr(result, "users") for result in search_page.result_list.search_results
+        getattr(result, "users")
+        for result in search_page.result_list.search_results_data
     ]
     assert sorted(results, reverse=True) == results
     # verify badge type
-    results = search_page.result_list.search_results
+    results = search_page.result_list.search_results_data
     for result in results:
         assert "Recommended" in result.promoted_badge_label
 
@@ -384,11 +385,12 @@ def test_most_users_by_firefox_addons_tc_id_c92462(base_url, selenium, variables
     page.search.search_for(variables["search_term"])
     # verify if elements are correctly sorted
     results = [
-        getattr(result, "users") for result in search_page.result_list.search_results
+        getattr(result, "users")
+        for result in search_page.result_list.search_results_data
     ]
     assert sorted(results, reverse=True) == results
     # verify badge type
-    results = search_page.result_list.search_results
+    results = search_page.result_list.search_results_data
     for result in results:
         assert "By Firefox" in result.promoted_badge_label
 
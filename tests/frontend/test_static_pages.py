@@ -10,23 +10,16 @@ from pages.desktop.frontend.static_pages import StaticPages
 @pytest.mark.xfail(
     reason="There is an issue with search on stage-#16610", strict=False
 )
-def test_about_firefox_addons_page_links(base_url, selenium, variables):
+def test_about_firefox_addons_page_links(base_url, selenium, variables, link_checker):
     Home(selenium, base_url).open().wait_for_page_to_load()
     selenium.get(f"{base_url}/about")
     page = StaticPages(selenium, base_url).wait_for_page_to_load()
-    for count in range(len(page.page_links)):
-        link = page.page_links[count]
-        # skip the link for sending an email
-        if "mailto" in link.get_attribute("href"):
-            continue
-        # get the link's domain
-        link_domain = link.get_attribute("href").split("/")[2].split(".")[0]
-        # click the link
-        link.click()
-        # verify if the opened page link contains the correct domain
-        page.wait_for_current_url(link_domain)
-        # go back to test the next link
-        selenium.get(f"{base_url}/about")
+    # the link for sending an email is left out by the link checker
+    results = link_checker.check(page.link_urls)
+    for url, result in results.items():
+        # verify that each link leads to a page of the domain it points to
+        link_domain = url.split("/")[2].split(".")[0]
+        assert result.ok and link_domain in result.final_url, f"Broken link: {result}"
 
 @pytest.mark.nondestructive
 def test_review_guidelines_page_loaded_correctly(base_url, selenium):
@@ -108,19 +101,13 @@ def test_review_guidelines_page_links(base_url, selenium, variables):
 
 
 @pytest.mark.nondestructive
-def test_blocked_addon_page_links(base_url, selenium, variables):
+def test_blocked_addon_page_links(base_url, selenium, variables, link_checker):
     selenium.get(variables["static_page_blocked_addon"])
     page = StaticPages(selenium, base_url)
-    for count in range(len(page.page_links)):
-        link = page.page_links[count]
-        # get the link's domain
-        link_domain = link.get_attribute("href").split("/")[2].split(".")[0]
-        # click the link
-        link.click()
-        # verify if the opened page link contains the correct domain
-        assert link_domain in selenium.current_url
-        # go back to test the next link
-        page.driver.back()
+    for url, result in link_checker.check(page.link_urls).items():
+        # verify that each link leads to a page of the domain it points to
+        link_domain = url.split("/")[2].split(".")[0]
+        assert link_domain in (result.final_url or ""), f"Broken link: {result}"
 
 
 @pytest.mark.nondestructive
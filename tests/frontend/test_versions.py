@@ -1,7 +1,6 @@
 from datetime import datetime
 
 import pytest
-import requests
 
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
@@ -21,14 +20,16 @@ def test_addon_name_in_header(selenium, base_url, variables):
 
 
 @pytest.mark.nondestructive
-def test_versions_counter(selenium, base_url, variables):
-    # this test verifies that the number of versions displayed
-    # in the header is the same as the number of elements in the version list
+def test_versions_counter(selenium, base_url, variables, amo_oracle):
+    # this test verifies that the number of versions displayed in the header
+    # is the number of versions of the add-on and of elements in the version list
     selenium.get(variables["addon_version_page_url"])
     page = Versions(selenium, base_url)
     text = page.versions_page_header.text
     text = text.split("-")[-1][1:]
     text = text.split("versions")[0][:-1]
+    addon = variables["addon_version_page_url"].rstrip("/").split("/")[-2]
+    assert int(text) == amo_oracle.version_count(addon)
     assert int(text) == len(page.versions_list)
 
 
@@ -54,11 +55,13 @@ def test_license_link(selenium, base_url, variables):
     page = Versions(selenium, base_url)
 
     for i in range(len(page.versions_list)):
-        if page.versions_list[i].license_link is not False:  # if link exists
+        # the cards are looked up again only after the page was reloaded
+        version = page.versions_list[i]
+        if version.license_link is not False:  # if link exists
             if (
-                page.versions_list[i].license_link.text == "Custom License"
+                version.license_link.text == "Custom License"
             ):  # if link exists and is 'Custom License'
-                page.versions_list[i].license_link.click()
+                version.license_link.click()
                 page.wait.until(
                     EC.visibility_of_element_located(
                         (By.CLASS_NAME, "AddonInfo-info-html")
@@ -66,42 +69,40 @@ def test_license_link(selenium, base_url, variables):
                 )
 
             else:  # if link exists and is not 'Custom License'
-                expected_link = page.versions_list[i].license_link.get_attribute("href")
+                expected_link = version.license_link.get_attribute("href")
                 if "http" or "https" in expected_link:
                     # full url example-> https://example.com/something/something
                     # turn into-> example.com/something/something
                     expected_link = expected_link.split("//")[1]
                     # turn into-> example.com
                 expected_link = expected_link.split("/")[0]
-                page.versions_list[i].license_link.click()
+                version.license_link.click()
                 assert expected_link in selenium.current_url
 
             # in both cases, we go back
             page.driver.back()
             page.driver.refresh()
         else:  # if link does not exist
-            assert "All Rights Reserved" in page.versions_list[i].license_text
+            assert "All Rights Reserved" in version.license_text
 
 
 @pytest.mark.nondestructive
-def test_current_version(selenium, base_url, variables):
-    addon_url = f'addon/{variables["addon_version_install"]}/'
+def test_current_version(selenium, base_url, variables, amo_oracle):
     # get info from api
-    response = requests.get(f"{base_url}/api/v5/addons/{addon_url}")
-    addon_version = response.json()["current_version"]["version"]
-    addon_size = reusables.convert_bytes(
-        response.json()["current_version"]["file"]["size"]
-    )
-    api_date = response.json()["current_version"]["file"]["created"][:10]
+    current_version = amo_oracle.current_version(variables["addon_version_install"])
+    addon_version = current_version["version"]
+    addon_size = reusables.convert_bytes(current_version["file"]["size"])
+    api_date = current_version["file"]["created"][:10]
     # process the date to have the same format as in frontend
     api_date = datetime.strptime(api_date, "%Y-%m-%d")
     api_processed_date = datetime.strftime(api_date, "%b %#d, %Y")
     # verify info displayed in page
     page = Versions(selenium, base_url)
     selenium.get(f'{base_url}/addon/{variables["addon_version_install"]}/versions/')
-    assert page.versions_list[0].version_number == addon_version
-    assert addon_size == page.versions_list[0].version_size
-    assert page.versions_list[0].released_date == api_processed_date
+    displayed_version = page.version_cards_data()[0]
+    assert displayed_version.number == addon_version
+    assert addon_size == displayed_version.size
+    assert displayed_version.released_date == api_processed_date
 
 
 @pytest.mark.nondestructive
@@ -0,0 +1,40 @@
+from selenium.webdriver.firefox.webdriver import WebDriver
+
+from pages.desktop.frontend.details import Detail
+
+
+class FakeElement:
+    def __init__(self, driver, locator):
+        self.driver = driver
+        self.text = locator
+
+    def find_element(self, by, value):
+        return self.driver.find_element(by, value)
+
+    def is_displayed(self):
+        return True
+
+
+class FakeDriver(WebDriver):
+    """A WebDriver that is never started; it only records the elements searched for"""
+
+    def __init__(self):
+        self.searched = []
+
+    def find_element(self, by, value):
+        self.searched.append(value)
+        return FakeElement(self, value)
+
+
+def test_detail_regions_keep_their_elements():
+    driver = FakeDriver()
+    page = Detail(driver, "https://addons.example.com")
+    page.stats.addon_user_stats
+    page.more_info.addon_size
+    searched = list(driver.searched)
+
+    page.stats.addon_user_stats
+    page.more_info.addon_size
+
+    assert page.stats is page.stats
+    assert driver.searched == searched
@@ -0,0 +1,57 @@
+from plugins.durations import LongestFirstScheduling
+
+pytest_plugins = ["pytester"]
+
+COLLECTION = [
+    "test_a.py::test_short",
+    "test_a.py::test_unknown",
+    "test_b.py::test_long",
+    "test_c.py::test_grouped_1@payments",
+    "test_c.py::test_grouped_2@payments",
+]
+ESTIMATES = {
+    "test_a.py::test_short": 1.0,
+    "test_b.py::test_long": 20.0,
+    # the durations are saved without the group suffix
+    "test_c.py::test_grouped_1": 8.0,
+    "test_c.py::test_grouped_2": 8.0,
+}
+
+
+class FakeNode:
+    """A worker that only records the tests it is asked to run"""
+
+    def __init__(self):
+        self.gateway = type("Gateway", (), {"id": "gw0"})()
+        self.shutting_down = False
+        self.sent = []
+
+    def send_runtest_some(self, indices):
+        self.sent.extend(indices)
+
+    def shutdown(self):
+        pass
+
+
+def test_longest_work_units_are_assigned_first(pytester):
+    """LongestFirstScheduling overrides the private _assign_work_unit of xdist's
+    LoadScopeScheduling and reorders its OrderedDict workqueue; this breaks if
+    pytest-xdist (pinned in requirements.txt) changes how units are handed out"""
+    config = pytester.parseconfig("--tx", "popen", "--dist", "loadgroup")
+    scheduler = LongestFirstScheduling(config, estimates=ESTIMATES)
+    node = FakeNode()
+    scheduler.add_node(node)
+    scheduler.add_node_collection(node, COLLECTION)
+    scheduler.schedule()
+    # the other units are handed out as the worker completes its tests
+    while scheduler.workqueue:
+        scheduler.mark_test_complete(node, node.sent[-1])
+
+    assert [COLLECTION[index] for index in node.sent] == [
+        "test_b.py::test_long",
+        "test_c.py::test_grouped_1@payments",
+        "test_c.py::test_grouped_2@payments",
+        # the tests without history are expected to take the median of the others
+        "test_a.py::test_unknown",
+        "test_a.py::test_short",
+    ]
@@ -0,0 +1,78 @@
+import json
+import time
+
+from pathlib import Path
+
+from plugins.durations import DurationStore
+from plugins.quarantine import rerun_environment
+
+pytest_plugins = ["pytester"]
+
+ROOT = Path(__file__).parents[2]
+ENV = "https://addons-dev.allizom.org"
+
+# the repo configuration is used as it is, so the plugins are set up like in a real run
+CONFTEST = """
+from tests.conftest import pytest_addoption, pytest_configure
+"""
+
+# fails on its first run and passes on the next ones, like a flaky test
+FLAKY_TEST = """
+from pathlib import Path
+
+
+def test_flaky():
+    marker = Path(__file__).with_name("ran")
+    ran = marker.exists()
+    marker.touch()
+    assert ran
+"""
+
+
+def test_flaky_test_is_quarantined_with_variables_file(pytester, monkeypatch):
+    """The environment of the run is only set in the variables file, as in CI"""
+    store = DurationStore(pytester.path / "durations.db")
+    now = time.time()
+    store.save(
+        [
+            ("1", ENV, "test_flaky.py::test_flaky", outcome, 1.0, None, now - index)
+            for index, outcome in enumerate(["passed", "failed"])
+        ]
+    )
+    pytester.makeconftest(CONFTEST)
+    pytester.makepyfile(test_flaky=FLAKY_TEST)
+    pytester.path.joinpath("variables.json").write_text(json.dumps({"base_url": ENV}))
+    # the test run and its rerun are started in new processes, outside of the project
+    monkeypatch.setenv("PYTHONPATH", str(ROOT))
+
+    result = pytester.runpytest_subprocess(
+        "--variables", "variables.json", "--quarantine", "-p", "no:cacheprovider"
+    )
+
+    assert result.ret == 0
+    result.stdout.fnmatch_lines(
+        [
+            "test_flaky.py Q*",
+            "test_flaky.py::test_flaky: flaky, passed on rerun",
+            "*1 quarantined*",
+        ]
+    )
+    # only the attempt of the main run is saved, not the one of the rerun
+    assert [
+        outcome for _, outcome, _ in store.trend(ENV, "test_flaky.py::test_flaky")
+    ] == [
+        "failed",
+        "passed",
+        "failed",
+    ]
+
+
+def test_rerun_environment_drops_quarantine_from_addopts():
+    environ = rerun_environment(
+        {
+            "PYTEST_ADDOPTS": "--quarantine -n 4 --variables 'dev env.json'",
+            "HOME": "/home",
+        }
+    )
+
+    assert environ == {"PYTEST_ADDOPTS": "--variables 'dev env.json'", "HOME": "/home"}